@@ -0,0 +1,110 @@
+"""
+Measure compiling a DELETE whose WHERE clause ORs many keys of joined
+tables, and the share of it spent discovering the tables of the ``USING``
+clause, compared with the recursive discovery used before.
+
+Runs offline; no cluster is needed::
+
+    python benchmarks/delete_using.py --keys 1000 5000
+"""
+
+import argparse
+import time
+
+import sqlalchemy as sa
+from sqlalchemy.sql.expression import BinaryExpression, BooleanClauseList, Delete
+
+from sqlalchemy_redshift.dialect import (
+    RedshiftDialect_psycopg2,
+    gen_columns_from_children,
+)
+
+meta = sa.MetaData()
+customers = sa.Table(
+    "customers",
+    meta,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("region", sa.String(32)),
+)
+orders = sa.Table(
+    "orders",
+    meta,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("customer_id", sa.Integer),
+)
+
+
+def build_delete(keys):
+    return sa.delete(orders).where(
+        orders.c.customer_id == customers.c.id,
+        sa.or_(
+            *(
+                sa.and_(customers.c.id == i, customers.c.region == f"region-{i}")
+                for i in range(keys)
+            )
+        ),
+    )
+
+
+def recursive_columns(root):
+    # The discovery used before: recursive, and limited to binary
+    # expressions and clause lists.
+    if isinstance(root, (Delete, BinaryExpression, BooleanClauseList)):
+        for child in root.get_children():
+            yield from recursive_columns(child)
+    elif isinstance(root, sa.Column):
+        yield root
+
+
+def recursive_using(stmt, compiler):
+    delete_table = compiler.process(stmt.table, asfrom=True)
+    tables = []
+    for col in recursive_columns(stmt):
+        table = compiler.process(col.table, asfrom=True)
+        if table != delete_table and table not in tables:
+            tables.append(table)
+    return tables
+
+
+def iterative_using(stmt, compiler):
+    seen = {stmt.table}
+    tables = {}
+    for col in gen_columns_from_children(stmt.whereclause):
+        if col.table not in seen:
+            seen.add(col.table)
+            tables[compiler.process(col.table, asfrom=True)] = None
+    return list(tables)
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--keys", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    dialect = RedshiftDialect_psycopg2()
+    for keys in args.keys:
+        stmt = build_delete(keys)
+        compiler = dialect.statement_compiler(dialect, None)
+        assert recursive_using(stmt, compiler) == iterative_using(stmt, compiler)
+        for label, fn in [
+            ("compile", lambda: stmt.compile(dialect=dialect)),
+            ("USING, recursive", lambda: recursive_using(stmt, compiler)),
+            ("USING, iterative", lambda: iterative_using(stmt, compiler)),
+        ]:
+            print(
+                f"{keys:>6} keys  {label:<18} {best_of(args.repeat, fn) * 1000:9.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Measure executing-time expansion of large IN lists, with one bound
+parameter per value versus literal values past ``in_list_literal_threshold``.
+
+Runs offline; no cluster is needed::
+
+    python benchmarks/in_list.py --sizes 10000 100000
+"""
+
+import argparse
+import time
+
+import sqlalchemy as sa
+
+from sqlalchemy_redshift.dialect import (
+    RedshiftDialect_psycopg2,
+    RedshiftDialect_redshift_connector,
+)
+
+orders = sa.table(
+    "orders",
+    sa.column("id", sa.Integer),
+    sa.column("customer_id", sa.Integer),
+)
+statement = sa.select(orders.c.id).where(
+    orders.c.customer_id.in_(sa.bindparam("ids", expanding=True))
+)
+
+
+def expand(dialect, ids, repeat):
+    compiled = statement.compile(dialect=dialect)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        expanded = compiled._process_parameters_for_postcompile(
+            compiled.construct_params({"ids": ids})
+        )
+        timings.append(time.perf_counter() - start)
+    return min(timings), expanded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for dialect_cls in (RedshiftDialect_psycopg2, RedshiftDialect_redshift_connector):
+        for size in args.sizes:
+            ids = list(range(0, 3 * size, 3))
+            for label, threshold in [("bound", None), ("literal", 1000)]:
+                dialect = dialect_cls(in_list_literal_threshold=threshold)
+                best, expanded = expand(dialect, ids, args.repeat)
+                parameters = len(expanded.parameters)
+                print(
+                    f"{dialect_cls.__name__:<36} {size:>7} ids {label:<8} "
+                    f"{best * 1000:9.1f} ms {len(expanded.statement):>9} chars "
+                    f"{parameters:>7} parameters"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Measure the memory held by cached column reflection rows, stored as
+SQLAlchemy ``Row`` objects (as before) and as compact named tuples with
+interned names.
+
+Runs offline against an in-memory SQLite result shaped like the column
+reflection query; no cluster is needed::
+
+    python benchmarks/reflection_memory.py --columns 500000
+"""
+
+import argparse
+from collections import defaultdict
+import gc
+import tracemalloc
+
+import sqlalchemy as sa
+
+from sqlalchemy_redshift.dialect import RedshiftDialect_psycopg2, RelationKey
+
+COLUMNS_SQL = """
+WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i + 1 < :rows)
+SELECT
+    'schema_' || (i / :columns_per_schema) AS "schema",
+    'table_' || (i / :columns_per_table) AS "table_name",
+    'column_' || (i % :columns_per_table) AS "name",
+    'lzo' AS "encode",
+    'character varying(' || (i % 64 + 1) || ')' AS "type",
+    0 AS "distkey",
+    0 AS "sortkey",
+    0 AS "notnull",
+    NULL AS "comment",
+    NULL AS "adsrc",
+    i % :columns_per_table + 1 AS "attnum",
+    'character varying(' || (i % 64 + 1) || ')' AS "format_type",
+    NULL AS "default",
+    i / :columns_per_schema AS "schema_oid",
+    i / :columns_per_table AS "table_oid"
+FROM n
+"""
+
+
+def group_rows(rows):
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[RelationKey(row.table_name, row.schema)].append(row)
+    return dict(grouped)
+
+
+def measure(connection, params, compact):
+    dialect = RedshiftDialect_psycopg2()
+    gc.collect()
+    tracemalloc.start()
+    result = connection.execute(sa.text(COLUMNS_SQL), params)
+    rows = dialect._compact_catalog_rows(result) if compact else result
+    grouped = group_rows(rows)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del grouped
+    return retained, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--columns", type=int, default=500000)
+    parser.add_argument("--columns-per-table", type=int, default=25)
+    parser.add_argument("--columns-per-schema", type=int, default=50000)
+    args = parser.parse_args(argv)
+
+    params = {
+        "rows": args.columns,
+        "columns_per_table": args.columns_per_table,
+        "columns_per_schema": args.columns_per_schema,
+    }
+    engine = sa.create_engine("sqlite://")
+    with engine.connect() as connection:
+        for label, compact in [("Row objects", False), ("compact rows", True)]:
+            retained, peak = measure(connection, params, compact)
+            print(
+                f"{label:<15} retained {retained / 2**20:8.1f} MiB "
+                f"peak {peak / 2**20:8.1f} MiB "
+                f"({retained / args.columns:6.0f} bytes/column)"
+            )
+
+
+if __name__ == "__main__":
+    main()
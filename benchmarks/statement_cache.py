@@ -0,0 +1,83 @@
+"""
+Measure statement compilation with the compiled statement cache on and off.
+
+Runs offline; no cluster is needed::
+
+    python benchmarks/statement_cache.py --statements 20000
+"""
+
+import argparse
+import time
+
+import sqlalchemy as sa
+
+from sqlalchemy_redshift.dialect import (
+    RedshiftDialect_psycopg2,
+    RedshiftDialect_redshift_connector,
+)
+
+meta = sa.MetaData()
+customers = sa.Table(
+    "customers",
+    meta,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("name", sa.String(128)),
+    sa.Column("region", sa.String(32)),
+)
+orders = sa.Table(
+    "orders",
+    meta,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("customer_id", sa.Integer),
+    sa.Column("total", sa.Numeric(12, 4)),
+    sa.Column("created_at", sa.DateTime),
+)
+
+
+def build_statement(i):
+    return (
+        sa.select(
+            customers.c.name,
+            sa.func.count(orders.c.id),
+            sa.func.sum(orders.c.total),
+        )
+        .join(orders, orders.c.customer_id == customers.c.id)
+        .where(customers.c.region == f"region-{i % 10}")
+        .where(orders.c.created_at < sa.func.now())
+        .group_by(customers.c.name)
+        .order_by(customers.c.name)
+        .limit(100)
+        .offset(i % 1000)
+    )
+
+
+def compile_statements(dialect, statements, cache):
+    for i in range(statements):
+        build_statement(i)._compile_w_cache(
+            dialect,
+            compiled_cache=cache,
+            column_keys=[],
+            for_executemany=False,
+            schema_translate_map=None,
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--statements", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    for dialect_cls in (RedshiftDialect_psycopg2, RedshiftDialect_redshift_connector):
+        dialect = dialect_cls()
+        for label, cache in [("cache off", None), ("cache on", {})]:
+            start = time.perf_counter()
+            compile_statements(dialect, args.statements, cache)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{dialect_cls.__name__:<36} {label:<10} {elapsed:8.3f} s "
+                f"{elapsed / args.statements * 1e6:8.1f} us/statement"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure column type reflection with and without the format_type memo.
+
+Runs offline; no cluster is needed::
+
+    python benchmarks/type_reflection.py --columns 200000
+"""
+
+import argparse
+import time
+
+from sqlalchemy_redshift.dialect import RedshiftDialect_psycopg2
+
+FORMAT_TYPES = (
+    [f"character varying({length})" for length in range(1, 257)]
+    + [f"character({length})" for length in range(1, 33)]
+    + [f"numeric({precision},{scale})" for precision in (18, 38) for scale in (0, 2, 4)]
+    + [
+        "integer",
+        "bigint",
+        "smallint",
+        "boolean",
+        "date",
+        "double precision",
+        "real",
+        "timestamp without time zone",
+        "timestamp with time zone",
+        "time without time zone",
+        "time with time zone",
+        "geometry",
+        "super",
+        "hllsketch",
+    ]
+)
+
+
+def reflect_columns(dialect, columns):
+    for i in range(columns):
+        dialect._get_column_info(
+            name=f"column_{i}",
+            format_type=FORMAT_TYPES[i % len(FORMAT_TYPES)],
+            default=None,
+            notnull=False,
+            domains={},
+            enums=[],
+            schema="public",
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--columns", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    memoized = RedshiftDialect_psycopg2()
+    unmemoized = RedshiftDialect_psycopg2()
+    unmemoized.type_memo_size = 0
+    for label, dialect in [("without memo", unmemoized), ("with memo", memoized)]:
+        start = time.perf_counter()
+        reflect_columns(dialect, args.columns)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:<15} {elapsed:8.3f} s "
+            f"{elapsed / args.columns * 1e6:8.2f} us/column "
+            f"({len(FORMAT_TYPES)} distinct types)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Measure rendering a generated reporting UNLOAD for many unload locations,
+compiling an ``UnloadFromSelect`` each time versus rendering an
+``UnloadTemplate`` compiled once.
+
+Runs offline; no cluster is needed::
+
+    python benchmarks/unload_template.py --days 20
+"""
+
+import argparse
+import datetime
+import time
+
+import sqlalchemy as sa
+
+from sqlalchemy_redshift.dialect import (
+    RedshiftDialect_psycopg2,
+    UnloadFromSelect,
+    UnloadTemplate,
+)
+
+CREDENTIALS = dict(aws_account_id="000123456789", iam_role_name="redshift_role")
+
+meta = sa.MetaData()
+sales = sa.Table(
+    "sales",
+    meta,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("region", sa.String(32)),
+    sa.Column("product", sa.String(64)),
+    sa.Column("price", sa.Numeric(12, 4)),
+    sa.Column("saletime", sa.DateTime),
+)
+
+
+def build_select(day, products):
+    """
+    A reporting query with one aggregate per product, combined with
+    ``UNION ALL``, which compiles to about ``2 * products`` lines of SQL.
+    """
+    return sa.union_all(
+        *(
+            sa.select(
+                sales.c.region,
+                sa.literal(f"product-{i}").label("product"),
+                sa.func.sum(sales.c.price).label("revenue"),
+            )
+            .where(
+                sales.c.product == f"product-{i}",
+                sa.cast(sales.c.saletime, sa.Date) == day,
+            )
+            .group_by(sales.c.region)
+            for i in range(products)
+        )
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--days", type=int, default=20)
+    parser.add_argument("--products", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    dialect = RedshiftDialect_psycopg2()
+    first_day = datetime.date(2026, 1, 1)
+    days = [first_day + datetime.timedelta(days=i) for i in range(args.days)]
+
+    def location(day):
+        return f"s3://bucket/report/{day.isoformat()}/"
+
+    start = time.perf_counter()
+    compiled = [
+        str(
+            UnloadFromSelect(
+                build_select(day, args.products), location(day), **CREDENTIALS
+            ).compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        )
+        for day in days
+    ]
+    per_statement = time.perf_counter() - start
+
+    start = time.perf_counter()
+    template = UnloadTemplate(
+        build_select(sa.bindparam("day", type_=sa.Date), args.products),
+        dialect,
+        **CREDENTIALS,
+    )
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    rendered = [template.render(location(day), day=day) for day in days]
+    templated = time.perf_counter() - start
+
+    assert rendered == compiled
+    lines = template.render_select(day=first_day).count("\n") + 1
+    print(f"select of {lines} lines, {args.days} unload locations")
+    print(f"UnloadTemplate compiled once in {setup:.3f} s")
+    for label, elapsed in [
+        ("UnloadFromSelect per location", per_statement),
+        ("UnloadTemplate.render", templated),
+    ]:
+        print(
+            f"{label:<32} {elapsed:8.3f} s "
+            f"{elapsed / args.days * 1e3:10.3f} ms/statement"
+        )
+
+
+if __name__ == "__main__":
+    main()
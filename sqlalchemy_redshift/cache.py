@@ -0,0 +1,351 @@
+from collections import OrderedDict, namedtuple
+import functools
+import gzip
+import json
+import sys
+import threading
+import time
+
+_MISSING = object()
+
+SNAPSHOT_VERSION = 1
+
+
+def catalog_row_type(fields):
+    """
+    Return the named tuple type used to store catalog rows with `fields`.
+
+    Catalog rows are kept for the life of an inspector, or of an engine with
+    a :class:`ReflectionCache`, so they are stored as plain named tuples
+    rather than :class:`~sqlalchemy.engine.Row` objects.
+    """
+    return _catalog_row_type(tuple(fields))
+
+
+@functools.lru_cache(maxsize=None)
+def _catalog_row_type(fields):
+    return namedtuple("CatalogRow", fields, rename=True)
+
+
+def compact_rows(rows, fields, interned=()):
+    """
+    Yield `rows` as :func:`catalog_row_type` tuples of `fields`, interning
+    the string values of the `interned` fields.
+
+    Schema, table, column and type names repeat across the rows of a
+    catalog query; interning them stores each distinct name once.
+    """
+    row_type = catalog_row_type(fields)
+    positions = [i for i, field in enumerate(fields) if field in interned]
+    for row in rows:
+        values = list(row)
+        for i in positions:
+            value = values[i]
+            if value.__class__ is str:
+                values[i] = sys.intern(value)
+        yield row_type._make(values)
+
+
+class ReflectionCache:
+    """
+    A thread-safe, TTL-bounded LRU cache of reflected catalog data, shared
+    by every :class:`~sqlalchemy.engine.Inspector` created for an engine.
+
+    Enable it by passing ``reflection_cache_ttl`` (in seconds) and
+    optionally ``reflection_cache_size`` (the maximum number of entries) to
+    :func:`~sqlalchemy.create_engine`; the cache is then available as
+    ``engine.dialect.reflection_cache``.
+
+    Entries are keyed by ``(database, kind, schema, relation)`` where `kind`
+    names the catalog query the entry came from. A schema fetched as a whole
+    is also recorded under ``(database, kind, schema, None)``, listing the
+    relations it contained.
+
+    :meth:`refresh` reconciles the cached entries of a schema with a catalog
+    fingerprint, so that only relations that changed since the previous
+    refresh are fetched again, and :meth:`dump` and :meth:`load` persist the
+    entries of a database to a gzip-compressed JSON snapshot.
+
+    >>> cache = ReflectionCache(ttl=60, max_entries=2)
+    >>> cache.set(("dev", "_get_all_relation_info", "public", "a"), 1)
+    >>> cache.set(("dev", "_get_all_relation_info", "public", "b"), 2)
+    >>> cache.set(("dev", "_get_all_relation_info", "public", "c"), 3)
+    >>> cache.get(("dev", "_get_all_relation_info", "public", "a")) is None
+    True
+    >>> cache.invalidate(schema="public", table="b")
+    >>> len(cache)
+    1
+    """
+
+    def __init__(self, ttl, max_entries=10000, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._fingerprints = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Return the entry stored under `key`, or `default` if there is none
+        or it has expired.
+        """
+        with self._lock:
+            try:
+                expires, value = self._entries[key]
+            except KeyError:
+                return default
+            if expires <= self._clock():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Store `value` under `key`, evicting the least recently used entries
+        beyond ``max_entries``.
+        """
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, schema=None, table=None):
+        """
+        Drop the entries for `table` in `schema`, for all of `schema`, or
+        for every schema when neither is given.
+
+        Invalidating a table also forgets which relations its schema
+        contains, so that a dropped or newly created table is noticed. The
+        fingerprint of an invalidated schema, or the checksum of an
+        invalidated table, is dropped as well, so that the next
+        :meth:`refresh` treats it as unvalidated.
+        """
+        with self._lock:
+            if schema is None and table is None:
+                self._entries.clear()
+                self._fingerprints.clear()
+                return
+            for database, key_schema in list(self._fingerprints):
+                if schema is not None and key_schema != schema:
+                    continue
+                if table is None:
+                    del self._fingerprints[(database, key_schema)]
+                else:
+                    self._fingerprints[(database, key_schema)].pop(table, None)
+            for key in list(self._entries):
+                _, _, key_schema, relation = key
+                if schema is not None and key_schema != schema:
+                    continue
+                if table is not None and relation not in (table, None):
+                    continue
+                del self._entries[key]
+
+    def clear(self):
+        """Drop every entry."""
+        self.invalidate()
+
+    def get_relations(self, prefix, table_names):
+        """
+        Look up the `table_names` (or, when ``None``, all relations) of the
+        ``(database, kind, schema)`` `prefix`.
+
+        Return a ``({relation_key: entry}, missing)`` tuple, where `missing`
+        lists the requested relations that have to be fetched, or is
+        ``None`` when the schema has to be fetched as a whole.
+        """
+        with self._lock:
+            complete = self.get(prefix + (None,))
+            if table_names is None:
+                if complete is None:
+                    return {}, None
+                table_names = complete
+            relations = {}
+            missing = []
+            for name in table_names:
+                cached = self.get(prefix + (name,), _MISSING)
+                if cached is _MISSING:
+                    if complete is None or name in complete:
+                        missing.append(name)
+                elif cached is not None:
+                    key, entry = cached
+                    relations[key] = entry
+            return relations, tuple(sorted(missing))
+
+    def set_relations(self, prefix, table_names, relations):
+        """
+        Cache the ``{relation_key: entry}`` dictionary fetched for the
+        `table_names` (or, when ``None``, all relations) of the
+        ``(database, kind, schema)`` `prefix`.
+
+        Requested relations that were not found are cached as absent.
+        """
+        with self._lock:
+            names = set()
+            for key, entry in relations.items():
+                names.add(key.name)
+                self.set(prefix + (key.name,), (key, entry))
+            if table_names is None:
+                self.set(prefix + (None,), frozenset(names))
+            else:
+                for name in set(table_names) - names:
+                    self.set(prefix + (name,), None)
+
+    def refresh(self, database, schema, fingerprint, assume_current=False):
+        """
+        Reconcile the entries for `schema` in `database` with its current
+        catalog `fingerprint`, a ``{relation_name: checksum}`` dictionary.
+
+        Entries of relations that were created, changed or dropped since the
+        previous refresh are dropped, and the relations are added to (or
+        removed from) the schema-wide listings, so that only they are
+        fetched again. Entries of unchanged relations get a fresh TTL.
+
+        Return the names of the relations that were created, changed or
+        dropped, or ``None`` on the first refresh of the schema, in which
+        case all of its entries are dropped since they cannot be validated
+        (unless `assume_current` is true).
+        """
+        with self._lock:
+            previous = self._fingerprints.get((database, schema))
+            self._fingerprints[(database, schema)] = dict(fingerprint)
+            changed = None
+            if previous is None and assume_current:
+                previous = fingerprint
+            if previous is not None:
+                changed = {
+                    name
+                    for name in previous.keys() | fingerprint.keys()
+                    if previous.get(name) != fingerprint.get(name)
+                }
+                dropped = previous.keys() - fingerprint.keys()
+            expires = self._clock() + self.ttl
+            for key in list(self._entries):
+                key_database, _, key_schema, relation = key
+                if (key_database, key_schema) != (database, schema):
+                    continue
+                if changed is None or relation in changed:
+                    del self._entries[key]
+                    continue
+                value = self._entries[key][1]
+                if relation is None:
+                    value = frozenset((value | changed) - dropped)
+                self._entries[key] = (expires, value)
+            return changed
+
+    def fingerprinted_schemas(self, database):
+        """
+        Return the schemas of `database` that have a fingerprint from a
+        previous :meth:`refresh`.
+        """
+        with self._lock:
+            return [
+                schema
+                for key_database, schema in self._fingerprints
+                if key_database == database
+            ]
+
+    def dump(self, path, database, schemas=None):
+        """
+        Write the entries and fingerprints of `schemas` (by default, every
+        schema that has been refreshed) in `database` to the file `path`.
+
+        Only schemas with a fingerprint are written, since a snapshot can
+        not be validated without one.
+        """
+        with self._lock:
+            if schemas is None:
+                schemas = self.fingerprinted_schemas(database)
+            snapshot = {
+                "version": SNAPSHOT_VERSION,
+                "database": database,
+                "schemas": {},
+            }
+            for schema in schemas:
+                fingerprint = self._fingerprints.get((database, schema))
+                if fingerprint is None:
+                    continue
+                snapshot["schemas"][schema] = {
+                    "fingerprint": fingerprint,
+                    "entries": self._dump_entries(database, schema),
+                }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(snapshot, f, separators=(",", ":"), default=str)
+
+    def _dump_entries(self, database, schema):
+        entries = {}
+        now = self._clock()
+        for key, (expires, value) in self._entries.items():
+            key_database, kind, key_schema, relation = key
+            if (key_database, key_schema) != (database, schema) or expires <= now:
+                continue
+            dumped = entries.setdefault(
+                kind, {"fields": None, "complete": None, "relations": {}}
+            )
+            if relation is None:
+                dumped["complete"] = sorted(value)
+            elif value is None:
+                dumped["relations"][relation] = None
+            else:
+                relation_key, entry = value
+                rows = entry if isinstance(entry, list) else [entry]
+                if rows and dumped["fields"] is None:
+                    dumped["fields"] = list(rows[0]._fields)
+                dumped["relations"][relation] = [
+                    relation_key.schema,
+                    isinstance(entry, list),
+                    [list(row) for row in rows],
+                ]
+        return entries
+
+    def load(self, path, database):
+        """
+        Load the entries of `database` from the snapshot file `path` and
+        return the ``{schema: fingerprint}`` dictionary recorded in it.
+
+        The recorded fingerprints become the previous fingerprints of their
+        schemas, so a :meth:`refresh` with the current catalog fingerprint
+        drops whatever changed since the snapshot was written. A snapshot
+        written for another database, or in another format, loads nothing.
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        if (
+            snapshot.get("version") != SNAPSHOT_VERSION
+            or snapshot.get("database") != database
+        ):
+            return {}
+        fingerprints = {}
+        with self._lock:
+            for schema, dumped in snapshot["schemas"].items():
+                fingerprint = {
+                    name: tuple(checksum)
+                    for name, checksum in dumped["fingerprint"].items()
+                }
+                for kind, entries in dumped["entries"].items():
+                    prefix = (database, kind, schema)
+                    self._load_entries(prefix, entries)
+                self._fingerprints[(database, schema)] = fingerprint
+                fingerprints[schema] = fingerprint
+        return fingerprints
+
+    def _load_entries(self, prefix, entries):
+        from .dialect import RelationKey
+
+        fields = entries["fields"]
+        for relation, value in entries["relations"].items():
+            if value is None:
+                self.set(prefix + (relation,), None)
+                continue
+            relation_schema, many, rows = value
+            rows = list(compact_rows(rows, fields, fields))
+            entry = rows if many else rows[0]
+            key = RelationKey(relation, relation_schema)
+            self.set(prefix + (relation,), (key, entry))
+        if entries["complete"] is not None:
+            self.set(prefix + (None,), frozenset(entries["complete"]))
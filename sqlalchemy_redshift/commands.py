@@ -1,5 +1,6 @@
 from collections.abc import Iterable
 import enum
+import functools
 import numbers
 import re
 import warnings
@@ -8,6 +9,7 @@ import sqlalchemy as sa
 from sqlalchemy import exc as sa_exc
 from sqlalchemy.ext import compiler as sa_compiler
 from sqlalchemy.sql import expression as sa_expression
+from sqlalchemy.sql.visitors import InternalTraversal, replacement_traverse
 
 # At the time of this implementation, no specification for a session token was
 # found. After looking at a few session tokens they appear to be the same as
@@ -117,8 +119,51 @@ def _process_fixed_width(spec):
     return ",".join((f"{col}:{width:d}" for col, width in spec))
 
 
+def _bindparams(*binds):
+    """
+    Build the bound parameters of a command from ``(key, value, type)``
+    triples, skipping those that are ``None``. A callable value is only
+    called when the parameter is rendered.
+
+    Commands build their parameters once, when they are constructed, and
+    list them in their cache key, so that commands differing only in these
+    values share one compiled form.
+    """
+    return tuple(
+        (
+            sa.bindparam(key, callable_=value, type_=type_)
+            if callable(value)
+            else sa.bindparam(key, value=value, type_=type_)
+        )
+        for key, value, type_ in filter(None, binds)
+    )
+
+
+def _hashable(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
 class _ExecutableClause(sa_expression.Executable, sa_expression.ClauseElement):
-    pass
+    """
+    Base class of the command constructs.
+
+    As with other :class:`~sqlalchemy.sql.expression.Executable` constructs,
+    the attributes of a command must not be changed after construction: its
+    bound parameters are built from them in ``__init__`` and its cache key
+    may be memoized. Construct a new command instead.
+
+    The command classes set ``inherit_cache = True``; like any SQLAlchemy
+    construct, a subclass has to set it again to use the compiled statement
+    cache.
+    """
+
+    _bindparams = ()
 
 
 class AlterTableAppendCommand(_ExecutableClause):
@@ -149,6 +194,14 @@ class AlterTableAppendCommand(_ExecutableClause):
         exclusive with `ignore_extra`.
     """
 
+    inherit_cache = True
+    _traverse_internals = [
+        ("source", InternalTraversal.dp_clauseelement),
+        ("target", InternalTraversal.dp_clauseelement),
+        ("ignore_extra", InternalTraversal.dp_boolean),
+        ("fill_target", InternalTraversal.dp_boolean),
+    ]
+
     def __init__(self, source, target, ignore_extra=False, fill_target=False):
         if ignore_extra and fill_target:
             raise ValueError('"ignore_extra" cannot be used with "fill_target".')
@@ -257,6 +310,20 @@ class UnloadFromSelect(_ExecutableClause):
         Indicates the type of file to unload to.
     """
 
+    inherit_cache = True
+    _traverse_internals = [
+        ("manifest", InternalTraversal.dp_boolean),
+        ("header", InternalTraversal.dp_boolean),
+        ("format", InternalTraversal.dp_plain_obj),
+        ("encrypted", InternalTraversal.dp_boolean),
+        ("gzip", InternalTraversal.dp_boolean),
+        ("add_quotes", InternalTraversal.dp_boolean),
+        ("escape", InternalTraversal.dp_boolean),
+        ("allow_overwrite", InternalTraversal.dp_boolean),
+        ("parallel", InternalTraversal.dp_boolean),
+        ("_bindparams", InternalTraversal.dp_clauseelement_list),
+    ]
+
     def __init__(
         self,
         select,
@@ -317,6 +384,43 @@ class UnloadFromSelect(_ExecutableClause):
         self.parallel = parallel
         self.region = region
         self.max_file_size = max_file_size
+        self._bindparams = _bindparams(
+            ("credentials", self.credentials, sa.String),
+            ("unload_location", unload_location, sa.String),
+            ("delimiter", delimiter, sa.String) if delimiter is not None else None,
+            (
+                (
+                    "fixed_width",
+                    functools.partial(_process_fixed_width, fixed_width),
+                    sa.String,
+                )
+                if fixed_width
+                else None
+            ),
+            ("null_as", null, sa.String) if null is not None else None,
+            ("region", region, sa.String) if region is not None else None,
+            (
+                ("max_file_size", float(max_file_size) / 1024 / 1024, sa.Float)
+                if max_file_size is not None
+                else None
+            ),
+        )
+
+    def _gen_cache_key(self, anon_map, bindparams):
+        key = super()._gen_cache_key(anon_map, bindparams)
+        if key is None:
+            return None
+        # The select is rendered with its parameters as literals, so their
+        # values are part of the key instead of being extracted as bound
+        # values of the UNLOAD.
+        select_bindparams = []
+        select_key = self.select._gen_cache_key(anon_map, select_bindparams)
+        if select_key is None:
+            return None
+        return key + (
+            select_key,
+            tuple(_hashable(bind.effective_value) for bind in select_bindparams),
+        )
 
 
 @sa_compiler.compiles(UnloadFromSelect)
@@ -388,50 +492,10 @@ def visit_unload_from_select(element, compiler, **kw):
         ),
     )
 
-    query = sa.text(qs)
-
-    if el.delimiter is not None:
-        query = query.bindparams(
-            sa.bindparam(
-                "delimiter",
-                value=element.delimiter,
-                type_=sa.String,
-            )
-        )
-
-    if el.fixed_width:
-        query = query.bindparams(
-            sa.bindparam(
-                "fixed_width",
-                value=_process_fixed_width(el.fixed_width),
-                type_=sa.String,
-            )
-        )
-
-    if el.null is not None:
-        query = query.bindparams(
-            sa.bindparam("null_as", value=el.null, type_=sa.String)
-        )
-
-    if el.region is not None:
-        query = query.bindparams(
-            sa.bindparam("region", value=el.region, type_=sa.String)
-        )
-
-    if el.max_file_size is not None:
-        max_file_size_mib = float(el.max_file_size) / 1024 / 1024
-        query = query.bindparams(
-            sa.bindparam("max_file_size", value=max_file_size_mib, type_=sa.Float)
-        )
+    query = sa.text(qs).bindparams(*el._bindparams)
 
     return compiler.process(
         query.bindparams(
-            sa.bindparam("credentials", value=el.credentials, type_=sa.String),
-            sa.bindparam(
-                "unload_location",
-                value=el.unload_location,
-                type_=sa.String,
-            ),
             sa.bindparam(
                 "select",
                 value=compiler.process(
@@ -445,6 +509,176 @@ def visit_unload_from_select(element, compiler, **kw):
     )
 
 
+_TEMPLATE_TOKEN = "\x00{}\x00"
+_TEMPLATE_TOKEN_RE = re.compile("\x00([^\x00]+)\x00")
+_QUOTED_TEMPLATE_TOKEN_RE = re.compile("'(\x00[^\x00]+\x00)'")
+
+
+def _split_template(sql):
+    # Alternating literal SQL and token names, starting and ending with SQL.
+    return _TEMPLATE_TOKEN_RE.split(sql)
+
+
+def _quote_string(value):
+    # Redshift string literals treat a backslash as an escape character.
+    return "'%s'" % value.replace("\\", "\\\\").replace("'", "''")
+
+
+class UnloadTemplate:
+    """
+    An UNLOAD statement compiled once for a dialect and rendered for many
+    unload locations and parameter values by string substitution.
+
+    The parameters of the template are the bound parameters of `select`
+    that have no value, such as ``sa.bindparam('day')``; an expanding
+    parameter renders a parenthesized list of values. The select and the
+    UNLOAD options are compiled when the template is built, so rendering it
+    only formats the parameter values as literals and joins strings. The
+    rendered statement is meant to be sent as is, without parameters, so
+    ``%`` is never doubled.
+
+    Parameters
+    ----------
+    select: sqlalchemy.sql.selectable.Selectable
+        The selectable Core Table Expression query to unload from.
+    dialect: sqlalchemy.engine.interfaces.Dialect
+        The dialect to compile for, usually ``engine.dialect``.
+    **kwargs
+        The other options of :class:`UnloadFromSelect`, except
+        `unload_location`.
+
+    >>> import datetime
+    >>> import sqlalchemy as sa
+    >>> from sqlalchemy_redshift.dialect import Format, UnloadTemplate
+    >>> engine = sa.create_engine('redshift+psycopg2://example')
+    >>> sales = sa.table('sales', sa.column('saletime'), sa.column('price'))
+    >>> day = sa.bindparam('day', type_=sa.Date)
+    >>> template = UnloadTemplate(
+    ...     sa.select(sales).where(sa.cast(sales.c.saletime, sa.Date) == day),
+    ...     engine.dialect,
+    ...     aws_account_id='000123456789',
+    ...     iam_role_name='redshift_role',
+    ...     format=Format.parquet,
+    ... )
+    >>> template.parameters
+    ('day',)
+    >>> print(template.render(
+    ...     's3://bucket/sales/2026-10-17/', day=datetime.date(2026, 10, 17)
+    ... ).strip())  # doctest: +NORMALIZE_WHITESPACE
+    UNLOAD ('SELECT sales.saletime, sales.price
+    FROM sales
+    WHERE CAST(sales.saletime AS DATE) = ''2026-10-17''')
+    TO 's3://bucket/sales/2026-10-17/'
+    CREDENTIALS 'aws_iam_role=arn:aws:iam::000123456789:role/redshift_role'
+    FORMAT AS PARQUET
+    >>> with engine.begin() as conn:  # doctest: +SKIP
+    ...     template.execute(
+    ...         conn, 's3://bucket/sales/2026-10-17/',
+    ...         day=datetime.date(2026, 10, 17),
+    ...     )
+    """
+
+    def __init__(self, select, dialect, **kwargs):
+        binds = {}
+
+        def replace(element):
+            if isinstance(element, sa.BindParameter) and element.required:
+                binds.setdefault(element.key, element)
+                return sa.literal_column(
+                    _TEMPLATE_TOKEN.format(element.key), type_=element.type
+                )
+            return None
+
+        select = replacement_traverse(select, {}, replace)
+        self.dialect = dialect
+        self.parameters = tuple(binds)
+        self._binds = binds
+        # For the "format" paramstyles the compiler doubles every ``%``; the
+        # statement is sent without parameters, so they are undone.
+        self._double_percents = dialect.paramstyle in ("format", "pyformat")
+        self._select = select.compile(
+            dialect=dialect, compile_kwargs={"literal_binds": True}
+        )
+        self._select_parts = _split_template(
+            self._undouble_percents(self._select.string)
+        )
+
+        unload = UnloadFromSelect(
+            sa.literal_column(_TEMPLATE_TOKEN.format("select")),
+            _TEMPLATE_TOKEN.format("unload_location"),
+            **kwargs,
+        )
+        sql = self._undouble_percents(
+            unload.compile(
+                dialect=dialect, compile_kwargs={"literal_binds": True}
+            ).string
+        )
+        # The select and the location are quoted string literals in the
+        # UNLOAD; they are substituted along with their quotes.
+        self._parts = _split_template(_QUOTED_TEMPLATE_TOKEN_RE.sub(r"\1", sql))
+
+    def _undouble_percents(self, sql):
+        if self._double_percents:
+            return sql.replace("%%", "%")
+        return sql
+
+    def _render_literal(self, bind, value):
+        if value is None:
+            return "NULL"
+        return self._undouble_percents(
+            self._select.render_literal_value(value, bind.type)
+        )
+
+    def _render_value(self, key, value):
+        bind = self._binds[key]
+        if not bind.expanding:
+            return self._render_literal(bind, value)
+        if isinstance(value, (str, bytes)) or not isinstance(value, Iterable):
+            raise TypeError(f"Parameter {key!r} must be a sequence of values")
+        values = [self._render_literal(bind, item) for item in value]
+        if not values:
+            raise ValueError(f"Parameter {key!r} must not be empty")
+        return "(%s)" % ", ".join(values)
+
+    def render_select(self, **params):
+        """
+        Return the SQL of the select with `params` rendered as literals.
+        """
+        missing = set(self.parameters).difference(params)
+        if missing:
+            raise sa_exc.ArgumentError(
+                "Missing values for parameters: %s" % ", ".join(sorted(missing))
+            )
+        parts = self._select_parts[:]
+        for i in range(1, len(parts), 2):
+            parts[i] = self._render_value(parts[i], params[parts[i]])
+        return "".join(parts)
+
+    def render(self, unload_location, **params):
+        """
+        Return the UNLOAD statement for `unload_location`, with `params`
+        rendered into the select as literals.
+        """
+        values = {
+            "select": _quote_string(self.render_select(**params)),
+            "unload_location": _quote_string(unload_location),
+        }
+        parts = self._parts[:]
+        for i in range(1, len(parts), 2):
+            parts[i] = values[parts[i]]
+        return "".join(parts)
+
+    def execute(self, connection, unload_location, **params):
+        """
+        Run the UNLOAD statement for `unload_location` and `params` on
+        `connection`.
+        """
+        return connection.exec_driver_sql(
+            self.render(unload_location, **params),
+            execution_options={"no_parameters": True},
+        )
+
+
 class Format(enum.Enum):
     csv = "CSV"
     json = "JSON"
@@ -620,6 +854,32 @@ class CopyCommand(_ExecutableClause):
         cluster isn't in the same region as the S3 bucket.
     """
 
+    inherit_cache = True
+    _traverse_internals = [
+        ("table", InternalTraversal.dp_clauseelement),
+        ("columns", InternalTraversal.dp_clauseelement_list),
+        ("format", InternalTraversal.dp_plain_obj),
+        ("compression", InternalTraversal.dp_plain_obj),
+        ("manifest", InternalTraversal.dp_boolean),
+        ("accept_any_date", InternalTraversal.dp_boolean),
+        ("blanks_as_null", InternalTraversal.dp_boolean),
+        ("empty_as_null", InternalTraversal.dp_boolean),
+        ("encoding", InternalTraversal.dp_plain_obj),
+        ("escape", InternalTraversal.dp_boolean),
+        ("explicit_ids", InternalTraversal.dp_boolean),
+        ("fill_record", InternalTraversal.dp_boolean),
+        ("ignore_blank_lines", InternalTraversal.dp_boolean),
+        ("dangerous_null_delimiter", InternalTraversal.dp_string),
+        ("remove_quotes", InternalTraversal.dp_boolean),
+        ("roundec", InternalTraversal.dp_boolean),
+        ("trim_blanks", InternalTraversal.dp_boolean),
+        ("truncate_columns", InternalTraversal.dp_boolean),
+        ("comp_update", InternalTraversal.dp_plain_obj),
+        ("no_load", InternalTraversal.dp_boolean),
+        ("stat_update", InternalTraversal.dp_plain_obj),
+        ("_bindparams", InternalTraversal.dp_clauseelement_list),
+    ]
+
     def __init__(
         self,
         to,
@@ -728,6 +988,62 @@ class CopyCommand(_ExecutableClause):
         self.no_load = no_load
         self.stat_update = stat_update
         self.region = region
+        self._bindparams = _bindparams(
+            ("data_location", data_location, sa.String),
+            ("credentials", self.credentials, sa.String),
+            (
+                ("quote_character", quote, sa.String)
+                if self.format == Format.csv and quote is not None
+                else None
+            ),
+            (
+                ("json_option", path_file, sa.String)
+                if self.format == Format.json
+                else None
+            ),
+            (
+                ("avro_option", path_file, sa.String)
+                if self.format == Format.avro
+                else None
+            ),
+            (
+                ("delimiter_char", delimiter, sa.String)
+                if delimiter is not None
+                else None
+            ),
+            (
+                (
+                    "fixedwidth_spec",
+                    functools.partial(_process_fixed_width, fixed_width),
+                    sa.String,
+                )
+                if fixed_width is not None
+                else None
+            ),
+            (
+                ("replacement_char", accept_inv_chars, sa.String)
+                if accept_inv_chars is not None
+                else None
+            ),
+            (
+                ("dateformat_string", date_format, sa.String)
+                if date_format is not None
+                else None
+            ),
+            (
+                ("number_rows", ignore_header, sa.Integer)
+                if ignore_header is not None
+                else None
+            ),
+            (
+                ("timeformat_string", time_format, sa.String)
+                if time_format is not None
+                else None
+            ),
+            ("numrows", comp_rows, sa.Integer) if comp_rows else None,
+            (("error_count", max_error, sa.Integer) if max_error is not None else None),
+            ("region", region, sa.String) if region is not None else None,
+        )
 
 
 @sa_compiler.compiles(CopyCommand)
@@ -740,48 +1056,15 @@ def visit_copy_command(element, compiler, **kw):
         {format}
         {parameters}"""
     parameters = []
-    bindparams: list[sa.BindParameter] = [
-        sa.bindparam(
-            "data_location",
-            value=element.data_location,
-            type_=sa.String,
-        ),
-        sa.bindparam(
-            "credentials",
-            value=element.credentials,
-            type_=sa.String,
-        ),
-    ]
 
     if element.format == Format.csv:
         format_ = "FORMAT AS CSV"
         if element.quote is not None:
             format_ += " QUOTE AS :quote_character"
-            bindparams.append(
-                sa.bindparam(
-                    "quote_character",
-                    value=element.quote,
-                    type_=sa.String,
-                )
-            )
     elif element.format == Format.json:
         format_ = "FORMAT AS JSON AS :json_option"
-        bindparams.append(
-            sa.bindparam(
-                "json_option",
-                value=element.path_file,
-                type_=sa.String,
-            )
-        )
     elif element.format == Format.avro:
         format_ = "FORMAT AS AVRO AS :avro_option"
-        bindparams.append(
-            sa.bindparam(
-                "avro_option",
-                value=element.path_file,
-                type_=sa.String,
-            )
-        )
     elif element.format == Format.orc:
         format_ = "FORMAT AS ORC"
     elif element.format == Format.parquet:
@@ -795,23 +1078,9 @@ def visit_copy_command(element, compiler, **kw):
 
     if element.delimiter is not None:
         parameters.append("DELIMITER AS :delimiter_char")
-        bindparams.append(
-            sa.bindparam(
-                "delimiter_char",
-                value=element.delimiter,
-                type_=sa.String,
-            )
-        )
 
     if element.fixed_width is not None:
         parameters.append("FIXEDWIDTH AS :fixedwidth_spec")
-        bindparams.append(
-            sa.bindparam(
-                "fixedwidth_spec",
-                value=_process_fixed_width(element.fixed_width),
-                type_=sa.String,
-            )
-        )
 
     if element.compression is not None:
         parameters.append(Compression(element.compression).value)
@@ -824,24 +1093,12 @@ def visit_copy_command(element, compiler, **kw):
 
     if element.accept_inv_chars is not None:
         parameters.append("ACCEPTINVCHARS AS :replacement_char")
-        bindparams.append(
-            sa.bindparam(
-                "replacement_char", value=element.accept_inv_chars, type_=sa.String
-            )
-        )
 
     if element.blanks_as_null:
         parameters.append("BLANKSASNULL")
 
     if element.date_format is not None:
         parameters.append("DATEFORMAT AS :dateformat_string")
-        bindparams.append(
-            sa.bindparam(
-                "dateformat_string",
-                value=element.date_format,
-                type_=sa.String,
-            )
-        )
 
     if element.empty_as_null:
         parameters.append("EMPTYASNULL")
@@ -863,13 +1120,6 @@ def visit_copy_command(element, compiler, **kw):
 
     if element.ignore_header is not None:
         parameters.append("IGNOREHEADER AS :number_rows")
-        bindparams.append(
-            sa.bindparam(
-                "number_rows",
-                value=element.ignore_header,
-                type_=sa.Integer,
-            )
-        )
 
     if element.dangerous_null_delimiter is not None:
         parameters.append("NULL AS '%s'" % element.dangerous_null_delimiter)
@@ -882,13 +1132,6 @@ def visit_copy_command(element, compiler, **kw):
 
     if element.time_format is not None:
         parameters.append("TIMEFORMAT AS :timeformat_string")
-        bindparams.append(
-            sa.bindparam(
-                "timeformat_string",
-                value=element.time_format,
-                type_=sa.String,
-            )
-        )
 
     if element.trim_blanks:
         parameters.append("TRIMBLANKS")
@@ -898,13 +1141,6 @@ def visit_copy_command(element, compiler, **kw):
 
     if element.comp_rows:
         parameters.append("COMPROWS :numrows")
-        bindparams.append(
-            sa.bindparam(
-                "numrows",
-                value=element.comp_rows,
-                type_=sa.Integer,
-            )
-        )
 
     if element.comp_update:
         parameters.append("COMPUPDATE ON")
@@ -913,13 +1149,6 @@ def visit_copy_command(element, compiler, **kw):
 
     if element.max_error is not None:
         parameters.append("MAXERROR AS :error_count")
-        bindparams.append(
-            sa.bindparam(
-                "error_count",
-                value=element.max_error,
-                type_=sa.Integer,
-            )
-        )
 
     if element.no_load:
         parameters.append("NOLOAD")
@@ -931,7 +1160,6 @@ def visit_copy_command(element, compiler, **kw):
 
     if element.region is not None:
         parameters.append("REGION :region")
-        bindparams.append(sa.bindparam("region", value=element.region, type_=sa.String))
 
     columns = (
         " (%s)"
@@ -949,7 +1177,7 @@ def visit_copy_command(element, compiler, **kw):
         parameters="\n".join(parameters),
     )
 
-    return compiler.process(sa.text(qs).bindparams(*bindparams), **kw)
+    return compiler.process(sa.text(qs).bindparams(*element._bindparams), **kw)
 
 
 class CreateLibraryCommand(_ExecutableClause):
@@ -996,6 +1224,13 @@ class CreateLibraryCommand(_ExecutableClause):
         Redshift cluster isn't in the same region as the S3 bucket.
     """
 
+    inherit_cache = True
+    _traverse_internals = [
+        ("library_name", InternalTraversal.dp_string),
+        ("replace", InternalTraversal.dp_boolean),
+        ("_bindparams", InternalTraversal.dp_clauseelement_list),
+    ]
+
     def __init__(
         self,
         library_name,
@@ -1021,6 +1256,11 @@ class CreateLibraryCommand(_ExecutableClause):
         )
         self.replace = replace
         self.region = region
+        self._bindparams = _bindparams(
+            ("location", location, sa.String),
+            ("credentials", self.credentials, sa.String),
+            ("region", region, sa.String) if region else None,
+        )
 
 
 @sa_compiler.compiles(CreateLibraryCommand)
@@ -1035,35 +1275,13 @@ def visit_create_library_command(element, compiler, **kw):
         WITH CREDENTIALS AS :credentials
         {region}
     """
-    bindparams = [
-        sa.bindparam(
-            "location",
-            value=element.location,
-            type_=sa.String,
-        ),
-        sa.bindparam(
-            "credentials",
-            value=element.credentials,
-            type_=sa.String,
-        ),
-    ]
-
-    if element.region is not None:
-        bindparams.append(
-            sa.bindparam(
-                "region",
-                value=element.region,
-                type_=sa.String,
-            )
-        )
-
     quoted_lib_name = compiler.preparer.quote_identifier(element.library_name)
     query = query.format(
         name=quoted_lib_name,
         or_replace="OR REPLACE" if element.replace else "",
         region="REGION :region" if element.region else "",
     )
-    return compiler.process(sa.text(query).bindparams(*bindparams), **kw)
+    return compiler.process(sa.text(query).bindparams(*element._bindparams), **kw)
 
 
 class RefreshMaterializedView(_ExecutableClause):
@@ -1088,6 +1306,9 @@ class RefreshMaterializedView(_ExecutableClause):
     This can be included in any execute() statement.
     """
 
+    inherit_cache = True
+    _traverse_internals = [("name", InternalTraversal.dp_string)]
+
     def __init__(self, name):
         """
         Builds the Executable/ClauseElement that represents the refresh command
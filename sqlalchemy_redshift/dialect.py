@@ -1,9 +1,15 @@
-from collections import defaultdict, namedtuple
+from collections import namedtuple
+import contextlib
+import copy
+import functools
 import importlib
 from importlib.resources import files
+import itertools
 import json
 from logging import getLogger
 import re
+import threading
+import time
 from typing import cast
 
 from packaging.version import Version
@@ -22,6 +28,7 @@ from sqlalchemy.dialects.postgresql.base import (
     PGDialect,
     PGExecutionContext,
     PGIdentifierPreparer,
+    PGInspector,
     PGTypeCompiler,
 )
 from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
@@ -32,8 +39,14 @@ from sqlalchemy.engine.interfaces import (
     DBAPIModule,
     ReflectedUniqueConstraint,
 )
+from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
 from sqlalchemy.ext.compiler import compiles
-from sqlalchemy.sql.expression import BinaryExpression, BooleanClauseList, Delete
+from sqlalchemy.sql.expression import (
+    BindParameter,
+    ColumnClause,
+    Delete,
+    SelectBase,
+)
 from sqlalchemy.sql.type_api import TypeEngine
 from sqlalchemy.types import (
     BIGINT,
@@ -49,6 +62,7 @@ from sqlalchemy.types import (
     NullType,
 )
 
+from .cache import ReflectionCache, compact_rows
 from .commands import (
     AlterTableAppendCommand,
     Compression,
@@ -58,8 +72,10 @@ from .commands import (
     Format,
     RefreshMaterializedView,
     UnloadFromSelect,
+    UnloadTemplate,
 )
 from .ddl import CreateMaterializedView, DropMaterializedView, get_table_attributes
+from .instrumentation import ReflectionStats, ReflectionStatsGroup
 
 sa_version = Version(sa.__version__)
 logger = getLogger(__name__)
@@ -109,6 +125,7 @@ __all__ = (
     "RedshiftDialect_redshift_connector",
     "CopyCommand",
     "UnloadFromSelect",
+    "UnloadTemplate",
     "Compression",
     "Encoding",
     "Format",
@@ -136,67 +153,12 @@ IDENTITY_RE = re.compile(
     re.VERBOSE,
 )
 
-# Regex for SQL identifiers (valid table and column names)
-SQL_IDENTIFIER_RE = re.compile(
-    r"""
-   [_a-zA-Z][\w$]*  # SQL standard identifier
-   |                # or
-   (?:"[^"]+")+     # SQL delimited (quoted) identifier
-""",
-    re.VERBOSE,
-)
-
-# Regex for foreign key constraints, e.g.:
-#   FOREIGN KEY(col1) REFERENCES othertable (col2)
-# See https://docs.aws.amazon.com/redshift/latest/dg/r_names.html
-# for a definition of valid SQL identifiers.
-FOREIGN_KEY_RE = re.compile(
-    r"""
-  ^FOREIGN\ KEY \s* \(   # FOREIGN KEY, arbitrary whitespace, literal '('
-    (?P<columns>         # Start a group to capture the referring columns
-      (?:                # Start a non-capturing group
-        \s*              # Arbitrary whitespace
-        ([_a-zA-Z][\w$]* | ("[^"]+")+)   # SQL identifier
-        \s*              # Arbitrary whitespace
-        ,?               # There will be a colon if this isn't the last one
-      )+                 # Close the non-capturing group; require at least one
-    )                    # Close the 'columns' group
-  \s* \)                 # Arbitrary whitespace and literal ')'
-  \s* REFERENCES \s*
-    ((?P<referred_schema>([_a-zA-Z][\w$]* | ("[^"]*")+))\.)? # SQL identifier
-    (?P<referred_table>[_a-zA-Z][\w$]* | ("[^"]*")+)         # SQL identifier
-  \s* \(   # FOREIGN KEY, arbitrary whitespace, literal '('
-    (?P<referred_columns> # Start a group to capture the referring columns
-      (?:                # Start a non-capturing group
-        \s*              # Arbitrary whitespace
-        ([_a-zA-Z][\w$]* | ("[^"]+")+)   # SQL identifier
-        \s*              # Arbitrary whitespace
-        ,?               # There will be a colon if this isn't the last one
-      )+                 # Close the non-capturing group; require at least one
-    )                    # Close the 'columns' group
-  \s* \)                 # Arbitrary whitespace and literal ')'
-""",
-    re.VERBOSE,
-)
+# Regex for check constraint definitions, e.g.:
+#   CHECK (((a > 1) AND (a < 5))) NOT VALID
+CHECK_CONSTRAINT_RE = re.compile(r"^CHECK *\((.+)\)( NOT VALID)?$", flags=re.DOTALL)
 
-# Regex for primary key constraints, e.g.:
-#   PRIMARY KEY (col1, col2)
-PRIMARY_KEY_RE = re.compile(
-    r"""
-  ^PRIMARY \s* KEY \s* \(  # FOREIGN KEY, arbitrary whitespace, literal '('
-    (?P<columns>         # Start a group to capture column names
-      (?:
-        \s*                # Arbitrary whitespace
-        # SQL identifier or delimited identifier
-        ( [_a-zA-Z][\w$]* | ("[^"]*")+ )
-        \s*                # Arbitrary whitespace
-        ,?                 # There will be a colon if this isn't the last one
-      )+                  # Close the non-capturing group; require at least one
-    )
-  \s* \) \s*                # Arbitrary whitespace and literal ')'
-""",
-    re.VERBOSE,
-)
+# Regex for the redundant parentheses wrapping a check constraint expression
+CHECK_SQLTEXT_RE = re.compile(r"^[\s\n]*\((.+)\)[\s\n]*$", flags=re.DOTALL)
 
 # Reserved words as extracted from Redshift docs.
 # See pull_reserved_words.sh at the top level of this repository
@@ -362,7 +324,9 @@ RESERVED_WORDS = set(
     ]
 )
 
-REFLECTION_SQL = """\
+# Column reflection reads from three sources, combined with UNION ALL: local
+# relations, late-binding views and external (Spectrum) tables.
+LOCAL_COLUMNS_SQL = """\
     SELECT
         n.nspname as "schema",
         c.relname as "table_name",
@@ -391,7 +355,9 @@ REFLECTION_SQL = """\
         AND att.attnum > 0
         AND NOT att.attisdropped
         {schema_clause} {table_clause}
-    UNION
+    """
+
+LATE_BINDING_VIEW_COLUMNS_SQL = """\
     SELECT
         view_schema as "schema",
         view_name as "table_name",
@@ -415,7 +381,9 @@ REFLECTION_SQL = """\
         col_type varchar,
         col_num int)
     WHERE 1 {schema_clause} {table_clause}
-    UNION
+    """
+
+EXTERNAL_COLUMNS_SQL = """\
     SELECT c.schemaname AS "schema",
         c.tablename AS "table_name",
         c.columnname AS "name",
@@ -470,9 +438,27 @@ REFLECTION_SQL = """\
     FROM svv_external_columns c
     JOIN svv_external_schemas s ON s.schemaname = c.schemaname
     WHERE 1 {schema_clause} {table_clause}
-    ORDER BY "schema", "table_name", "attnum";
     """
 
+COLUMN_SOURCES_SQL = {
+    "local": LOCAL_COLUMNS_SQL,
+    "late_binding_views": LATE_BINDING_VIEW_COLUMNS_SQL,
+    "external": EXTERNAL_COLUMNS_SQL,
+}
+
+
+def _get_reflection_sql(sources=tuple(COLUMN_SOURCES_SQL)):
+    """
+    Return the column reflection query for the given column `sources`.
+    """
+    return (
+        "UNION ALL\n".join(COLUMN_SOURCES_SQL[source] for source in sources)
+        + 'ORDER BY "schema", "table_name", "attnum";\n'
+    )
+
+
+REFLECTION_SQL = _get_reflection_sql()
+
 
 class RedshiftTypeEngine(TypeEngine):
 
@@ -653,11 +639,243 @@ class RelationKey(namedtuple("RelationKey", ("name", "schema"))):
         )
 
 
+class RelationIndex(dict):
+    """
+    Dictionary of catalog entries keyed by :class:`RelationKey`, with a
+    lookup index that resolves quoted keys to their unquoted entries.
+
+    The index is built on the first :meth:`lookup` and registers, for each
+    key, the variants with the name and/or schema in double quotes, so a
+    lookup is a single dictionary probe rather than a probe followed by
+    :meth:`RelationKey.unquoted` and a second probe. Iteration only sees
+    the keys as stored.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self._index = None
+
+    def __setitem__(self, key, value):
+        self._index = None
+        super().__setitem__(key, value)
+
+    def update(self, *args, **kw):
+        self._index = None
+        super().update(*args, **kw)
+
+    def lookup(self, key, default=None):
+        """
+        Return the entry for `key`, or for its unquoted form if `key` itself
+        is not present, or `default`.
+        """
+        index = self._index
+        if index is None:
+            index = self._index = self._build_index()
+        return index.get(key, default)
+
+    def _build_index(self):
+        index = dict(self)
+        for key, entry in self.items():
+            name, schema = key
+            quoted_name = f'"{name}"'
+            quoted_schema = None if schema is None else f'"{schema}"'
+            for alias in (
+                (quoted_name, schema),
+                (name, quoted_schema),
+                (quoted_name, quoted_schema),
+            ):
+                index.setdefault(alias, entry)
+        return index
+
+
+def _get_relation_entry(mapping, key, default=None):
+    """
+    Look *key* up in a dictionary keyed by :class:`RelationKey`, falling back
+    to the unquoted form of the key as the single-table helpers do.
+    """
+    if isinstance(mapping, RelationIndex):
+        return mapping.lookup(key, default)
+    if key not in mapping:
+        key = key.unquoted()
+    return mapping.get(key, default)
+
+
+def _group_by_relation(rows, name_field="table_name"):
+    """
+    Group catalog `rows` into a :class:`RelationIndex` of lists, keyed by
+    the relation named in their `name_field` and ``schema`` fields.
+
+    Catalog queries return the rows of a relation together, so a key is
+    only built when the relation changes from one row to the next.
+    """
+    grouped = RelationIndex()
+    previous = entries = None
+    for row in rows:
+        relation = (getattr(row, name_field), row.schema)
+        if relation != previous:
+            previous = relation
+            key = RelationKey(*relation)
+            entries = grouped.get(key)
+            if entries is None:
+                entries = grouped[key] = []
+        entries.append(row)
+    return grouped
+
+
+def _rows_size(rows):
+    """
+    Return the approximate size in bytes of the values in `rows`, taking
+    the length of their text form.
+    """
+    size = 0
+    for row in rows:
+        for value in row:
+            if value is None:
+                continue
+            if value.__class__ is not str:
+                value = str(value)
+            size += len(value)
+    return size
+
+
+def _record_stream(stats, name, rows, start):
+    """
+    Yield `rows`, recording the query `name` with `stats` once they are
+    exhausted. The time recorded runs from `start` and so includes the time
+    the consumer spent between rows.
+    """
+    count = size = 0
+    try:
+        for row in rows:
+            count += 1
+            size += _rows_size((row,))
+            yield row
+    finally:
+        stats.record_query(name, time.perf_counter() - start, count, size)
+
+
+def _catalog_cache_key(name, schema, table_names):
+    return ("redshift_catalog", name, schema, table_names)
+
+
+def _catalog_cache(fn):
+    """
+    Cache the result of a catalog query in the ``info_cache``.
+
+    Works like :func:`sqlalchemy.engine.reflection.cache`, but the key is
+    built from the `schema` and `table_names` arguments alone so that a
+    schema-wide result (``table_names=None``) can be found and reused by
+    :meth:`RedshiftDialectMixin._get_catalog_info`.
+    """
+
+    @functools.wraps(fn)
+    def decorated(self, connection, schema=None, table_names=None, **kw):
+        info_cache = kw.get("info_cache")
+        if info_cache is None:
+            return fn(self, connection, schema=schema, table_names=table_names, **kw)
+        key = _catalog_cache_key(fn.__name__, schema, table_names)
+        stats = self.reflection_stats
+        if stats is not None:
+            stats.record_cache("info_cache", fn.__name__, key in info_cache)
+        if key not in info_cache:
+            info_cache[key] = fn(
+                self, connection, schema=schema, table_names=table_names, **kw
+            )
+        return info_cache[key]
+
+    return decorated
+
+
+def _shared_catalog_cache(fn):
+    """
+    Serve a catalog query from the engine-wide :class:`ReflectionCache`
+    when ``reflection_cache_ttl`` is set, so that repeated inspection
+    through new :class:`~sqlalchemy.engine.Inspector` objects does not hit
+    the leader node again within the TTL.
+    """
+
+    @functools.wraps(fn)
+    def decorated(self, connection, schema=None, table_names=None, **kw):
+        cache = self.reflection_cache
+        if cache is None or schema is None:
+            return fn(self, connection, schema=schema, table_names=table_names, **kw)
+        prefix = (connection.engine.url.database, fn.__name__, schema)
+        relations, missing = cache.get_relations(prefix, table_names)
+        stats = self.reflection_stats
+        if stats is not None:
+            stats.record_cache("reflection_cache", fn.__name__, missing == ())
+        if missing is None or missing:
+            fetched = fn(self, connection, schema=schema, table_names=missing, **kw)
+            cache.set_relations(prefix, missing, fetched)
+            relations.update(fetched)
+        return RelationIndex(relations)
+
+    return decorated
+
+
+def _reflection_cache(fn):
+    """
+    :func:`sqlalchemy.engine.reflection.cache`, also recording hits and
+    misses with the dialect's ``reflection_stats`` while they are collected.
+    """
+    cached = reflection.cache(fn)
+
+    @functools.wraps(fn)
+    def decorated(self, connection, *args, **kw):
+        info_cache = kw.get("info_cache")
+        stats = self.reflection_stats
+        if stats is None or info_cache is None:
+            return cached(self, connection, *args, **kw)
+        # A miss stores the result (and possibly the catalog queries it
+        # needed) in the info_cache, while a hit adds nothing.
+        size = len(info_cache)
+        result = cached(self, connection, *args, **kw)
+        stats.record_cache("info_cache", fn.__name__, len(info_cache) == size)
+        return result
+
+    return decorated
+
+
+# pg_class.relkind values that correspond to each reflected object kind.
+RELKINDS_BY_OBJECT_KIND = {
+    ObjectKind.TABLE: "r",
+    ObjectKind.VIEW: "v",
+    ObjectKind.MATERIALIZED_VIEW: "m",
+}
+
+
 class RedshiftCompiler(PGCompiler):
 
     def visit_now_func(self, fn, **kw):
         return "SYSDATE"
 
+    def _literal_execute_expanding_parameter(self, name, parameter, values):
+        # Past the dialect's in_list_literal_threshold, render the values of
+        # an IN list inline, once each, instead of one bound parameter per
+        # value. This runs when the statement is executed, so the cached
+        # compiled form serves lists of any length.
+        threshold = self.dialect.in_list_literal_threshold
+        if threshold is None or len(values) <= threshold or parameter.literal_execute:
+            return super()._literal_execute_expanding_parameter(name, parameter, values)
+        try:
+            values = list(dict.fromkeys(values))
+        except TypeError:
+            pass
+        processor = parameter.type._cached_literal_processor(self.dialect)
+        if processor is not None and not parameter.type._is_tuple_type:
+            return (), ", ".join(
+                "NULL" if value is None else processor(value) for value in values
+            )
+        try:
+            return self._literal_execute_expanding_parameter_literal_binds(
+                parameter, values
+            )
+        except sa_exc.CompileError:
+            # No literal rendering for the type; bind the values.
+            return super()._literal_execute_expanding_parameter(name, parameter, values)
+
 
 class RedshiftDDLCompiler(PGDDLCompiler):
     """
@@ -844,6 +1062,66 @@ class RedshiftIdentifierPreparer(PGIdentifierPreparer):
     reserved_words = RESERVED_WORDS
 
 
+class RedshiftInspector(PGInspector):
+    """
+    Inspector returned by :func:`sqlalchemy.inspect` for Redshift engines
+    and connections, adding Redshift-specific reflection methods.
+    """
+
+    def get_table_stats(self, table_name, schema=None):
+        """
+        Return the physical statistics of `table_name` from
+        ``svv_table_info``, or ``None`` if the view does not list it (for
+        example because the table is empty).
+
+        The statistics of the whole schema are fetched with one query and
+        cached for the life of the inspector. See
+        :meth:`RedshiftDialectMixin.get_table_stats` for the keys returned.
+        """
+        with self._operation_context() as conn:
+            return self.dialect.get_table_stats(
+                conn, table_name, schema, info_cache=self.info_cache
+            )
+
+    def get_multi_table_stats(self, schema=None, filter_names=None):
+        """
+        Return a ``{(schema, table_name): stats}`` dictionary of the
+        physical statistics of the tables in `schema`, optionally limited to
+        `filter_names`, read from ``svv_table_info`` with one query.
+        """
+        with self._operation_context() as conn:
+            return dict(
+                self.dialect.get_multi_table_stats(
+                    conn, schema, filter_names, info_cache=self.info_cache
+                )
+            )
+
+    def get_materialized_view_info(self, view_name, schema=None):
+        """
+        Return the refresh state of the materialized view `view_name` from
+        ``svv_mv_info``. See
+        :meth:`RedshiftDialectMixin.get_materialized_view_info` for the keys
+        returned.
+        """
+        with self._operation_context() as conn:
+            return self.dialect.get_materialized_view_info(
+                conn, view_name, schema, info_cache=self.info_cache
+            )
+
+    def get_multi_materialized_view_info(self, schema=None, filter_names=None):
+        """
+        Return a ``{(schema, view_name): info}`` dictionary of the refresh
+        state of the materialized views in `schema`, optionally limited to
+        `filter_names`, read from ``svv_mv_info`` with one query.
+        """
+        with self._operation_context() as conn:
+            return dict(
+                self.dialect.get_multi_materialized_view_info(
+                    conn, schema, filter_names, info_cache=self.info_cache
+                )
+            )
+
+
 class RedshiftDialectMixin(DefaultDialect):
     """
     Define Redshift-specific behavior.
@@ -851,11 +1129,47 @@ class RedshiftDialectMixin(DefaultDialect):
     Most public methods are overrides of the underlying interfaces defined in
     :class:`~sqlalchemy.engine.interfaces.Dialect` and
     :class:`~sqlalchemy.engine.Inspector`.
+
+    Table-by-table reflection (e.g. ``Table(..., autoload_with=engine)``)
+    queries the catalog for the requested relation only. Pass
+    ``reflection_prefetch_threshold`` to :func:`~sqlalchemy.create_engine`
+    to fetch the relation, column and constraint catalogs for the whole
+    schema instead, once that many relations of the same schema have been
+    requested through one inspector. Later lookups in that schema are then
+    served from the schema-wide result; ``0`` always prefetches.
+
+    Catalog data can also be shared by every inspector of an engine for
+    ``reflection_cache_ttl`` seconds; see
+    :class:`~sqlalchemy_redshift.cache.ReflectionCache`.
+
+    >>> import sqlalchemy as sa
+    >>> engine = sa.create_engine(
+    ...     'redshift+psycopg2://example', reflection_prefetch_threshold=10
+    ... )
+    >>> engine.dialect.reflection_prefetch_threshold
+    10
+
+    ``IN`` lists built with :meth:`~sqlalchemy.sql.expression.ColumnOperators.in_`
+    get one bound parameter per value, which is slow to render and send for
+    tens of thousands of values, and exceeds the 32767 parameters a
+    server-side prepared statement (``redshift_connector``) accepts. Pass
+    ``in_list_literal_threshold`` to render longer lists inline as literal
+    values, without duplicates:
+
+    >>> engine = sa.create_engine(
+    ...     'redshift+psycopg2://example', in_list_literal_threshold=1000
+    ... )
+    >>> engine.dialect.in_list_literal_threshold
+    1000
     """
 
     name = "redshift"
     max_identifier_length = 127
+    # Maximum number of distinct format_type strings whose reflected types
+    # are memoized; 0 disables the memo.
+    type_memo_size = 1024
 
+    inspector = RedshiftInspector
     statement_compiler = RedshiftCompiler
     ddl_compiler = RedshiftDDLCompiler
     preparer = RedshiftIdentifierPreparer
@@ -883,11 +1197,31 @@ class RedshiftDialectMixin(DefaultDialect):
         ),
     ]
 
-    def __init__(self, *args, **kw):
-        super(RedshiftDialectMixin, self).__init__(*args, **kw)
+    def __init__(
+        self,
+        reflection_prefetch_threshold=None,
+        reflection_cache_ttl=None,
+        reflection_cache_size=10000,
+        in_list_literal_threshold=None,
+        **kw,
+    ):
+        super(RedshiftDialectMixin, self).__init__(**kw)
+        self.reflection_prefetch_threshold = reflection_prefetch_threshold
+        self.in_list_literal_threshold = in_list_literal_threshold
+        self.reflection_cache = None
+        if reflection_cache_ttl is not None:
+            self.reflection_cache = ReflectionCache(
+                reflection_cache_ttl, reflection_cache_size
+            )
         # Cache domains, as these will be static;
         # Redshift does not support user-created domains.
         self._domains = None
+        # Reflected types by format_type string; see _reflect_column_type.
+        self._type_memo = {}
+        self._type_memo_lock = threading.Lock()
+        # The ReflectionStats of the active collect_reflection_stats blocks.
+        self._reflection_stats = ()
+        self._reflection_stats_lock = threading.Lock()
 
     @property
     def ischema_names(self):
@@ -904,13 +1238,13 @@ class RedshiftDialectMixin(DefaultDialect):
             **REDSHIFT_ISCHEMA_NAMES,
         }
 
-    @reflection.cache
+    @_reflection_cache
     def _load_domains(self, connection, schema=None, **kw):
         """Redshift does not support user-created domains and its catalog
         lacks pg_collation and array_agg(text). Return empty list."""
         return {}
 
-    @reflection.cache
+    @_reflection_cache
     def _load_enums(self, connection, schema=None, **kw):
         """Redshift does not support user-created enums and its catalog
         lacks ordered aggregate syntax in array_agg. Return empty list."""
@@ -918,46 +1252,114 @@ class RedshiftDialectMixin(DefaultDialect):
 
     # SQLAlchemy 2.0's PGDialect overrides get_multi_* methods with batched
     # SQL that uses PostgreSQL-specific syntax (ordered aggregates, pg_collation,
-    # etc.) unsupported by Redshift. Route these back to DefaultDialect's
-    # fallback which calls our single-table overrides in a loop.
+    # etc.) unsupported by Redshift. Columns, constraints and table comments
+    # are reflected with batched Redshift catalog queries instead; indexes are
+    # routed back to DefaultDialect's fallback, which calls our single-table
+    # override (which never queries) in a loop.
     # Signatures match PGDialect so positional args are properly captured.
     def get_multi_columns(
         self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
     ):
-        return DefaultDialect.get_multi_columns(
-            self,
+        """
+        Return information about columns in all relations in `schema`.
+
+        Unlike the per-table fallback, :data:`REFLECTION_SQL` is run once for
+        the whole schema (or once for the `filter_names` list) and the rows
+        are then distributed to the individual relations.
+
+        Overrides interface
+        :meth:`~sqlalchemy.engine.interfaces.Dialect.get_multi_columns`.
+        """
+        relations = self._get_multi_relation_keys(
+            connection, schema, filter_names, scope, kind, **kw
+        )
+        all_columns = self._get_catalog_info(
+            self._get_schema_column_info,
             connection,
             schema=schema,
-            filter_names=filter_names,
-            scope=scope,
-            kind=kind,
-            **kw,
+            table_names=self._get_filter_table_names(filter_names),
+            info_cache=kw.get("info_cache"),
+        )
+        for table_key, key in relations:
+            cols = _get_relation_entry(all_columns, key)
+            if cols is not None:
+                yield table_key, self._get_column_infos(connection, cols)
+
+    def stream_multi_columns(
+        self, connection, schema=None, filter_names=None, chunk_size=1000
+    ):
+        """
+        Yield ``((schema, table_name), columns)`` pairs like
+        :meth:`get_multi_columns`, reading :data:`REFLECTION_SQL` in chunks of
+        `chunk_size` rows.
+
+        The rows arrive ordered by schema, table and column number, so each
+        relation is yielded as soon as its last column has been read. With
+        psycopg2 the rows are fetched through a server-side cursor, so memory
+        use is bounded by the chunk size and the widest relation.
+        ``redshift_connector`` has no server-side cursors and buffers the
+        whole result; only the column dictionaries are then built one
+        relation at a time. Nothing is cached. Without a `schema`, every
+        schema in the cluster is reflected and the schema of each pair is the
+        relation's own.
+
+        >>> import sqlalchemy as sa
+        >>> engine = sa.create_engine('redshift+psycopg2://example')
+        >>> with engine.connect() as conn:  # doctest: +SKIP
+        ...     for (schema, name), columns in (
+        ...         engine.dialect.stream_multi_columns(conn, chunk_size=5000)
+        ...     ):
+        ...         print(schema, name, len(columns))
+        """
+        schema_clause, table_clause, params = self._get_catalog_filter(
+            schema, self._get_filter_table_names(filter_names), "table_name"
+        )
+        sql = _get_reflection_sql(self._get_column_sources(connection, schema)).format(
+            schema_clause=schema_clause, table_clause=table_clause
         )
+        if self._domains is None:
+            self._domains = self._load_domains(connection)
+        start = time.perf_counter()
+        result = connection.execute(
+            self._catalog_query(sql, params),
+            params,
+            execution_options={"yield_per": chunk_size},
+        )
+        rows = self._compact_catalog_rows(result)
+        stats = self.reflection_stats
+        if stats is not None:
+            rows = _record_stream(stats, "stream_multi_columns", rows, start)
+        for (row_schema, name), cols in itertools.groupby(
+            rows, key=lambda col: (col.schema, col.table_name)
+        ):
+            table_key = (schema if schema is not None else row_schema, name)
+            yield table_key, self._get_column_infos(connection, list(cols))
 
     def get_multi_pk_constraint(
         self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
     ):
-        return DefaultDialect.get_multi_pk_constraint(
-            self,
-            connection,
-            schema=schema,
-            filter_names=filter_names,
-            scope=scope,
-            kind=kind,
-            **kw,
+        """
+        Return information about the primary key constraints of all
+        relations in `schema`.
+
+        Overrides interface
+        :meth:`~sqlalchemy.engine.interfaces.Dialect.get_multi_pk_constraint`.
+        """
+        return self._get_multi_constraints(
+            "pk_constraint", connection, schema, filter_names, scope, kind, **kw
         )
 
     def get_multi_foreign_keys(
         self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
     ):
-        return DefaultDialect.get_multi_foreign_keys(
-            self,
-            connection,
-            schema=schema,
-            filter_names=filter_names,
-            scope=scope,
-            kind=kind,
-            **kw,
+        """
+        Return information about foreign keys in all relations in `schema`.
+
+        Overrides interface
+        :meth:`~sqlalchemy.engine.interfaces.Dialect.get_multi_foreign_keys`.
+        """
+        return self._get_multi_constraints(
+            "foreign_keys", connection, schema, filter_names, scope, kind, **kw
         )
 
     def get_multi_indexes(
@@ -976,43 +1378,68 @@ class RedshiftDialectMixin(DefaultDialect):
     def get_multi_unique_constraints(
         self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
     ):
-        return DefaultDialect.get_multi_unique_constraints(
-            self,
-            connection,
-            schema=schema,
-            filter_names=filter_names,
-            scope=scope,
-            kind=kind,
-            **kw,
+        """
+        Return information about unique constraints in all relations in `schema`.
+
+        Overrides interface
+        :meth:`~sqlalchemy.engine.interfaces.Dialect.get_multi_unique_constraints`.
+        """
+        return self._get_multi_constraints(
+            "unique_constraints", connection, schema, filter_names, scope, kind, **kw
         )
 
     def get_multi_check_constraints(
         self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
     ):
-        return DefaultDialect.get_multi_check_constraints(
-            self,
+        """
+        Return information about check constraints in all relations in
+        `schema`, read from ``pg_constraint`` with one query.
+
+        Overrides interface
+        :meth:`~sqlalchemy.engine.interfaces.Dialect.get_multi_check_constraints`.
+        """
+        relations = self._get_multi_relation_keys(
+            connection, schema, filter_names, scope, kind, **kw
+        )
+        all_checks = self._get_catalog_info(
+            self._get_all_check_constraint_info,
             connection,
             schema=schema,
-            filter_names=filter_names,
-            scope=scope,
-            kind=kind,
-            **kw,
+            table_names=self._get_filter_table_names(filter_names),
+            info_cache=kw.get("info_cache"),
         )
+        for table_key, key in relations:
+            checks = _get_relation_entry(all_checks, key, [])
+            yield table_key, [
+                self._parse_check_constraint(check.name, check.src) for check in checks
+            ]
 
     def get_multi_table_comment(
         self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
     ):
-        return DefaultDialect.get_multi_table_comment(
-            self,
+        """
+        Return the comments of all relations in `schema`, read from the
+        relation query rather than one ``pg_description`` query per table.
+
+        Overrides interface
+        :meth:`~sqlalchemy.engine.interfaces.Dialect.get_multi_table_comment`.
+        """
+        relations = self._get_multi_relation_keys(
+            connection, schema, filter_names, scope, kind, **kw
+        )
+        all_relations = self._get_catalog_info(
+            self._get_all_relation_info,
             connection,
             schema=schema,
-            filter_names=filter_names,
-            scope=scope,
-            kind=kind,
-            **kw,
+            table_names=self._get_filter_table_names(filter_names),
+            info_cache=kw.get("info_cache"),
         )
+        for table_key, key in relations:
+            table = _get_relation_entry(all_relations, key)
+            if table is not None:
+                yield table_key, {"text": table.comment}
 
-    @reflection.cache
+    @_reflection_cache
     def get_columns(self, connection, table_name, schema=None, **kw):
         """
         Return information about columns in `table_name`.
@@ -1021,95 +1448,119 @@ class RedshiftDialectMixin(DefaultDialect):
         :meth:`~sqlalchemy.engine.interfaces.Dialect.get_columns`.
         """
         cols = self._get_redshift_columns(connection, table_name, schema, **kw)
-        if self._domains is None:
-            self._domains = self._load_domains(connection)
-        domains = self._domains
-        columns = []
-        for col in cols:
-            column_info = self._get_column_info(
-                name=col.name,
-                format_type=col.format_type,
-                default=col.default,
-                notnull=col.notnull,
-                domains=domains,
-                enums=[],
-                schema=col.schema,
-                encode=col.encode,
-                comment=col.comment,
-            )
-            columns.append(column_info)
-        return columns
+        return self._get_column_infos(connection, cols)
 
-    @reflection.cache
+    @_reflection_cache
     def has_table(self, connection, table_name, schema=None, **kw):
-        if not schema:
-            schema = inspect(connection).default_schema_name
+        """
+        Return ``True`` if a table, view or external table named
+        `table_name` exists in `schema`.
 
-        info_cache = kw.get("info_cache")
-        table = self._get_all_relation_info(
-            connection, schema=schema, table_name=table_name, info_cache=info_cache
-        )
+        Overrides interface
+        :meth:`~sqlalchemy.engine.interfaces.Dialect.has_table`.
+        """
+        return bool(self.has_tables(connection, [table_name], schema, **kw))
 
-        return True if table else False
+    def has_tables(self, connection, table_names, schema=None, **kw):
+        """
+        Return the set of `table_names` that exist in `schema`, checked with
+        a single catalog query.
+
+        Use this instead of calling :meth:`has_table` in a loop, e.g. to
+        find which tables of a :class:`~sqlalchemy.schema.MetaData` still
+        have to be created. Names are plain table names, so check the tables
+        of each schema separately:
+
+        >>> import sqlalchemy as sa
+        >>> engine = sa.create_engine('redshift+psycopg2://example')
+        >>> metadata = sa.MetaData()
+        >>> by_schema = {}
+        >>> for table in metadata.sorted_tables:
+        ...     by_schema.setdefault(table.schema, []).append(table)
+        >>> with engine.begin() as conn:  # doctest: +SKIP
+        ...     missing = []
+        ...     for schema, tables in by_schema.items():
+        ...         existing = engine.dialect.has_tables(
+        ...             conn, [table.name for table in tables], schema
+        ...         )
+        ...         missing += [t for t in tables if t.name not in existing]
+        ...     metadata.create_all(conn, tables=missing, checkfirst=False)
+        """
+        if not table_names:
+            return set()
+        schema = schema or self.default_schema_name
+        info_cache = kw.get("info_cache")
+        key = _catalog_cache_key("_get_all_relation_info", schema, None)
+        if info_cache is not None and key in info_cache:
+            existing = {relation_key.name for relation_key in info_cache[key]}
+        else:
+            existing = self._get_relation_names(
+                connection,
+                schema=schema,
+                table_names=self._get_filter_table_names(table_names),
+                info_cache=info_cache,
+            )
+        return {
+            name
+            for name in table_names
+            if name in existing or RelationKey._unquote(name) in existing
+        }
 
-    @reflection.cache
+    @_reflection_cache
     def get_check_constraints(self, connection, table_name, schema=None, **kw):
-        table_oid = self.get_table_oid(
-            connection, table_name, schema, info_cache=kw.get("info_cache")
-        )
-        if not table_oid:
-            return []
+        """
+        Return information about check constraints in `table_name`.
 
-        result = connection.execute(
-            sa.text("""
-                        SELECT
-                            cons.conname as name,
-                            pg_get_constraintdef(cons.oid) as src
-                        FROM
-                            pg_catalog.pg_constraint cons
-                        WHERE
-                            cons.conrelid = :table_oid AND
-                            cons.contype = 'c'
-                        """),
-            {"table_oid": table_oid},
-        )
-        ret = []
-        for name, src in result:
-            # samples:
-            # "CHECK (((a > 1) AND (a < 5)))"
-            # "CHECK (((a = 1) OR ((a > 2) AND (a < 5))))"
-            # "CHECK (((a > 1) AND (a < 5))) NOT VALID"
-            # "CHECK (some_boolean_function(a))"
-            # "CHECK (((a\n < 1)\n OR\n (a\n >= 5))\n)"
-
-            m = re.match(r"^CHECK *\((.+)\)( NOT VALID)?$", src, flags=re.DOTALL)
-            if not m:
-                logger.warning(f"Could not parse CHECK constraint text: {src}")
-                sqltext = ""
-            else:
-                sqltext = re.compile(r"^[\s\n]*\((.+)\)[\s\n]*$", flags=re.DOTALL).sub(
-                    r"\1", m.group(1)
-                )
-            entry = {"name": name, "sqltext": sqltext}
-            if m and m.group(2):
-                entry["dialect_options"] = {"not_valid": True}
+        Overrides interface
+        :meth:`~sqlalchemy.engine.interfaces.Dialect.get_check_constraints`.
+        """
+        all_checks = self._get_catalog_info(
+            self._get_all_check_constraint_info,
+            connection,
+            schema=schema,
+            table_names=self._get_filter_table_names([table_name]),
+            info_cache=kw.get("info_cache"),
+        )
+        key = self._get_relation_key(table_name, schema)
+        checks = _get_relation_entry(all_checks, key, [])
+        return [self._parse_check_constraint(check.name, check.src) for check in checks]
 
-            ret.append(entry)
-        return ret
+    @staticmethod
+    def _parse_check_constraint(name, src):
+        # samples:
+        # "CHECK (((a > 1) AND (a < 5)))"
+        # "CHECK (((a = 1) OR ((a > 2) AND (a < 5))))"
+        # "CHECK (((a > 1) AND (a < 5))) NOT VALID"
+        # "CHECK (some_boolean_function(a))"
+        # "CHECK (((a\n < 1)\n OR\n (a\n >= 5))\n)"
+        m = CHECK_CONSTRAINT_RE.match(src)
+        if not m:
+            logger.warning(f"Could not parse CHECK constraint text: {src}")
+            sqltext = ""
+        else:
+            sqltext = CHECK_SQLTEXT_RE.sub(r"\1", m.group(1))
+        entry = {"name": name, "sqltext": sqltext}
+        if m and m.group(2):
+            entry["dialect_options"] = {"not_valid": True}
+        return entry
 
-    @reflection.cache
+    @_reflection_cache
     def get_table_oid(self, connection, table_name, schema=None, **kw):
         """Fetch the oid for schema.table_name.
         Return null if not found (external table does not have table oid)"""
         schema_field = f'"{schema}".' if schema else ""
 
-        result = connection.execute(sa.text(f"""
+        result = self._execute_catalog_query(
+            connection,
+            "get_table_oid",
+            sa.text(f"""
                 select '{schema_field}"{table_name}"'::regclass::oid;
-                """))
+                """),
+        )
 
         return result.scalar()
 
-    @reflection.cache
+    @_reflection_cache
     def get_pk_constraint(self, connection, table_name, schema=None, **kw):
         """
         Return information about the primary key constraint on `table_name`.
@@ -1120,19 +1571,9 @@ class RedshiftDialectMixin(DefaultDialect):
         constraints = self._get_redshift_constraints(
             connection, table_name, schema, **kw
         )
-        pk_constraints = [c for c in constraints if c.contype == "p"]
-        if not pk_constraints:
-            return {"constrained_columns": [], "name": ""}
-        pk_constraint = pk_constraints[0]
-        m = PRIMARY_KEY_RE.match(pk_constraint.condef)
-        colstring = m.group("columns")
-        constrained_columns = SQL_IDENTIFIER_RE.findall(colstring)
-        return {
-            "constrained_columns": constrained_columns,
-            "name": pk_constraint.conname,
-        }
+        return constraints["pk_constraint"]
 
-    @reflection.cache
+    @_reflection_cache
     def get_foreign_keys(self, connection, table_name, schema=None, **kw):
         """
         Return information about foreign keys in `table_name`.
@@ -1143,31 +1584,9 @@ class RedshiftDialectMixin(DefaultDialect):
         constraints = self._get_redshift_constraints(
             connection, table_name, schema, **kw
         )
-        fk_constraints = [c for c in constraints if c.contype == "f"]
-        uniques = defaultdict(lambda: defaultdict(dict))
-        for con in fk_constraints:
-            uniques[con.conname]["key"] = con.conkey
-            uniques[con.conname]["condef"] = con.condef
-        fkeys = []
-        for conname, attrs in uniques.items():
-            m = FOREIGN_KEY_RE.match(attrs["condef"])
-            colstring = m.group("referred_columns")
-            referred_columns = SQL_IDENTIFIER_RE.findall(colstring)
-            referred_table = m.group("referred_table")
-            referred_schema = m.group("referred_schema")
-            colstring = m.group("columns")
-            constrained_columns = SQL_IDENTIFIER_RE.findall(colstring)
-            fkey_d = {
-                "name": conname,
-                "constrained_columns": constrained_columns,
-                "referred_schema": referred_schema,
-                "referred_table": referred_table,
-                "referred_columns": referred_columns,
-            }
-            fkeys.append(fkey_d)
-        return fkeys
+        return constraints["foreign_keys"]
 
-    @reflection.cache
+    @_reflection_cache
     def get_table_names(self, connection, schema=None, **kw):
         """
         Return a list of table names for `schema`.
@@ -1177,7 +1596,7 @@ class RedshiftDialectMixin(DefaultDialect):
         """
         return self._get_table_or_view_names("r", connection, schema, **kw)
 
-    @reflection.cache
+    @_reflection_cache
     def get_view_names(self, connection, schema=None, **kw):
         """
         Return a list of view names for `schema`.
@@ -1187,17 +1606,67 @@ class RedshiftDialectMixin(DefaultDialect):
         """
         return self._get_table_or_view_names("v", connection, schema, **kw)
 
-    @reflection.cache
+    @_reflection_cache
+    def get_materialized_view_names(self, connection, schema=None, **kw):
+        """
+        Return a list of materialized view names for `schema`, as listed in
+        ``svv_mv_info``.
+
+        Overrides interface
+        :meth:`~sqlalchemy.engine.interfaces.Dialect.get_materialized_view_names`.
+        """
+        all_views = self._get_all_materialized_view_info(
+            connection,
+            schema=schema or self.default_schema_name,
+            info_cache=kw.get("info_cache"),
+        )
+        return [key.name for key in all_views]
+
+    @_reflection_cache
     def get_view_definition(self, connection, view_name, schema=None, **kw):
         """Return view definition.
         Given a :class:`.Connection`, a string `view_name`,
         and an optional string `schema`, return the view definition.
 
+        The definitions of all views of the schema listing held in the
+        ``info_cache`` are fetched with one query; without such a listing,
+        those of every view in the schema are.
+
         Overrides interface
         :meth:`~sqlalchemy.engine.interfaces.Dialect.get_view_definition`.
         """
-        view = self._get_redshift_relation(connection, view_name, schema, **kw)
-        return view.view_definition
+        info_cache = kw.get("info_cache")
+        relations = self._get_catalog_info(
+            self._get_all_relation_info,
+            connection,
+            schema=schema,
+            table_names=self._get_filter_table_names([view_name]),
+            info_cache=info_cache,
+        )
+        key = self._get_relation_key(view_name, schema)
+        view = _get_relation_entry(relations, key)
+        if view is None:
+            raise sa_exc.NoSuchTableError(key.unquoted())
+        # Fetch the definitions of all views reflected alongside this one in
+        # a single query, rather than one query per view.
+        pending = None
+        listing = _catalog_cache_key("_get_all_relation_info", view.schema, None)
+        if info_cache is not None and listing in info_cache:
+            pending = {view.relname}
+            pending.update(
+                key.name
+                for key, relation in relations.items()
+                if key.schema == view.schema and relation.relkind in ("v", "m")
+            )
+            pending = tuple(sorted(pending))
+        definitions = self._get_catalog_info(
+            self._get_view_definitions,
+            connection,
+            schema=view.schema,
+            table_names=pending,
+            info_cache=info_cache,
+        )
+        return definitions.get(view.relname)
 
     def get_indexes(
         self,
@@ -1217,7 +1686,7 @@ class RedshiftDialectMixin(DefaultDialect):
         """
         return []
 
-    @reflection.cache
+    @_reflection_cache
     def get_unique_constraints(self, connection, table_name, schema=None, **kw):
         """
         Return information about unique constraints in `table_name`.
@@ -1228,26 +1697,17 @@ class RedshiftDialectMixin(DefaultDialect):
         constraints = self._get_redshift_constraints(
             connection, table_name, schema, **kw
         )
-        constraints = [c for c in constraints if c.contype == "u"]
-        uniques = defaultdict(lambda: defaultdict(dict))
-        for con in constraints:
-            uniques[con.conname]["key"] = con.conkey
-            uniques[con.conname]["cols"][con.attnum] = con.attname
-
-        return [
-            ReflectedUniqueConstraint(
-                name=name, column_names=[uc["cols"][i] for i in uc["key"]]
-            )
-            for name, uc in uniques.items()
-        ]
+        return constraints["unique_constraints"]
 
-    @reflection.cache
+    @_reflection_cache
     def get_table_comment(self, connection, table_name, schema=None, **kw):
         """Return table comment via pg_description.
         Overrides PGDialect.get_table_comment to avoid recursion through
         get_multi_table_comment."""
         schema = schema or self.default_schema_name
-        result = connection.execute(
+        result = self._execute_catalog_query(
+            connection,
+            "get_table_comment",
             sa.text("""
             SELECT d.description
             FROM pg_catalog.pg_description d
@@ -1262,7 +1722,7 @@ class RedshiftDialectMixin(DefaultDialect):
         row = result.fetchone()
         return {"text": row[0] if row else None}
 
-    @reflection.cache
+    @_reflection_cache
     def get_table_options(self, connection, table_name, schema=None, **kw):
         """
         Return a dictionary of options specified when the table of the
@@ -1272,14 +1732,52 @@ class RedshiftDialectMixin(DefaultDialect):
         :meth:`~sqlalchemy.engine.Inspector.get_table_options`.
         """
 
+        table = self._get_redshift_relation(connection, table_name, schema, **kw)
+        columns = self._get_redshift_columns(connection, table_name, schema, **kw)
+        return self._get_table_options(table, columns)
+
+    def get_multi_table_options(
+        self, connection, schema=None, filter_names=None, scope=None, kind=None, **kw
+    ):
+        """
+        Return the options of all relations in `schema`, computed from one
+        relation query and one column query rather than two per table.
+
+        Overrides interface
+        :meth:`~sqlalchemy.engine.interfaces.Dialect.get_multi_table_options`.
+        """
+        relations = self._get_multi_relation_keys(
+            connection, schema, filter_names, scope, kind, **kw
+        )
+        table_names = self._get_filter_table_names(filter_names)
+        all_relations = self._get_catalog_info(
+            self._get_all_relation_info,
+            connection,
+            schema=schema,
+            table_names=table_names,
+            info_cache=kw.get("info_cache"),
+        )
+        all_columns = self._get_catalog_info(
+            self._get_schema_column_info,
+            connection,
+            schema=schema,
+            table_names=table_names,
+            info_cache=kw.get("info_cache"),
+        )
+        for table_key, key in relations:
+            table = _get_relation_entry(all_relations, key)
+            if table is not None:
+                columns = _get_relation_entry(all_columns, key, [])
+                yield table_key, self._get_table_options(table, columns)
+
+    @staticmethod
+    def _get_table_options(table, columns):
         def keyfunc(column):
             num = int(column.sortkey)
             # If sortkey is interleaved, column numbers alternate
             # negative values, so take abs.
             return abs(num)
 
-        table = self._get_redshift_relation(connection, table_name, schema, **kw)
-        columns = self._get_redshift_columns(connection, table_name, schema, **kw)
         sortkey_cols = sorted([col for col in columns if col.sortkey], key=keyfunc)
         interleaved = any([int(col.sortkey) < 0 for col in sortkey_cols])
         sortkey = tuple(col.name for col in sortkey_cols)
@@ -1296,10 +1794,241 @@ class RedshiftDialectMixin(DefaultDialect):
             "redshift_interleaved_sortkey": interleaved_sortkey,
         }
 
+    def get_table_stats(self, connection, table_name, schema=None, **kw):
+        """
+        Return the physical statistics of `table_name` from
+        ``svv_table_info`` as a dictionary with the keys:
+
+        * ``size`` - size in 1 MB blocks
+        * ``tbl_rows`` - number of rows, including rows marked for deletion
+        * ``estimated_visible_rows`` - estimated number of visible rows
+        * ``skew_rows`` - ratio of rows in the slice with the most rows to
+          rows in the slice with the fewest rows
+        * ``unsorted`` - percentage of unsorted rows
+        * ``stats_off`` - how stale the planner statistics are, as a
+          percentage
+        * ``encoded`` - whether any column has compression encoding
+        * ``sortkey1`` - the first column of the sort key, if any
+
+        Return ``None`` if ``svv_table_info`` does not list the table, which
+        it only does for tables with data.
+
+        >>> import sqlalchemy as sa
+        >>> engine = sa.create_engine('redshift+psycopg2://example')
+        >>> insp = sa.inspect(engine)  # doctest: +SKIP
+        >>> stats = insp.get_multi_table_stats(schema='sales')  # doctest: +SKIP
+        >>> to_vacuum = [  # doctest: +SKIP
+        ...     name for (_, name), s in stats.items() if s['unsorted'] > 20
+        ... ]
+        """
+        all_stats = self._get_catalog_info(
+            self._get_all_table_stats,
+            connection,
+            schema=schema,
+            table_names=self._get_filter_table_names([table_name]),
+            info_cache=kw.get("info_cache"),
+        )
+        key = self._get_relation_key(table_name, schema)
+        stats = _get_relation_entry(all_stats, key)
+        return None if stats is None else self._get_table_stats(stats)
+
+    def get_multi_table_stats(self, connection, schema=None, filter_names=None, **kw):
+        """
+        Yield ``((schema, table_name), stats)`` pairs for the tables of
+        `schema` listed in ``svv_table_info``, in the format of
+        :meth:`get_table_stats`, fetched with one query.
+        """
+        all_stats = self._get_catalog_info(
+            self._get_all_table_stats,
+            connection,
+            schema=schema,
+            table_names=self._get_filter_table_names(filter_names),
+            info_cache=kw.get("info_cache"),
+        )
+        effective_schema = schema or self.default_schema_name
+        if filter_names:
+            filter_names = set(filter_names)
+        for key, stats in all_stats.items():
+            if key.schema != effective_schema:
+                continue
+            if filter_names and key.name not in filter_names:
+                continue
+            yield (schema, key.name), self._get_table_stats(stats)
+
+    @staticmethod
+    def _get_table_stats(stats):
+        return {
+            "size": stats.size,
+            "tbl_rows": stats.tbl_rows,
+            "estimated_visible_rows": stats.estimated_visible_rows,
+            "skew_rows": stats.skew_rows,
+            "unsorted": stats.unsorted,
+            "stats_off": stats.stats_off,
+            "encoded": (stats.encoded or "").startswith("Y"),
+            "sortkey1": stats.sortkey1,
+        }
+
+    def get_materialized_view_info(self, connection, view_name, schema=None, **kw):
+        """
+        Return the refresh state of the materialized view `view_name` from
+        ``svv_mv_info`` as a dictionary with the keys:
+
+        * ``is_stale`` - whether base tables changed since the last refresh
+        * ``state`` - the ``svv_mv_info`` state code
+        * ``incremental`` - whether a refresh can be incremental
+          (state 1), rather than a full recompute (state 0)
+        * ``refreshable`` - whether the view can be refreshed at all; states
+          above 100 mean a base table or column was dropped, renamed or
+          changed type
+        * ``autorefresh`` - whether the view is refreshed automatically
+        * ``autorewrite`` - whether queries may be rewritten to use the view
+
+        Raise :class:`~sqlalchemy.exc.NoSuchTableError` if `view_name` is
+        not a materialized view.
+
+        >>> import sqlalchemy as sa
+        >>> from sqlalchemy_redshift.commands import RefreshMaterializedView
+        >>> engine = sa.create_engine('redshift+psycopg2://example')
+        >>> insp = sa.inspect(engine)  # doctest: +SKIP
+        >>> views = insp.get_multi_materialized_view_info(  # doctest: +SKIP
+        ...     schema='sales'
+        ... )
+        >>> with engine.begin() as conn:  # doctest: +SKIP
+        ...     for (_, name), info in views.items():
+        ...         if info['is_stale'] and info['refreshable']:
+        ...             conn.execute(RefreshMaterializedView(f'sales.{name}'))
+        """
+        all_views = self._get_catalog_info(
+            self._get_all_materialized_view_info,
+            connection,
+            schema=schema,
+            table_names=self._get_filter_table_names([view_name]),
+            info_cache=kw.get("info_cache"),
+        )
+        key = self._get_relation_key(view_name, schema)
+        view = _get_relation_entry(all_views, key)
+        if view is None:
+            raise sa_exc.NoSuchTableError(key.unquoted())
+        return self._get_materialized_view_info(view)
+
+    def get_multi_materialized_view_info(
+        self, connection, schema=None, filter_names=None, **kw
+    ):
+        """
+        Yield ``((schema, view_name), info)`` pairs for the materialized
+        views of `schema`, in the format of
+        :meth:`get_materialized_view_info`, fetched with one query.
+        """
+        all_views = self._get_catalog_info(
+            self._get_all_materialized_view_info,
+            connection,
+            schema=schema,
+            table_names=self._get_filter_table_names(filter_names),
+            info_cache=kw.get("info_cache"),
+        )
+        effective_schema = schema or self.default_schema_name
+        if filter_names:
+            filter_names = set(filter_names)
+        for key, view in all_views.items():
+            if key.schema != effective_schema:
+                continue
+            if filter_names and key.name not in filter_names:
+                continue
+            yield (schema, key.name), self._get_materialized_view_info(view)
+
+    @staticmethod
+    def _get_materialized_view_info(view):
+        def as_bool(value):
+            return value in (True, "t", "true", 1)
+
+        state = int(view.state)
+        return {
+            "is_stale": as_bool(view.is_stale),
+            "state": state,
+            "incremental": state == 1,
+            "refreshable": state in (0, 1),
+            "autorefresh": as_bool(view.autorefresh),
+            "autorewrite": as_bool(view.autorewrite),
+        }
+
+    def refresh_reflection_cache(self, connection, schema=None):
+        """
+        Bring the engine-wide reflection cache for `schema` up to date with
+        the catalog, using one fingerprint query for the whole schema.
+
+        Only relations whose fingerprint changed since the previous refresh
+        are invalidated; the cached entries of all other relations stay
+        valid for another ``reflection_cache_ttl`` seconds. Reflecting the
+        schema again then queries the catalog for the changed relations
+        only.
+
+        Return the names of the relations that were created, changed or
+        dropped, or ``None`` on the first refresh of `schema`.
+        """
+        cache = self._require_reflection_cache("refresh_reflection_cache")
+        schema = schema or self.default_schema_name
+        fingerprint = self._get_catalog_fingerprint(connection, schema)
+        return cache.refresh(connection.engine.url.database, schema, fingerprint)
+
+    def save_reflection_snapshot(self, connection, path, schemas=None):
+        """
+        Write the engine-wide reflection cache for `schemas` to the file
+        `path`, together with a catalog fingerprint of each schema.
+
+        By default every schema passed to
+        :meth:`refresh_reflection_cache` is written. The cached entries are
+        taken to match the catalog as of their first refresh (or of this
+        call), so reflect the schemas shortly before saving them.
+
+        >>> import sqlalchemy as sa
+        >>> engine = sa.create_engine(
+        ...     'redshift+psycopg2://example', reflection_cache_ttl=300
+        ... )
+        >>> with engine.connect() as conn:  # doctest: +SKIP
+        ...     sa.MetaData().reflect(conn, schema='sales')
+        ...     engine.dialect.save_reflection_snapshot(
+        ...         conn, 'sales.json.gz', ['sales']
+        ...     )
+        """
+        cache = self._require_reflection_cache("save_reflection_snapshot")
+        database = connection.engine.url.database
+        if schemas is None:
+            schemas = cache.fingerprinted_schemas(database)
+        for schema in schemas:
+            fingerprint = self._get_catalog_fingerprint(connection, schema)
+            cache.refresh(database, schema, fingerprint, assume_current=True)
+        cache.dump(path, database, schemas)
+
+    def load_reflection_snapshot(self, connection, path):
+        """
+        Load a file written by :meth:`save_reflection_snapshot` into the
+        engine-wide reflection cache.
+
+        Each schema in the snapshot is validated against its current catalog
+        fingerprint: entries of relations that changed since the snapshot
+        was written are rejected, and are fetched from the catalog when
+        next reflected. Return a ``{schema: changed_relation_names}``
+        dictionary for the schemas loaded.
+        """
+        cache = self._require_reflection_cache("load_reflection_snapshot")
+        database = connection.engine.url.database
+        return {
+            schema: cache.refresh(
+                database, schema, self._get_catalog_fingerprint(connection, schema)
+            )
+            for schema in cache.load(path, database)
+        }
+
+    def _require_reflection_cache(self, method):
+        if self.reflection_cache is None:
+            raise sa_exc.InvalidRequestError(
+                f"{method}() requires the reflection_cache_ttl engine option"
+            )
+        return self.reflection_cache
+
     def _get_table_or_view_names(self, relkind, connection, schema=None, **kw):
-        default_schema = inspect(connection).default_schema_name
         if not schema:
-            schema = default_schema
+            schema = self.default_schema_name
         info_cache = kw.get("info_cache")
         all_relations = self._get_all_relation_info(
             connection, schema=schema, info_cache=info_cache
@@ -1310,6 +2039,274 @@ class RedshiftDialectMixin(DefaultDialect):
                 relation_names.append(key.name)
         return relation_names
 
+    def _get_multi_relation_keys(
+        self, connection, schema, filter_names, scope, kind, **kw
+    ):
+        """
+        Return ``(table_key, relation_key)`` pairs for the relations that a
+        ``get_multi_*`` call should report on.
+
+        `table_key` is the ``(schema, name)`` tuple SQLAlchemy expects in the
+        result, while `relation_key` is the :class:`RelationKey` used to look
+        the relation up in the catalog dictionaries.
+        """
+        scope = ObjectScope.DEFAULT if scope is None else scope
+        kind = ObjectKind.TABLE if kind is None else kind
+        if ObjectScope.DEFAULT not in scope:
+            # Temporary relations live in pg_temp_* schemas, which the
+            # catalog queries exclude.
+            return []
+
+        effective_schema = schema or self.default_schema_name
+        if filter_names and kind is ObjectKind.ANY and scope is ObjectScope.ANY:
+            # Reflection of named tables, e.g. Table(..., autoload_with=...):
+            # take the names as given rather than listing the schema.
+            names = list(filter_names)
+        else:
+            relkinds = {
+                relkind
+                for object_kind, relkind in RELKINDS_BY_OBJECT_KIND.items()
+                if object_kind in kind
+            }
+            all_relations = self._get_all_relation_info(
+                connection, schema=effective_schema, info_cache=kw.get("info_cache")
+            )
+            names = [
+                key.name
+                for key, relation in all_relations.items()
+                if key.schema == effective_schema and relation.relkind in relkinds
+            ]
+            if filter_names:
+                filter_names = set(filter_names)
+                names = [name for name in names if name in filter_names]
+        return [((schema, name), RelationKey(name, effective_schema)) for name in names]
+
+    def _get_relation_key(self, name, schema=None):
+        """
+        Return the :class:`RelationKey` for `name` in `schema`, or in the
+        dialect's default schema (resolved once when the dialect
+        initializes) instead of inspecting the connection.
+        """
+        return RelationKey(name, schema or self.default_schema_name)
+
+    def _get_catalog_info(self, fetch, connection, schema=None, table_names=None, **kw):
+        """
+        Return the result of the catalog query `fetch` for `table_names` in
+        `schema` (the default schema when not given).
+
+        A schema-wide result already held in the ``info_cache`` is reused
+        rather than running a narrower query. Once
+        ``reflection_prefetch_threshold`` relations of the schema have been
+        requested, the whole schema is fetched instead so that later lookups
+        are served from that one result.
+        """
+        schema = schema or self.default_schema_name
+        info_cache = kw.get("info_cache")
+        if table_names is not None and info_cache is not None:
+            key = _catalog_cache_key(fetch.__name__, schema, None)
+            if key in info_cache:
+                return info_cache[key]
+            if self._should_prefetch(schema, table_names, info_cache):
+                table_names = None
+        return fetch(connection, schema=schema, table_names=table_names, **kw)
+
+    def _should_prefetch(self, schema, table_names, info_cache):
+        threshold = self.reflection_prefetch_threshold
+        if threshold is None:
+            return False
+        requested = info_cache.setdefault(("redshift_prefetch", schema), set())
+        requested.update(RelationKey._unquote(name) for name in table_names)
+        return len(requested) >= threshold
+
+    @staticmethod
+    def _get_filter_table_names(filter_names):
+        """
+        Return the relation names a catalog query should be restricted to,
+        or ``None`` to fetch the whole schema.
+
+        Unquoted variants are included so that lookups can fall back to
+        :meth:`RelationKey.unquoted`.
+        """
+        if not filter_names:
+            return None
+        names = set(filter_names)
+        names.update(RelationKey._unquote(name) for name in filter_names)
+        return tuple(sorted(names))
+
+    @staticmethod
+    def _get_catalog_filter(schema, table_names, table_column):
+        """
+        Build the ``schema_clause`` and ``table_clause`` fragments that
+        restrict a catalog query, along with their bind parameters.
+        """
+        schema_clause = "AND schema = :schema" if schema else ""
+        table_clause = f"AND {table_column} IN :table_names" if table_names else ""
+        params = {}
+        if schema:
+            params["schema"] = schema
+        if table_names:
+            params["table_names"] = list(table_names)
+        return schema_clause, table_clause, params
+
+    @property
+    def reflection_stats(self):
+        """
+        The :class:`~sqlalchemy_redshift.instrumentation.ReflectionStats` to
+        record catalog queries and cache lookups with, or ``None`` when no
+        :meth:`collect_reflection_stats` block is active.
+        """
+        collectors = self._reflection_stats
+        if not collectors:
+            return None
+        if len(collectors) == 1:
+            return collectors[0]
+        return ReflectionStatsGroup(collectors)
+
+    @contextlib.contextmanager
+    def collect_reflection_stats(self, stats=None):
+        """
+        Record the catalog queries run and the reflection cache lookups made
+        through this dialect while the block runs, in `stats` (a new
+        :class:`~sqlalchemy_redshift.instrumentation.ReflectionStats` when
+        not given), which is returned by the context manager.
+
+        The dialect is shared by every connection and thread of the engine,
+        so the queries of all of them are recorded, including those of the
+        worker threads of
+        :func:`~sqlalchemy_redshift.reflection.reflect_schemas`. Blocks may
+        overlap, on one thread or several, and end in any order; each
+        records what ran while it was active.
+
+        >>> import sqlalchemy as sa
+        >>> engine = sa.create_engine('redshift+psycopg2://example')
+        >>> with engine.dialect.collect_reflection_stats() as stats:
+        ...     sa.MetaData().reflect(engine)  # doctest: +SKIP
+        >>> print(stats.report())  # doctest: +SKIP
+        """
+        if stats is None:
+            stats = ReflectionStats()
+        with self._reflection_stats_lock:
+            self._reflection_stats += (stats,)
+        try:
+            yield stats
+        finally:
+            with self._reflection_stats_lock:
+                collectors = list(self._reflection_stats)
+                collectors.remove(stats)
+                self._reflection_stats = tuple(collectors)
+
+    def _execute_catalog_query(self, connection, name, statement, params=None):
+        """
+        Execute the catalog query `name`, recording its wall time, rows and
+        size with ``reflection_stats`` while they are collected.
+
+        The rows are buffered to be counted, then served from a
+        :class:`~sqlalchemy.engine.FrozenResult`.
+        """
+        stats = self.reflection_stats
+        if stats is None:
+            return connection.execute(statement, params)
+        start = time.perf_counter()
+        frozen = connection.execute(statement, params).freeze()
+        elapsed = time.perf_counter() - start
+        rows = frozen.data
+        stats.record_query(name, elapsed, len(rows), _rows_size(rows))
+        return frozen()
+
+    @staticmethod
+    def _catalog_query(sql, params):
+        """
+        Wrap catalog `sql` in a text construct, expanding the ``table_names``
+        parameter produced by :meth:`_get_catalog_filter` when present.
+        """
+        query = sa.text(sql)
+        if "table_names" in params:
+            query = query.bindparams(sa.bindparam("table_names", expanding=True))
+        return query
+
+    # Names that repeat across catalog rows: schemas and tables on every row
+    # of a relation, and column, type and constraint names across relations.
+    _interned_catalog_fields = frozenset(
+        (
+            "schema",
+            "table_name",
+            "relname",
+            "relkind",
+            "diststyle",
+            "owner_name",
+            "name",
+            "encode",
+            "type",
+            "format_type",
+            "contype",
+            "attname",
+            "referred_schema",
+            "referred_table",
+            "referred_attname",
+        )
+    )
+
+    def _compact_catalog_rows(self, result):
+        """
+        Yield the rows of a catalog query `result` as compact named tuples
+        with repeated names interned, to be kept in the reflection caches.
+        """
+        return compact_rows(result, result.keys(), self._interned_catalog_fields)
+
+    def _get_column_infos(self, connection, cols):
+        if self._domains is None:
+            self._domains = self._load_domains(connection)
+        domains = self._domains
+        columns = []
+        for col in cols:
+            column_info = self._get_column_info(
+                name=col.name,
+                format_type=col.format_type,
+                default=col.default,
+                notnull=col.notnull,
+                domains=domains,
+                enums=[],
+                schema=col.schema,
+                encode=col.encode,
+                comment=col.comment,
+            )
+            columns.append(column_info)
+        return columns
+
+    def _reflect_column_type(self, format_type, domains, enums, type_description):
+        """
+        Return the type for `format_type`, parsing each distinct string only
+        once.
+
+        The parsed type is kept as a prototype that is never handed out;
+        every column gets its own deep copy, so that nested state such as
+        the item type of an ``ARRAY`` is not shared either. Types that depend on domains
+        or enums, and unrecognized types (which warn per column), are not
+        memoized, nor is anything when ``type_memo_size`` is 0.
+        """
+        if domains or enums or not self.type_memo_size:
+            return self._reflect_type(
+                format_type,
+                domains,
+                enums,
+                type_description=type_description,
+                collation=None,
+            )
+        prototype = self._type_memo.get(format_type)
+        if prototype is None:
+            prototype = self._reflect_type(
+                format_type, {}, {}, type_description=type_description, collation=None
+            )
+            if isinstance(prototype, NullType):
+                return prototype
+            # The memo is shared by every thread reflecting through this
+            # dialect, e.g. in reflect_schemas.
+            with self._type_memo_lock:
+                if len(self._type_memo) >= self.type_memo_size:
+                    self._type_memo.clear()
+                self._type_memo[format_type] = prototype
+        return copy.deepcopy(prototype)
+
     def _get_column_info(
         self,
         name,
@@ -1325,12 +2322,8 @@ class RedshiftDialectMixin(DefaultDialect):
     ):
         if not self._domains:
             self._domains = domains
-        coltype = self._reflect_type(
-            format_type,
-            domains,
-            enums,
-            type_description=f"column '{name}'",
-            collation=None,
+        coltype = self._reflect_column_type(
+            format_type, domains, enums, type_description=f"column '{name}'"
         )
 
         if isinstance(coltype, VARCHAR) and coltype.length is None:
@@ -1353,49 +2346,172 @@ class RedshiftDialectMixin(DefaultDialect):
 
     def _get_redshift_relation(self, connection, table_name, schema=None, **kw):
         info_cache = kw.get("info_cache")
-        all_relations = self._get_all_relation_info(
-            connection, schema=schema, table_name=table_name, info_cache=info_cache
+        all_relations = self._get_catalog_info(
+            self._get_all_relation_info,
+            connection,
+            schema=schema,
+            table_names=self._get_filter_table_names([table_name]),
+            info_cache=info_cache,
         )
-        key = RelationKey(table_name, schema, connection)
-        if key not in all_relations.keys():
-            key = key.unquoted()
-        try:
-            return all_relations[key]
-        except KeyError as exc:
-            raise sa_exc.NoSuchTableError(key) from exc
+        key = self._get_relation_key(table_name, schema)
+        relation = _get_relation_entry(all_relations, key)
+        if relation is None:
+            raise sa_exc.NoSuchTableError(key.unquoted())
+        return relation
 
     def _get_redshift_columns(self, connection, table_name, schema=None, **kw):
         info_cache = kw.get("info_cache")
-        all_schema_columns = self._get_schema_column_info(
-            connection, schema=schema, table_name=table_name, info_cache=info_cache
+        all_schema_columns = self._get_catalog_info(
+            self._get_schema_column_info,
+            connection,
+            schema=schema,
+            table_names=self._get_filter_table_names([table_name]),
+            info_cache=info_cache,
         )
-        key = RelationKey(table_name, schema, connection)
-        if key not in all_schema_columns.keys():
-            key = key.unquoted()
-        try:
-            return all_schema_columns[key]
-        except KeyError as exc:
-            raise sa_exc.NoSuchTableError(table_name) from exc
+        key = self._get_relation_key(table_name, schema)
+        columns = _get_relation_entry(all_schema_columns, key)
+        if columns is None:
+            raise sa_exc.NoSuchTableError(table_name)
+        return columns
 
     def _get_redshift_constraints(self, connection, table_name, schema=None, **kw):
         info_cache = kw.get("info_cache")
+        all_constraints = self._get_catalog_info(
+            self._get_parsed_constraint_info,
+            connection,
+            schema=schema,
+            table_names=self._get_filter_table_names([table_name]),
+            info_cache=info_cache,
+        )
+        key = self._get_relation_key(table_name, schema)
+        constraints = _get_relation_entry(all_constraints, key)
+        if constraints is None:
+            constraints = self._parse_constraints([])
+        return constraints
+
+    def _get_multi_constraints(
+        self, constraint_type, connection, schema, filter_names, scope, kind, **kw
+    ):
+        relations = self._get_multi_relation_keys(
+            connection, schema, filter_names, scope, kind, **kw
+        )
+        all_constraints = self._get_catalog_info(
+            self._get_parsed_constraint_info,
+            connection,
+            schema=schema,
+            table_names=self._get_filter_table_names(filter_names),
+            info_cache=kw.get("info_cache"),
+        )
+        for table_key, key in relations:
+            constraints = _get_relation_entry(all_constraints, key)
+            if constraints is None:
+                constraints = self._parse_constraints([])
+            yield table_key, constraints[constraint_type]
+
+    @_catalog_cache
+    def _get_parsed_constraint_info(
+        self, connection, schema=None, table_names=None, **kw
+    ):
+        """
+        Parse the rows of :meth:`_get_all_constraint_info` into primary key,
+        foreign key and unique constraint information for every relation.
+
+        Each relation's rows are walked once, so the three ``get_multi_*``
+        constraint methods share a single catalog query and a single parse.
+        """
         all_constraints = self._get_all_constraint_info(
-            connection, schema=schema, table_name=table_name, info_cache=info_cache
+            connection, schema=schema, table_names=table_names, **kw
         )
-        key = RelationKey(table_name, schema, connection)
-        if key not in all_constraints.keys():
-            key = key.unquoted()
-        return all_constraints[key]
+        return RelationIndex(
+            (key, self._parse_constraints(constraints))
+            for key, constraints in all_constraints.items()
+        )
+
+    def _parse_constraints(self, constraints):
+        # Each row pairs one constrained column with, for foreign keys, one
+        # referred column; conkey and confkey give their order.
+        found = {}
+        for con in constraints:
+            if con.conname not in found:
+                found[con.conname] = (con, {}, {})
+            _, columns, referred_columns = found[con.conname]
+            columns.setdefault(con.attnum, con.attname)
+            if con.referred_attnum is not None:
+                referred_columns.setdefault(con.referred_attnum, con.referred_attname)
+
+        pk_constraint = {"constrained_columns": [], "name": ""}
+        fkeys = []
+        uniques = []
+        for conname, (con, columns, referred_columns) in found.items():
+            constrained_columns = [columns[n] for n in con.conkey if n in columns]
+            if con.contype == "p":
+                if not pk_constraint["name"]:
+                    pk_constraint = {
+                        "constrained_columns": constrained_columns,
+                        "name": conname,
+                    }
+            elif con.contype == "f":
+                referred_schema = con.referred_schema
+                if referred_schema == self.default_schema_name:
+                    referred_schema = None
+                fkeys.append(
+                    {
+                        "name": conname,
+                        "constrained_columns": constrained_columns,
+                        "referred_schema": referred_schema,
+                        "referred_table": con.referred_table,
+                        "referred_columns": [
+                            referred_columns[n]
+                            for n in con.confkey
+                            if n in referred_columns
+                        ],
+                    }
+                )
+            elif con.contype == "u":
+                uniques.append(
+                    ReflectedUniqueConstraint(
+                        name=conname, column_names=constrained_columns
+                    )
+                )
 
-    @reflection.cache
-    def _get_all_relation_info(self, connection, **kw):
-        schema = kw.get("schema", None)
-        schema_clause = f"AND schema = '{schema}'" if schema else ""
+        return {
+            "pk_constraint": pk_constraint,
+            "foreign_keys": fkeys,
+            "unique_constraints": uniques,
+        }
+
+    @_catalog_cache
+    def _get_relation_names(self, connection, schema=None, table_names=None, **kw):
+        """
+        Return the names of the relations in `schema` that are among
+        `table_names`, without the view definitions, privileges and owner
+        details that :meth:`_get_all_relation_info` computes.
+        """
+        sql = """
+        SELECT c.relname
+        FROM pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relkind IN ('r', 'v', 'm', 'S', 'f')
+          AND n.nspname = :schema AND c.relname IN :table_names
+        UNION ALL
+        SELECT tablename AS "relname"
+        FROM svv_external_tables
+        WHERE schemaname = :schema AND tablename IN :table_names
+        """
+        params = {"schema": schema, "table_names": list(table_names)}
+        result = self._execute_catalog_query(
+            connection, "_get_relation_names", self._catalog_query(sql, params), params
+        )
+        return frozenset(row.relname for row in result)
 
-        table_name = kw.get("table_name", None)
-        table_clause = f"AND relname = '{table_name}'" if table_name else ""
+    @_catalog_cache
+    @_shared_catalog_cache
+    def _get_all_relation_info(self, connection, schema=None, table_names=None, **kw):
+        schema_clause, table_clause, params = self._get_catalog_filter(
+            schema, table_names, "relname"
+        )
 
-        result = connection.execute(sa.text(f"""
+        sql = f"""
         SELECT
           c.relkind,
           n.oid as "schema_oid",
@@ -1407,12 +2523,13 @@ class RedshiftDialectMixin(DefaultDialect):
             AS "diststyle",
           c.relowner AS "owner_id",
           u.usename AS "owner_name",
-          TRIM(TRAILING ';' FROM pg_catalog.pg_get_viewdef(c.oid, true))
-            AS "view_definition",
-          pg_catalog.array_to_string(c.relacl, '\n') AS "privileges"
+          pg_catalog.array_to_string(c.relacl, '\n') AS "privileges",
+          d.description AS "comment"
         FROM pg_catalog.pg_class c
              LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
              JOIN pg_catalog.pg_user u ON u.usesysid = c.relowner
+             LEFT JOIN pg_catalog.pg_description d
+               ON d.objoid = c.oid AND d.objsubid = 0
         WHERE c.relkind IN ('r', 'v', 'm', 'S', 'f')
           AND n.nspname !~ '^pg_' {schema_clause} {table_clause}
         UNION
@@ -1425,64 +2542,152 @@ class RedshiftDialectMixin(DefaultDialect):
             null AS "diststyle",
             s.esowner AS "owner_id",
             u.usename AS "owner_name",
-            null AS "view_definition",
-            null AS "privileges"
+            null AS "privileges",
+            null AS "comment"
         FROM
             svv_external_tables t
             JOIN svv_external_schemas s ON s.schemaname = t.schemaname
             JOIN pg_catalog.pg_user u ON u.usesysid = s.esowner
         where 1 {schema_clause} {table_clause}
         ORDER BY "relkind", "schema_oid", "schema";
-        """))
-        relations = {}
-        for rel in result:
-            key = RelationKey(rel.relname, rel.schema, connection)
-            relations[key] = rel
-        return relations
-
-    # We fetch column info an entire schema at a time to improve performance
-    # when reflecting schema for multiple tables at once.
-    @reflection.cache
-    def _get_schema_column_info(self, connection, **kw):
-        schema = kw.get("schema", None)
-        schema_clause = f"AND schema = '{schema}'" if schema else ""
-
-        table_name = kw.get("table_name", None)
-        table_clause = f"AND table_name = '{table_name}'" if table_name else ""
-
-        all_columns = defaultdict(list)
-        result = connection.execute(
-            sa.text(
-                REFLECTION_SQL.format(
-                    schema_clause=schema_clause, table_clause=table_clause
-                )
-            )
+        """
+        result = self._execute_catalog_query(
+            connection,
+            "_get_all_relation_info",
+            self._catalog_query(sql, params),
+            params,
+        )
+        return RelationIndex(
+            (RelationKey(rel.relname, rel.schema), rel)
+            for rel in self._compact_catalog_rows(result)
+        )
+
+    @_catalog_cache
+    def _get_view_definitions(self, connection, schema=None, table_names=None, **kw):
+        """
+        Return a ``{view_name: definition}`` dictionary for the views among
+        `table_names` (or, when ``None``, all views) in `schema`.
+
+        View definitions can be large, so they are left out of
+        :meth:`_get_all_relation_info` and only fetched by
+        :meth:`get_view_definition`.
+        """
+        table_clause = "AND c.relname IN :table_names" if table_names else ""
+        sql = f"""
+        SELECT
+          c.relname,
+          TRIM(TRAILING ';' FROM pg_catalog.pg_get_viewdef(c.oid, true))
+            AS "view_definition"
+        FROM pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relkind IN ('v', 'm') AND n.nspname = :schema {table_clause}
+        """
+        params = {"schema": schema}
+        if table_names:
+            params["table_names"] = list(table_names)
+        result = self._execute_catalog_query(
+            connection,
+            "_get_view_definitions",
+            self._catalog_query(sql, params),
+            params,
         )
+        return {row.relname: row.view_definition for row in result}
 
-        for col in result:
-            key = RelationKey(col.table_name, col.schema, connection)
-            all_columns[key].append(col)
+    @_reflection_cache
+    def _get_column_sources(self, connection, schema, **kw):
+        """
+        Return which parts of :data:`REFLECTION_SQL` can yield columns for
+        `schema`: ``("external",)`` for an external schema, otherwise
+        ``"local"`` plus ``"late_binding_views"`` if the schema has views.
+
+        ``pg_get_late_binding_view_cols()`` materializes the columns of
+        every late-binding view in the cluster, so it is skipped for
+        schemas without views.
+        """
+        if schema is None:
+            return tuple(COLUMN_SOURCES_SQL)
+        info_cache = kw.get("info_cache")
+        if schema in self._get_external_schemas(connection, info_cache=info_cache):
+            return ("external",)
+        relations = None
+        if info_cache is not None:
+            key = _catalog_cache_key("_get_all_relation_info", schema, None)
+            relations = info_cache.get(key)
+        if relations is not None:
+            has_views = any(rel.relkind == "v" for rel in relations.values())
+        else:
+            result = self._execute_catalog_query(
+                connection,
+                "_get_column_sources",
+                sa.text("""
+                SELECT 1
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE c.relkind = 'v' AND n.nspname = :schema
+                LIMIT 1
+                """),
+                {"schema": schema},
+            )
+            has_views = result.first() is not None
+        if has_views:
+            return ("local", "late_binding_views")
+        return ("local",)
+
+    @_reflection_cache
+    def _get_external_schemas(self, connection, **kw):
+        result = self._execute_catalog_query(
+            connection,
+            "_get_external_schemas",
+            sa.text("SELECT schemaname FROM svv_external_schemas"),
+        )
+        return frozenset(row.schemaname for row in result)
+
+    # Column info is fetched an entire schema at a time by get_multi_columns,
+    # and by the single-table helpers once reflection_prefetch_threshold
+    # relations of a schema have been requested (see _get_catalog_info).
+    @_catalog_cache
+    @_shared_catalog_cache
+    def _get_schema_column_info(self, connection, schema=None, table_names=None, **kw):
+        schema_clause, table_clause, params = self._get_catalog_filter(
+            schema, table_names, "table_name"
+        )
 
-        return dict(all_columns)
+        sources = self._get_column_sources(
+            connection, schema, info_cache=kw.get("info_cache")
+        )
+        sql = _get_reflection_sql(sources).format(
+            schema_clause=schema_clause, table_clause=table_clause
+        )
+        result = self._execute_catalog_query(
+            connection,
+            "_get_schema_column_info",
+            self._catalog_query(sql, params),
+            params,
+        )
 
-    @reflection.cache
-    def _get_all_constraint_info(self, connection, **kw):
-        schema = kw.get("schema", None)
-        schema_clause = f"AND schema = '{schema}'" if schema else ""
+        return _group_by_relation(self._compact_catalog_rows(result))
 
-        table_name = kw.get("table_name", None)
-        table_clause = f"AND table_name = '{table_name}'" if table_name else ""
+    @_catalog_cache
+    @_shared_catalog_cache
+    def _get_all_constraint_info(self, connection, schema=None, table_names=None, **kw):
+        schema_clause, table_clause, params = self._get_catalog_filter(
+            schema, table_names, "table_name"
+        )
 
-        result = connection.execute(sa.text(f"""
+        sql = f"""
         SELECT
           n.nspname as "schema",
           c.relname as "table_name",
           t.contype,
           t.conname,
           t.conkey,
+          t.confkey,
           a.attnum,
           a.attname,
-          pg_catalog.pg_get_constraintdef(t.oid, true)::varchar(512) as condef,
+          fn.nspname as "referred_schema",
+          fc.relname as "referred_table",
+          fa.attnum as "referred_attnum",
+          fa.attname as "referred_attname",
           n.oid as "schema_oid",
           c.oid as "rel_oid"
         FROM pg_catalog.pg_class c
@@ -1492,17 +2697,28 @@ class RedshiftDialectMixin(DefaultDialect):
           ON t.conrelid = c.oid
         JOIN pg_catalog.pg_attribute a
           ON t.conrelid = a.attrelid AND a.attnum = ANY(t.conkey)
-        WHERE n.nspname !~ '^pg_' {schema_clause} {table_clause}
-        UNION
+        LEFT JOIN pg_catalog.pg_class fc
+          ON fc.oid = t.confrelid
+        LEFT JOIN pg_catalog.pg_namespace fn
+          ON fn.oid = fc.relnamespace
+        LEFT JOIN pg_catalog.pg_attribute fa
+          ON fa.attrelid = t.confrelid AND fa.attnum = ANY(t.confkey)
+        WHERE n.nspname !~ '^pg_'
+          AND t.contype IN ('p', 'u', 'f') {schema_clause} {table_clause}
+        UNION ALL
         SELECT
             s.schemaname AS "schema",
             c.tablename AS "table_name",
             'p' as "contype",
             c.tablename || '_pkey' as "conname",
             array[1::SMALLINT] as "conkey",
-            1 as "attnum",
+            null::SMALLINT[] as "confkey",
+            c.columnnum as "attnum",
             c.columnname as "attname",
-            'PRIMARY KEY (' || c.columnname  || ')'::VARCHAR(512) as "condef",
+            null as "referred_schema",
+            null as "referred_table",
+            null as "referred_attnum",
+            null as "referred_attname",
             s.esoid AS "schema_oid",
             null AS "rel_oid"
         FROM
@@ -1510,12 +2726,207 @@ class RedshiftDialectMixin(DefaultDialect):
             JOIN svv_external_schemas s ON s.schemaname = c.schemaname
         where 1 {schema_clause} {table_clause}
         ORDER BY "schema", "table_name"
-        """))
-        all_constraints = defaultdict(list)
-        for con in result:
-            key = RelationKey(con.table_name, con.schema, connection)
-            all_constraints[key].append(con)
-        return all_constraints
+        """
+        result = self._execute_catalog_query(
+            connection,
+            "_get_all_constraint_info",
+            self._catalog_query(sql, params),
+            params,
+        )
+        return _group_by_relation(self._compact_catalog_rows(result))
+
+    @_catalog_cache
+    @_shared_catalog_cache
+    def _get_all_check_constraint_info(
+        self, connection, schema=None, table_names=None, **kw
+    ):
+        schema_clause, table_clause, params = self._get_catalog_filter(
+            schema, table_names, "table_name"
+        )
+
+        sql = f"""
+        SELECT
+          n.nspname AS "schema",
+          c.relname AS "table_name",
+          t.conname AS "name",
+          pg_catalog.pg_get_constraintdef(t.oid) AS "src"
+        FROM pg_catalog.pg_constraint t
+        JOIN pg_catalog.pg_class c
+          ON c.oid = t.conrelid
+        JOIN pg_catalog.pg_namespace n
+          ON n.oid = c.relnamespace
+        WHERE t.contype = 'c'
+          AND n.nspname !~ '^pg_' {schema_clause} {table_clause}
+        ORDER BY "schema", "table_name", "name"
+        """
+        result = self._execute_catalog_query(
+            connection,
+            "_get_all_check_constraint_info",
+            self._catalog_query(sql, params),
+            params,
+        )
+        return _group_by_relation(self._compact_catalog_rows(result))
+
+    # Statistics change with every load, so they are only cached per
+    # inspector and never in the engine-wide reflection cache.
+    @_catalog_cache
+    def _get_all_table_stats(self, connection, schema=None, table_names=None, **kw):
+        schema_clause, table_clause, params = self._get_catalog_filter(
+            schema, table_names, '"table"'
+        )
+
+        sql = f"""
+        SELECT
+          "schema",
+          "table" AS "table_name",
+          size,
+          tbl_rows,
+          estimated_visible_rows,
+          skew_rows,
+          unsorted,
+          stats_off,
+          encoded,
+          sortkey1
+        FROM svv_table_info
+        WHERE 1 {schema_clause} {table_clause}
+        ORDER BY "schema", "table_name"
+        """
+        result = self._execute_catalog_query(
+            connection, "_get_all_table_stats", self._catalog_query(sql, params), params
+        )
+        return RelationIndex(
+            (RelationKey(row.table_name, row.schema), row)
+            for row in self._compact_catalog_rows(result)
+        )
+
+    # Like table statistics, refresh state changes with every load and is
+    # only cached per inspector.
+    @_catalog_cache
+    def _get_all_materialized_view_info(
+        self, connection, schema=None, table_names=None, **kw
+    ):
+        schema_clause, table_clause, params = self._get_catalog_filter(
+            schema, table_names, "name"
+        )
+
+        sql = f"""
+        SELECT
+          "schema",
+          name AS "table_name",
+          is_stale,
+          state,
+          autorefresh,
+          autorewrite
+        FROM svv_mv_info
+        WHERE database_name = current_database() {schema_clause} {table_clause}
+        ORDER BY "schema", "table_name"
+        """
+        result = self._execute_catalog_query(
+            connection,
+            "_get_all_materialized_view_info",
+            self._catalog_query(sql, params),
+            params,
+        )
+        return RelationIndex(
+            (RelationKey(row.table_name, row.schema), row)
+            for row in self._compact_catalog_rows(result)
+        )
+
+    def _get_catalog_fingerprint(self, connection, schema):
+        """
+        Return a ``{relation_name: checksum}`` dictionary for `schema`.
+
+        The checksum combines the ``pg_class`` entry of a relation with sums
+        of MD5 hashes over the text of its attributes, constraints and
+        comments (or of its ``svv_external_columns`` rows for external
+        tables), so renaming a column or editing a comment changes it even
+        when the lengths stay the same.
+        """
+        sql = """
+        SELECT
+          c.relname,
+          c.relkind,
+          c.oid AS "rel_oid",
+          c.relfilenode,
+          c.relnatts,
+          c.relchecks,
+          c.relowner,
+          c.reldiststyle,
+          a.attributes,
+          a.attribute_checksum,
+          t.constraints,
+          t.constraint_checksum,
+          d.comment_checksum,
+          CASE WHEN c.relkind = 'v'
+            THEN MD5(pg_catalog.pg_get_viewdef(c.oid, true)) END
+            AS "view_checksum"
+        FROM pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n
+          ON n.oid = c.relnamespace
+        LEFT JOIN (
+          SELECT
+            att.attrelid,
+            COUNT(*) AS "attributes",
+            SUM(STRTOL(LEFT(MD5(
+              att.attnum || ':' || att.attname
+              || ':' || pg_catalog.format_type(att.atttypid, att.atttypmod)
+              || ':' || CASE WHEN att.attnotnull THEN 't' ELSE 'f' END
+              || ':' || CASE WHEN att.attisdistkey THEN 't' ELSE 'f' END
+              || ':' || att.attencodingtype || ':' || att.attsortkeyord
+              || ':' || COALESCE(pg_catalog.pg_get_expr(ad.adbin, ad.adrelid), '')
+            ), 8), 16))::bigint AS "attribute_checksum"
+          FROM pg_catalog.pg_attribute att
+          LEFT JOIN pg_catalog.pg_attrdef ad
+            ON ad.adrelid = att.attrelid AND ad.adnum = att.attnum
+          WHERE att.attnum > 0 AND NOT att.attisdropped
+          GROUP BY att.attrelid
+        ) a ON a.attrelid = c.oid
+        LEFT JOIN (
+          SELECT
+            conrelid,
+            COUNT(*) AS "constraints",
+            SUM(STRTOL(LEFT(MD5(
+              conname || ':' || pg_catalog.pg_get_constraintdef(oid)
+            ), 8), 16))::bigint AS "constraint_checksum"
+          FROM pg_catalog.pg_constraint
+          GROUP BY conrelid
+        ) t ON t.conrelid = c.oid
+        LEFT JOIN (
+          SELECT
+            objoid,
+            SUM(STRTOL(LEFT(MD5(objsubid || ':' || description), 8), 16))::bigint
+              AS "comment_checksum"
+          FROM pg_catalog.pg_description
+          GROUP BY objoid
+        ) d ON d.objoid = c.oid
+        WHERE c.relkind IN ('r', 'v', 'm', 'S', 'f') AND n.nspname = :schema
+        UNION ALL
+        SELECT
+          tablename AS "relname",
+          'r' AS "relkind",
+          NULL AS "rel_oid",
+          NULL AS "relfilenode",
+          NULL AS "relnatts",
+          NULL AS "relchecks",
+          NULL AS "relowner",
+          NULL AS "reldiststyle",
+          COUNT(*) AS "attributes",
+          SUM(STRTOL(LEFT(MD5(
+            columnnum || ':' || columnname || ':' || external_type
+            || ':' || COALESCE(part_key, 0)
+          ), 8), 16))::bigint AS "attribute_checksum",
+          NULL AS "constraints",
+          NULL AS "constraint_checksum",
+          NULL AS "comment_checksum",
+          NULL AS "view_checksum"
+        FROM svv_external_columns
+        WHERE schemaname = :schema
+        GROUP BY tablename
+        """
+        result = self._execute_catalog_query(
+            connection, "_get_catalog_fingerprint", sa.text(sql), {"schema": schema}
+        )
+        return {row.relname: tuple(row)[1:] for row in result}
 
     def _set_backslash_escapes(self, connection):
         self._backslash_escapes = False
@@ -1558,7 +2969,7 @@ class Psycopg2RedshiftDialectMixin(RedshiftDialectMixin):
 
 
 class RedshiftDialect_psycopg2(Psycopg2RedshiftDialectMixin, PGDialect_psycopg2):
-    supports_statement_cache = False
+    supports_statement_cache = True
 
 
 # Add RedshiftDialect synonym for backwards compatibility.
@@ -1568,22 +2979,25 @@ RedshiftDialect = RedshiftDialect_psycopg2
 class RedshiftDialect_psycopg2cffi(
     Psycopg2RedshiftDialectMixin, PGDialect_psycopg2cffi
 ):
-    supports_statement_cache = False
+    supports_statement_cache = True
 
 
 class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
 
     class RedshiftCompiler_redshift_connector(RedshiftCompiler, PGCompiler):
         def limit_clause(self, select, **kw):
+            # redshift_connector does not accept bound LIMIT and OFFSET
+            # values, so they are rendered inline. literal_execute renders
+            # them when the statement is executed rather than compiled, so
+            # the compiled form can be cached for any limit and offset.
+            kw["literal_execute"] = True
             text = ""
             if select._limit_clause is not None:
-                # an integer value for limit is retrieved
-                text += " \n LIMIT " + str(select._limit)
+                text += " \n LIMIT " + self.process(select._limit_clause, **kw)
             if select._offset_clause is not None:
                 if select._limit_clause is None:
                     text += "\n LIMIT ALL"
-                # an integer value for offset is retrieved
-                text += " OFFSET " + str(select._offset)
+                text += " OFFSET " + self.process(select._offset_clause, **kw)
             return text
 
         def visit_mod_binary(self, binary, operator, **kw):
@@ -1620,7 +3034,7 @@ class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
     statement_compiler = RedshiftCompiler_redshift_connector
     execution_ctx_cls = RedshiftExecutionContext_redshift_connector
 
-    supports_statement_cache = False
+    supports_statement_cache = True
     use_setinputsizes = False  # not implemented in redshift_connector
 
     def __init__(self, client_encoding=None, **kwargs):
@@ -1756,16 +3170,26 @@ def gen_columns_from_children(root):
     """
     Generates columns that are being used in child elements of the delete query
     this will be used to determine tables for the using clause.
-    :param root: the delete query
+
+    The clause is walked depth-first without recursion, so that wide or deeply
+    nested predicates don't reach the recursion limit, and columns are
+    generated in the order in which they appear. Nested selects are not
+    entered: the tables they use belong to their own ``FROM`` clause. Bound
+    parameters have no columns and are skipped.
+
+    :param root: the delete query or its where clause
     :return: a generator of columns
     """
-    if isinstance(root, (Delete, BinaryExpression, BooleanClauseList)):
-        for child in root.get_children():
-            yc = gen_columns_from_children(child)
-            for it in yc:
-                yield it
-    elif isinstance(root, sa.Column):
-        yield root
+    stack = [root]
+    while stack:
+        element = stack.pop()
+        if isinstance(element, ColumnClause):
+            if element.table is not None:
+                yield element
+        elif not isinstance(element, (BindParameter, SelectBase)):
+            children = list(element.get_children())
+            children.reverse()
+            stack.extend(children)
 
 
 @compiles(Delete, "redshift")
@@ -1847,12 +3271,17 @@ def visit_delete_stmt(element, compiler, **kwargs):
             whereclause = f" WHERE {compiler.process(*whereclause_tuple, **kwargs)}"
 
     if whereclause:
-        usingclause_tables = []
-        whereclause_columns = gen_columns_from_children(element)
-        for col in whereclause_columns:
+        # Each table, alias or subquery is rendered once, however many of its
+        # columns the where clause uses.
+        seen_tables = {element.table}
+        usingclause_tables = {}
+        for col in gen_columns_from_children(element.whereclause):
+            if col.table in seen_tables:
+                continue
+            seen_tables.add(col.table)
             table = compiler.process(col.table, asfrom=True, **kwargs)
-            if table != delete_stmt_table and table not in usingclause_tables:
-                usingclause_tables.append(table)
+            if table != delete_stmt_table:
+                usingclause_tables[table] = None
         if usingclause_tables:
             usingclause = f" USING {', '.join(usingclause_tables)}"
 
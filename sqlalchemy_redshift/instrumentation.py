@@ -0,0 +1,147 @@
+import threading
+
+
+class QueryStats:
+    """
+    Totals for one kind of catalog query, as recorded by
+    :class:`ReflectionStats`.
+    """
+
+    __slots__ = ("count", "time", "max_time", "rows", "bytes")
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        self.max_time = 0.0
+        self.rows = 0
+        self.bytes = 0
+
+    def __repr__(self):
+        return (
+            f"QueryStats(count={self.count}, time={self.time:.6f}, "
+            f"rows={self.rows}, bytes={self.bytes})"
+        )
+
+
+class ReflectionStats:
+    """
+    Thread-safe counters of the catalog queries and cache lookups made while
+    reflecting a Redshift database.
+
+    Collect them with
+    :meth:`~sqlalchemy_redshift.dialect.RedshiftDialectMixin.collect_reflection_stats`,
+    which records every catalog query the dialect runs (its wall time, the
+    rows it returned and their approximate size in bytes), and the hits and
+    misses of the per-inspector ``info_cache`` and of the engine-wide
+    :class:`~sqlalchemy_redshift.cache.ReflectionCache`.
+
+    >>> stats = ReflectionStats()
+    >>> stats.record_query('_get_schema_column_info', 0.25, rows=1200, nbytes=48000)
+    >>> stats.record_cache('info_cache', 'get_columns', hit=False)
+    >>> stats.record_cache('info_cache', 'get_columns', hit=True)
+    >>> stats.record_cache('info_cache', 'get_columns', hit=True)
+    >>> print(stats.report())
+    query                         count   time (s)     rows    bytes
+    _get_schema_column_info           1      0.250     1200    48000
+    total                             1      0.250     1200    48000
+    <BLANKLINE>
+    cache             lookup                        hits  misses  hit ratio
+    info_cache        get_columns                      2       1      66.7%
+    """
+
+    def __init__(self):
+        self.queries = {}
+        self.cache = {}
+        self._lock = threading.Lock()
+
+    def record_query(self, name, elapsed, rows=0, nbytes=0):
+        """
+        Record that the catalog query `name` took `elapsed` seconds and
+        returned `rows` rows of about `nbytes` bytes.
+        """
+        with self._lock:
+            query = self.queries.get(name)
+            if query is None:
+                query = self.queries[name] = QueryStats()
+            query.count += 1
+            query.time += elapsed
+            query.max_time = max(query.max_time, elapsed)
+            query.rows += rows
+            query.bytes += nbytes
+
+    def record_cache(self, cache, name, hit):
+        """
+        Record a hit (or a miss) for the lookup `name` in `cache`, either
+        ``"info_cache"`` or ``"reflection_cache"``.
+        """
+        with self._lock:
+            counts = self.cache.setdefault((cache, name), [0, 0])
+            counts[0 if hit else 1] += 1
+
+    @property
+    def total_time(self):
+        """Total wall time spent in catalog queries, in seconds."""
+        return sum(query.time for query in self.queries.values())
+
+    def hit_ratio(self, cache=None):
+        """
+        Return the fraction of lookups in `cache` (or in every cache) that
+        were hits, or ``None`` if there were none.
+        """
+        hits = misses = 0
+        for (key_cache, _), (key_hits, key_misses) in self.cache.items():
+            if cache is None or key_cache == cache:
+                hits += key_hits
+                misses += key_misses
+        if not hits + misses:
+            return None
+        return hits / (hits + misses)
+
+    def report(self):
+        """
+        Return a plain-text summary of the queries, slowest first, and of
+        the cache lookups.
+        """
+        lines = [f"{'query':<28}{'count':>7}{'time (s)':>11}{'rows':>9}{'bytes':>9}"]
+        queries = sorted(self.queries.items(), key=lambda item: -item[1].time)
+        for name, query in queries:
+            lines.append(
+                f"{name:<28}{query.count:>7}{query.time:>11.3f}"
+                f"{query.rows:>9}{query.bytes:>9}"
+            )
+        lines.append(
+            f"{'total':<28}"
+            f"{sum(query.count for _, query in queries):>7}"
+            f"{self.total_time:>11.3f}"
+            f"{sum(query.rows for _, query in queries):>9}"
+            f"{sum(query.bytes for _, query in queries):>9}"
+        )
+        if self.cache:
+            lines.append("")
+            lines.append(
+                f"{'cache':<18}{'lookup':<28}{'hits':>6}{'misses':>8}{'hit ratio':>11}"
+            )
+            for (cache, name), (hits, misses) in sorted(self.cache.items()):
+                ratio = hits / (hits + misses)
+                lines.append(f"{cache:<18}{name:<28}{hits:>6}{misses:>8}{ratio:>11.1%}")
+        return "\n".join(lines)
+
+
+class ReflectionStatsGroup:
+    """
+    Record into each of several :class:`ReflectionStats` at once, for
+    collections that overlap.
+    """
+
+    __slots__ = ("members",)
+
+    def __init__(self, members):
+        self.members = tuple(members)
+
+    def record_query(self, name, elapsed, rows=0, nbytes=0):
+        for stats in self.members:
+            stats.record_query(name, elapsed, rows, nbytes)
+
+    def record_cache(self, cache, name, hit):
+        for stats in self.members:
+            stats.record_cache(cache, name, hit)
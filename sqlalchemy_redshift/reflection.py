@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import sqlalchemy as sa
+
+
+def reflect_schemas(engine, schemas, metadata=None, max_workers=None, **kw):
+    """
+    Reflect `schemas` concurrently into a single
+    :class:`~sqlalchemy.schema.MetaData`.
+
+    Catalog queries against the leader node are bound by latency rather
+    than CPU, so each schema is reflected with
+    :meth:`~sqlalchemy.schema.MetaData.reflect` on its own pooled connection
+    and in its own thread. The per-schema results are then merged into
+    `metadata` (a new :class:`~sqlalchemy.schema.MetaData` when not given),
+    which is returned. Tables already present in `metadata` are kept.
+
+    `max_workers` defaults to the number of schemas, capped at the number
+    of connections the engine's pool can hand out at once: its size plus
+    its ``max_overflow``, or no cap when the overflow is unlimited. Further
+    keyword arguments, such as ``views=True`` or ``only=[...]``, are passed
+    to :meth:`~sqlalchemy.schema.MetaData.reflect`.
+
+    >>> import sqlalchemy as sa
+    >>> from sqlalchemy_redshift.reflection import reflect_schemas
+    >>> engine = sa.create_engine('redshift+psycopg2://example')
+    >>> metadata = reflect_schemas(  # doctest: +SKIP
+    ...     engine, ['sales', 'marketing'], max_workers=2
+    ... )
+    """
+    if metadata is None:
+        metadata = sa.MetaData()
+    schemas = list(schemas)
+    if not schemas:
+        return metadata
+    if max_workers is None:
+        max_workers = len(schemas)
+        pool_size = getattr(engine.pool, "size", None)
+        max_overflow = getattr(engine.pool, "_max_overflow", 0)
+        if pool_size is not None and max_overflow >= 0:
+            max_workers = min(max_workers, pool_size() + max_overflow)
+
+    def reflect(schema):
+        schema_metadata = sa.MetaData()
+        with engine.connect() as connection:
+            schema_metadata.reflect(connection, schema=schema, **kw)
+        return schema_metadata
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        reflected = list(executor.map(reflect, schemas))
+
+    # Tables of other schemas are reflected too when they are referenced by
+    # a foreign key; prefer the copy reflected from the table's own schema.
+    for own_schema in (True, False):
+        for schema, schema_metadata in zip(schemas, reflected):
+            for key, table in schema_metadata.tables.items():
+                if (table.schema == schema) is own_schema and (
+                    key not in metadata.tables
+                ):
+                    table.to_metadata(metadata)
+    return metadata
@@ -334,3 +334,73 @@ def stub_redshift_engine(redshift_dialect_flavor):
 @pytest.fixture(scope="session")
 def stub_redshift_dialect(stub_redshift_engine):
     yield stub_redshift_engine.dialect
+
+
+class FakeResult(list):
+    """
+    Rows returned by :class:`FakeConnection`, counting how many have been
+    read so that tests can check how far a result has been consumed.
+    """
+
+    def __init__(self, rows=()):
+        super().__init__(rows)
+        self.consumed = 0
+
+    def keys(self):
+        return getattr(self[0], "_fields", ()) if self else ()
+
+    def first(self):
+        return self[0] if self else None
+
+    def __iter__(self):
+        for row in super().__iter__():
+            self.consumed += 1
+            yield row
+
+
+class FakeConnection:
+    """
+    A stand-in for a connection in catalog query tests.
+
+    Each executed statement is recorded, as ``(sql, params)`` in
+    `statements` and with its execution options in `execution_options`, and
+    answered with the rows of the first of `routes` whose text appears in
+    the SQL, or with `rows`. Rows may be given as a callable returning them.
+    """
+
+    def __init__(self, rows=(), routes=None):
+        self.rows = rows
+        self.routes = routes or {}
+        self.statements = []
+        self.statement_options = []
+        self.results = []
+        self._options = {}
+
+    @property
+    def consumed(self):
+        return sum(result.consumed for result in self.results)
+
+    def get_execution_options(self):
+        return dict(self._options)
+
+    def execution_options(self, **options):
+        # Like Connection.execution_options, changes the connection in place.
+        self._options.update(options)
+        return self
+
+    def execute(self, statement, params=None, execution_options=None):
+        sql = str(statement)
+        self.statements.append((sql, params))
+        self.statement_options.append(dict(execution_options or {}))
+        rows = next(
+            (rows for text, rows in self.routes.items() if text in sql), self.rows
+        )
+        result = FakeResult(rows() if callable(rows) else rows)
+        self.results.append(result)
+        return result
+
+
+@pytest.fixture
+def fake_connection():
+    """Return the :class:`FakeConnection` factory."""
+    return FakeConnection
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 from packaging.version import Version
@@ -5,6 +6,7 @@ import sqlalchemy as sa
 from sqlalchemy.types import VARCHAR, NullType
 
 from sqlalchemy_redshift.dialect import (
+    TIMESTAMPTZ,
     RedshiftDialect_psycopg2,
     RedshiftDialect_psycopg2cffi,
 )
@@ -46,3 +48,77 @@ class TestColumnReflection(TestCase):
                 identity=None,
             )
             assert isinstance(varchar_info["type"], VARCHAR)
+
+    def _column_type(self, dialect, format_type):
+        return dialect._get_column_info(
+            name="column",
+            format_type=format_type,
+            default=None,
+            notnull=False,
+            domains={},
+            enums=[],
+            schema="default",
+        )["type"]
+
+    def test_type_memo(self):
+        """
+        Each format_type is parsed once; columns get distinct copies
+        """
+        dialect = RedshiftDialect_psycopg2()
+        for format_type in [
+            "character varying(256)",
+            "numeric(18,4)",
+            "timestamp with time zone",
+            "geometry",
+            "super",
+            "hllsketch",
+        ]:
+            first = self._column_type(dialect, format_type)
+            second = self._column_type(dialect, format_type)
+            assert first is not second
+            assert type(first) is type(second)
+            assert repr(first) == repr(second)
+            assert format_type in dialect._type_memo
+
+        assert self._column_type(dialect, "numeric(18,4)").scale == 4
+        assert isinstance(
+            self._column_type(dialect, "timestamp with time zone"), TIMESTAMPTZ
+        )
+
+    def test_type_memo_copies_nested_types(self):
+        dialect = RedshiftDialect_psycopg2()
+        format_type = "character varying(10)[]"
+        first = self._column_type(dialect, format_type)
+        first.item_type.length = 20
+        assert self._column_type(dialect, format_type).item_type.length == 10
+
+    def test_type_memo_is_bounded(self):
+        dialect = RedshiftDialect_psycopg2()
+        dialect.type_memo_size = 2
+        for length in range(1, 6):
+            self._column_type(dialect, f"character varying({length})")
+            assert len(dialect._type_memo) <= 2
+
+    def test_type_memo_shared_across_threads(self):
+        dialect = RedshiftDialect_psycopg2()
+        dialect.type_memo_size = 3
+
+        def reflect(offset):
+            return [
+                self._column_type(dialect, f"character varying({length})").length
+                for length in range(offset, offset + 50)
+            ]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(reflect, range(1, 9)))
+        for offset, lengths in enumerate(results, 1):
+            assert lengths == list(range(offset, offset + 50))
+        assert len(dialect._type_memo) <= 3
+
+    def test_unrecognized_type_not_memoized(self):
+        dialect = RedshiftDialect_psycopg2()
+        with self.assertWarns(sa.exc.SAWarning):
+            self._column_type(dialect, "mystery")
+        with self.assertWarns(sa.exc.SAWarning):
+            self._column_type(dialect, "mystery")
+        assert "mystery" not in dialect._type_memo
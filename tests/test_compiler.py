@@ -1,4 +1,7 @@
-from sqlalchemy import func, select
+import pytest
+from sqlalchemy import Integer, String, bindparam, column, func, select, table, tuple_
+
+t = table("t", column("id", Integer), column("name", String))
 
 
 def test_func_now(stub_redshift_dialect):
@@ -6,3 +9,88 @@ def test_func_now(stub_redshift_dialect):
     s = select(func.NOW().label("time"))
     compiled = s.compile(dialect=dialect)
     assert str(compiled) == "SELECT SYSDATE AS time"
+
+
+def expand(compiled, **params):
+    return compiled._process_parameters_for_postcompile(
+        compiled.construct_params(params)
+    )
+
+
+@pytest.fixture
+def in_list_dialect(stub_redshift_dialect, monkeypatch):
+    monkeypatch.setattr(stub_redshift_dialect, "in_list_literal_threshold", 3)
+    return stub_redshift_dialect
+
+
+def test_in_list_under_threshold_is_bound(in_list_dialect):
+    compiled = (
+        select(t.c.id).where(t.c.id.in_([1, 2, 3])).compile(dialect=in_list_dialect)
+    )
+    expanded = expand(compiled)
+    assert "1, 2, 3" not in expanded.statement
+    assert sorted(expanded.parameters.values()) == [1, 2, 3]
+
+
+def test_in_list_over_threshold_is_literal(in_list_dialect):
+    compiled = (
+        select(t.c.id)
+        .where(t.c.id.in_(bindparam("ids", expanding=True)))
+        .compile(dialect=in_list_dialect)
+    )
+    expanded = expand(compiled, ids=[4, 1, 2, 4, 3])
+    assert expanded.statement.endswith("IN (4, 1, 2, 3)")
+    assert expanded.parameters == {}
+    # The same compiled statement still binds short lists.
+    expanded = expand(compiled, ids=[5, 6])
+    assert sorted(expanded.parameters.values()) == [5, 6]
+
+
+def test_in_list_literal_strings_are_escaped(in_list_dialect):
+    compiled = (
+        select(t.c.id)
+        .where(t.c.name.in_(["a", "b", "O'Brien", "100%"]))
+        .compile(dialect=in_list_dialect)
+    )
+    statement = expand(compiled).statement
+    assert "'O''Brien'" in statement
+    quoted_percent = (
+        "'100%%'"
+        if in_list_dialect.paramstyle
+        in (
+            "format",
+            "pyformat",
+        )
+        else "'100%'"
+    )
+    assert quoted_percent in statement
+
+
+def test_tuple_in_list_over_threshold_is_literal(in_list_dialect):
+    compiled = (
+        select(t.c.id)
+        .where(tuple_(t.c.id, t.c.name).in_([(1, "a"), (2, "b"), (3, "c"), (4, "d")]))
+        .compile(dialect=in_list_dialect)
+    )
+    expanded = expand(compiled)
+    assert "(1, 'a'), (2, 'b'), (3, 'c'), (4, 'd')" in expanded.statement
+    assert expanded.parameters == {}
+
+
+def test_untyped_in_list_is_bound(in_list_dialect):
+    untyped = table("u", column("id"))
+    compiled = (
+        select(untyped.c.id)
+        .where(untyped.c.id.in_(bindparam("ids", expanding=True)))
+        .compile(dialect=in_list_dialect)
+    )
+    assert len(expand(compiled, ids=[1, 2, 3, 4]).parameters) == 4
+
+
+def test_in_list_threshold_off_by_default(stub_redshift_dialect):
+    compiled = (
+        select(t.c.id)
+        .where(t.c.id.in_(range(10000)))
+        .compile(dialect=stub_redshift_dialect)
+    )
+    assert len(expand(compiled).parameters) == 10000
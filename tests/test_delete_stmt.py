@@ -265,3 +265,53 @@ def test_delete_stmt_with_comma_subquery_alias_join(stub_redshift_dialect):
         AND products_1.id != "ham, spam".ham_id"""
 
     assert clean(compile_query(del_stmt, stub_redshift_dialect)) == clean(expected)
+
+
+def test_delete_stmt_using_subquery(stub_redshift_dialect):
+    totals = (
+        sa.select(
+            orders.c.customer_id,
+            sa.func.sum(orders.c.total_invoiced).label("total"),
+        )
+        .group_by(orders.c.customer_id)
+        .subquery("totals")
+    )
+    del_stmt = sa.delete(customers).where(
+        customers.c.id == totals.c.customer_id, totals.c.total < 10
+    )
+    expected = """
+        DELETE FROM customers
+        USING (SELECT orders.customer_id AS customer_id,
+        sum(orders.total_invoiced) AS total
+        FROM orders GROUP BY orders.customer_id) AS totals
+        WHERE customers.id = totals.customer_id AND totals.total < 10"""
+    assert clean(compile_query(del_stmt, stub_redshift_dialect)) == clean(expected)
+
+
+def test_delete_stmt_using_nested_predicates(stub_redshift_dialect):
+    parent_ = sa.alias(product)
+    del_stmt = sa.delete(items).where(
+        sa.or_(
+            sa.not_(items.c.order_id == orders.c.id),
+            sa.func.coalesce(items.c.product_id, parent_.c.id) > 0,
+        )
+    )
+    expected = """
+        DELETE FROM items
+        USING orders, products AS products_1
+        WHERE items.order_id != orders.id
+        OR coalesce(items.product_id, products_1.id) > 0"""
+    assert clean(compile_query(del_stmt, stub_redshift_dialect)) == clean(expected)
+
+
+def test_delete_stmt_wide_predicate(stub_redshift_dialect):
+    keys = sa.or_(
+        *(
+            sa.and_(orders.c.customer_id == customers.c.id, customers.c.id == i)
+            for i in range(3000)
+        )
+    )
+    del_stmt = sa.delete(orders).where(keys)
+    compiled = clean(compile_query(del_stmt, stub_redshift_dialect))
+    assert compiled.startswith("DELETE FROM orders USING customers WHERE")
+    assert compiled.count("customers.id = 2999") == 1
@@ -0,0 +1,117 @@
+from collections import namedtuple
+import threading
+
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_redshift.dialect import (
+    RedshiftDialect_psycopg2,
+    RelationIndex,
+    RelationKey,
+    _catalog_cache,
+)
+from sqlalchemy_redshift.instrumentation import ReflectionStats
+
+Relation = namedtuple("Relation", ("relkind", "schema", "relname"))
+
+
+@pytest.fixture
+def dialect():
+    class InstrumentedDialect(RedshiftDialect_psycopg2):
+        @_catalog_cache
+        def _get_all_relation_info(
+            self, connection, schema=None, table_names=None, **kw
+        ):
+            result = self._execute_catalog_query(
+                connection,
+                "_get_all_relation_info",
+                sa.text("SELECT 'r' AS relkind, 'public' AS schema, 't1' AS relname"),
+            )
+            return RelationIndex(
+                (RelationKey(row.relname, row.schema), row) for row in result
+            )
+
+    dialect = InstrumentedDialect()
+    dialect.default_schema_name = "public"
+    return dialect
+
+
+@pytest.fixture
+def connection():
+    with sa.create_engine("sqlite://").connect() as connection:
+        yield connection
+
+
+def test_catalog_query_recorded(dialect, connection):
+    query = sa.text("SELECT 'ab' AS x, 1 AS y UNION ALL SELECT NULL, 22")
+    with dialect.collect_reflection_stats() as stats:
+        result = dialect._execute_catalog_query(connection, "probe", query)
+        assert [tuple(row) for row in result] == [("ab", 1), (None, 22)]
+
+    query_stats = stats.queries["probe"]
+    assert (query_stats.count, query_stats.rows, query_stats.bytes) == (1, 2, 5)
+    assert query_stats.time > 0
+    assert dialect.reflection_stats is None
+
+
+def test_catalog_query_not_recorded_outside_block(dialect, connection):
+    stats = ReflectionStats()
+    with dialect.collect_reflection_stats(stats):
+        pass
+    dialect._execute_catalog_query(connection, "probe", sa.text("SELECT 1"))
+    assert stats.queries == {}
+
+
+def test_cache_hits_and_misses(dialect, connection):
+    info_cache = {}
+    with dialect.collect_reflection_stats() as stats:
+        for _ in range(3):
+            names = dialect.get_table_names(connection, info_cache=info_cache)
+            assert names == ["t1"]
+
+    assert stats.queries["_get_all_relation_info"].count == 1
+    assert stats.cache == {
+        ("info_cache", "get_table_names"): [2, 1],
+        ("info_cache", "_get_all_relation_info"): [0, 1],
+    }
+    assert stats.hit_ratio("info_cache") == 0.5
+    assert stats.hit_ratio("reflection_cache") is None
+    report = stats.report()
+    assert "_get_all_relation_info" in report
+    assert "get_table_names" in report
+
+
+def test_overlapping_collections_on_threads(dialect):
+    engine = sa.create_engine("sqlite://")
+    a_started, b_started, a_done = (threading.Event() for _ in range(3))
+    collected = {}
+
+    def query(name):
+        with engine.connect() as connection:
+            dialect._execute_catalog_query(connection, name, sa.text("SELECT 1"))
+
+    def first():
+        with dialect.collect_reflection_stats() as stats:
+            a_started.set()
+            b_started.wait()
+            query("both")
+        collected["first"] = stats
+        a_done.set()
+
+    def second():
+        a_started.wait()
+        with dialect.collect_reflection_stats() as stats:
+            b_started.set()
+            a_done.wait()
+            query("second")
+        collected["second"] = stats
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(collected["first"].queries) == ["both"]
+    assert sorted(collected["second"].queries) == ["both", "second"]
+    assert dialect.reflection_stats is None
@@ -1,8 +1,12 @@
+from collections import namedtuple
+
 import pytest
 from rs_sqla_test_utils.utils import clean, compile_query
+import sqlalchemy as sa
 from sqlalchemy import Column, Integer, MetaData, String, Table, select
 
 from sqlalchemy_redshift import dialect
+from sqlalchemy_redshift.dialect import RedshiftDialect_psycopg2
 
 
 @pytest.fixture
@@ -108,3 +112,71 @@ def test_refresh_materialized_view(stub_redshift_dialect):
     expected_result = "REFRESH MATERIALIZED VIEW test_view"
     view = dialect.RefreshMaterializedView("test_view")
     assert clean(expected_result) == clean(compile_query(view, stub_redshift_dialect))
+
+
+MaterializedView = namedtuple(
+    "MaterializedView",
+    ("schema", "table_name", "is_stale", "state", "autorefresh", "autorewrite"),
+)
+
+
+def materialized_views():
+    return [
+        MaterializedView("public", "mv_fresh", "f", 1, "t", "t"),
+        MaterializedView("public", "mv_full", "t", 0, "f", "f"),
+        MaterializedView("public", "mv_broken", "t", 101, "f", "f"),
+    ]
+
+
+def test_materialized_view_info_one_query_per_schema(fake_connection):
+    dialect = RedshiftDialect_psycopg2()
+    dialect.default_schema_name = "public"
+    connection = fake_connection(materialized_views())
+    info_cache = {}
+
+    names = dialect.get_materialized_view_names(connection, info_cache=info_cache)
+    multi = dict(
+        dialect.get_multi_materialized_view_info(connection, info_cache=info_cache)
+    )
+
+    assert names == ["mv_fresh", "mv_full", "mv_broken"]
+    assert multi == {
+        (None, "mv_fresh"): {
+            "is_stale": False,
+            "state": 1,
+            "incremental": True,
+            "refreshable": True,
+            "autorefresh": True,
+            "autorewrite": True,
+        },
+        (None, "mv_full"): {
+            "is_stale": True,
+            "state": 0,
+            "incremental": False,
+            "refreshable": True,
+            "autorefresh": False,
+            "autorewrite": False,
+        },
+        (None, "mv_broken"): {
+            "is_stale": True,
+            "state": 101,
+            "incremental": False,
+            "refreshable": False,
+            "autorefresh": False,
+            "autorewrite": False,
+        },
+    }
+    assert len(connection.statements) == 1
+    sql, params = connection.statements[0]
+    assert "svv_mv_info" in sql
+    assert params == {"schema": "public"}
+
+
+def test_materialized_view_info_missing_view(fake_connection):
+    dialect = RedshiftDialect_psycopg2()
+    dialect.default_schema_name = "public"
+    connection = fake_connection(materialized_views())
+    info = dialect.get_materialized_view_info(connection, "mv_fresh", "public")
+    assert info["incremental"] is True
+    with pytest.raises(sa.exc.NoSuchTableError):
+        dialect.get_materialized_view_info(connection, "t1", "public")
@@ -0,0 +1,666 @@
+from collections import namedtuple
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import ObjectKind, ObjectScope
+
+from sqlalchemy_redshift.dialect import (
+    REFLECTION_SQL,
+    RedshiftDialect_psycopg2,
+    RedshiftInspector,
+    RelationIndex,
+    RelationKey,
+    _catalog_cache,
+    _catalog_cache_key,
+    _get_reflection_sql,
+)
+
+Relation = namedtuple(
+    "Relation",
+    ("relkind", "schema", "relname", "diststyle", "comment"),
+    defaults=("EVEN", None),
+)
+Column = namedtuple(
+    "Column",
+    (
+        "schema",
+        "table_name",
+        "name",
+        "format_type",
+        "default",
+        "notnull",
+        "encode",
+        "comment",
+        "distkey",
+        "sortkey",
+    ),
+    defaults=(False, 0),
+)
+Constraint = namedtuple(
+    "Constraint",
+    (
+        "schema",
+        "table_name",
+        "contype",
+        "conname",
+        "conkey",
+        "confkey",
+        "attnum",
+        "attname",
+        "referred_schema",
+        "referred_table",
+        "referred_attnum",
+        "referred_attname",
+    ),
+    defaults=(None, None, None, None),
+)
+Check = namedtuple("Check", ("schema", "table_name", "name", "src"))
+ExternalSchema = namedtuple("ExternalSchema", ("schemaname",))
+
+
+def _relations(*specs):
+    return {
+        RelationKey(name, schema): Relation(relkind, schema, name, "EVEN", *comment)
+        for schema, name, relkind, *comment in specs
+    }
+
+
+def _columns(*specs):
+    columns = {}
+    for schema, table_name, name, format_type in specs:
+        columns.setdefault(RelationKey(table_name, schema), []).append(
+            Column(schema, table_name, name, format_type, None, False, "none", None)
+        )
+    return columns
+
+
+@pytest.fixture
+def dialect(monkeypatch):
+    dialect = RedshiftDialect_psycopg2()
+    dialect.default_schema_name = "public"
+    calls = []
+
+    def fake_relation_info(connection, **kw):
+        calls.append(("relations", kw.get("schema"), kw.get("table_names")))
+        return _relations(
+            ("public", "t1", "r", "first table"),
+            ("public", "t2", "r"),
+            ("public", "v1", "v"),
+        )
+
+    def fake_column_info(connection, **kw):
+        calls.append(("columns", kw.get("schema"), kw.get("table_names")))
+        return _columns(
+            ("public", "t1", "id", "integer"),
+            ("public", "t1", "name", "character varying(30)"),
+            ("public", "t2", "id", "bigint"),
+            ("public", "v1", "id", "integer"),
+        )
+
+    def fake_constraint_info(connection, **kw):
+        calls.append(("constraints", kw.get("schema"), kw.get("table_names")))
+        constraints = {}
+        for con in (
+            Constraint("public", "t1", "p", "t1_pkey", [1], None, 1, "id"),
+            Constraint("public", "t1", "u", "t1_name_key", [2, 1], None, 1, "id"),
+            Constraint("public", "t1", "u", "t1_name_key", [2, 1], None, 2, "name"),
+            Constraint(
+                "public", "t2", "f", "t2_fk", [1], [1], 1, "id", "other", "t1", 1, "id"
+            ),
+        ):
+            constraints.setdefault(RelationKey(con.table_name, con.schema), []).append(
+                con
+            )
+        return constraints
+
+    def fake_check_constraint_info(connection, **kw):
+        calls.append(("checks", kw.get("schema"), kw.get("table_names")))
+        return {
+            RelationKey("t2", "public"): [
+                Check("public", "t2", "positive", "CHECK ((id > 0))"),
+                Check("public", "t2", "small", "CHECK ((id < 10)) NOT VALID"),
+            ]
+        }
+
+    monkeypatch.setattr(dialect, "_get_all_relation_info", fake_relation_info)
+    monkeypatch.setattr(
+        dialect, "_get_all_check_constraint_info", fake_check_constraint_info
+    )
+    monkeypatch.setattr(dialect, "_get_schema_column_info", fake_column_info)
+    monkeypatch.setattr(dialect, "_get_all_constraint_info", fake_constraint_info)
+    dialect.calls = calls
+    return dialect
+
+
+def test_multi_columns_single_schema_query(dialect):
+    result = dict(
+        dialect.get_multi_columns(
+            None, scope=ObjectScope.DEFAULT, kind=ObjectKind.TABLE
+        )
+    )
+    assert sorted(result) == [(None, "t1"), (None, "t2")]
+    assert [c["name"] for c in result[(None, "t1")]] == ["id", "name"]
+    assert [c["name"] for c in result[(None, "t2")]] == ["id"]
+    assert ("columns", "public", None) in dialect.calls
+    assert len([c for c in dialect.calls if c[0] == "columns"]) == 1
+
+
+def test_multi_columns_views(dialect):
+    result = dict(
+        dialect.get_multi_columns(
+            None, schema="public", scope=ObjectScope.DEFAULT, kind=ObjectKind.VIEW
+        )
+    )
+    assert list(result) == [("public", "v1")]
+
+
+def test_multi_columns_filter_names(dialect):
+    result = dict(
+        dialect.get_multi_columns(
+            None,
+            filter_names=["t2", "missing"],
+            scope=ObjectScope.ANY,
+            kind=ObjectKind.ANY,
+        )
+    )
+    assert list(result) == [(None, "t2")]
+    assert dialect.calls == [("columns", "public", ("missing", "t2"))]
+
+
+def test_multi_columns_temporary_scope(dialect):
+    result = dict(
+        dialect.get_multi_columns(
+            None, scope=ObjectScope.TEMPORARY, kind=ObjectKind.TABLE
+        )
+    )
+    assert result == {}
+
+
+def test_multi_table_options(dialect, monkeypatch):
+    def fake_column_info(connection, **kw):
+        dialect.calls.append(("columns", kw.get("schema"), kw.get("table_names")))
+        t1 = RelationKey("t1", "public")
+        t2 = RelationKey("t2", "public")
+        return {
+            t1: [
+                Column("public", "t1", "id", "integer", None, True, "az64", None, 0, 2),
+                Column("public", "t1", "k", "integer", None, True, "raw", None, 1, 1),
+            ],
+            t2: [
+                Column("public", "t2", "a", "integer", None, True, "raw", None, 0, 1),
+                Column("public", "t2", "b", "integer", None, True, "raw", None, 0, -2),
+            ],
+        }
+
+    monkeypatch.setattr(dialect, "_get_schema_column_info", fake_column_info)
+    result = dict(
+        dialect.get_multi_table_options(
+            None, scope=ObjectScope.DEFAULT, kind=ObjectKind.TABLE, info_cache={}
+        )
+    )
+    assert result == {
+        (None, "t1"): {
+            "redshift_diststyle": "EVEN",
+            "redshift_distkey": "k",
+            "redshift_sortkey": ("k", "id"),
+            "redshift_interleaved_sortkey": None,
+        },
+        (None, "t2"): {
+            "redshift_diststyle": "EVEN",
+            "redshift_distkey": None,
+            "redshift_sortkey": None,
+            "redshift_interleaved_sortkey": ("a", "b"),
+        },
+    }
+    assert [c for c in dialect.calls if c[0] == "columns"] == [
+        ("columns", "public", None)
+    ]
+
+
+def test_multi_table_comment_single_query(dialect):
+    result = dict(
+        dialect.get_multi_table_comment(
+            None, scope=ObjectScope.DEFAULT, kind=ObjectKind.ANY, info_cache={}
+        )
+    )
+    assert result == {
+        (None, "t1"): {"text": "first table"},
+        (None, "t2"): {"text": None},
+        (None, "v1"): {"text": None},
+    }
+    assert {c for c in dialect.calls if c[0] == "relations"} == {
+        ("relations", "public", None)
+    }
+
+
+def test_filter_table_names_include_unquoted():
+    names = RedshiftDialect_psycopg2._get_filter_table_names(['"group"', "other"])
+    assert names == ('"group"', "group", "other")
+
+
+def test_multi_constraints_single_scan(dialect):
+    info_cache = {}
+    kw = dict(scope=ObjectScope.DEFAULT, kind=ObjectKind.TABLE, info_cache=info_cache)
+    pks = dict(dialect.get_multi_pk_constraint(None, **kw))
+    fks = dict(dialect.get_multi_foreign_keys(None, **kw))
+    uniques = dict(dialect.get_multi_unique_constraints(None, **kw))
+
+    assert pks[(None, "t1")] == {"constrained_columns": ["id"], "name": "t1_pkey"}
+    assert pks[(None, "t2")] == {"constrained_columns": [], "name": ""}
+    assert fks[(None, "t1")] == []
+    assert fks[(None, "t2")] == [
+        {
+            "name": "t2_fk",
+            "constrained_columns": ["id"],
+            "referred_schema": "other",
+            "referred_table": "t1",
+            "referred_columns": ["id"],
+        }
+    ]
+    assert uniques[(None, "t1")] == [
+        {"name": "t1_name_key", "column_names": ["name", "id"]}
+    ]
+    assert uniques[(None, "t2")] == []
+    assert [c for c in dialect.calls if c[0] == "constraints"] == [
+        ("constraints", "public", None)
+    ]
+
+
+def test_parse_constraints_follows_key_order(dialect):
+    # One row per (constrained, referred) column pair, as the catalog join
+    # returns them for a composite foreign key; names are never quoted.
+    rows = [
+        Constraint("public", "t", "p", "t_pkey", [2, 1], None, 1, "Id"),
+        Constraint("public", "t", "p", "t_pkey", [2, 1], None, 2, "Region Id"),
+    ]
+    for attnum, attname in ((1, "Id"), (2, "Region Id")):
+        for referred_attnum, referred_attname in ((1, "key"), (3, "Region")):
+            rows.append(
+                Constraint(
+                    "public",
+                    "t",
+                    "f",
+                    "t_fk",
+                    [2, 1],
+                    [3, 1],
+                    attnum,
+                    attname,
+                    "public",
+                    "Parent Table",
+                    referred_attnum,
+                    referred_attname,
+                )
+            )
+
+    parsed = dialect._parse_constraints(rows)
+
+    assert parsed["pk_constraint"] == {
+        "constrained_columns": ["Region Id", "Id"],
+        "name": "t_pkey",
+    }
+    assert parsed["foreign_keys"] == [
+        {
+            "name": "t_fk",
+            "constrained_columns": ["Region Id", "Id"],
+            "referred_schema": None,
+            "referred_table": "Parent Table",
+            "referred_columns": ["Region", "key"],
+        }
+    ]
+    assert parsed["unique_constraints"] == []
+
+
+def test_multi_check_constraints(dialect):
+    result = dict(
+        dialect.get_multi_check_constraints(
+            None, scope=ObjectScope.DEFAULT, kind=ObjectKind.TABLE
+        )
+    )
+    assert result[(None, "t1")] == []
+    assert result[(None, "t2")] == [
+        {"name": "positive", "sqltext": "id > 0"},
+        {"name": "small", "sqltext": "id < 10", "dialect_options": {"not_valid": True}},
+    ]
+    assert [c for c in dialect.calls if c[0] == "checks"] == [
+        ("checks", "public", None)
+    ]
+
+
+@pytest.mark.parametrize(
+    "src, sqltext",
+    [
+        ("CHECK (((a > 1) AND (a < 5)))", "(a > 1) AND (a < 5)"),
+        (
+            "CHECK (((a = 1) OR ((a > 2) AND (a < 5))))",
+            "(a = 1) OR ((a > 2) AND (a < 5))",
+        ),
+        ("CHECK (some_boolean_function(a))", "some_boolean_function(a)"),
+        ("CHECK (((a\n < 1)\n OR\n (a\n >= 5))\n)", "(a\n < 1)\n OR\n (a\n >= 5)"),
+        ("NOT A CHECK", ""),
+    ],
+)
+def test_parse_check_constraint(src, sqltext):
+    entry = RedshiftDialect_psycopg2._parse_check_constraint("c", src)
+    assert entry == {"name": "c", "sqltext": sqltext}
+
+
+def _restrict(entries, table_names):
+    if table_names is None:
+        return entries
+    return {key: value for key, value in entries.items() if key.name in table_names}
+
+
+@pytest.fixture
+def prefetch_dialect():
+    calls = []
+
+    class PrefetchDialect(RedshiftDialect_psycopg2):
+        @_catalog_cache
+        def _get_all_relation_info(
+            self, connection, schema=None, table_names=None, **kw
+        ):
+            calls.append(("relations", schema, table_names))
+            relations = _relations(
+                ("public", "t1", "r"), ("public", "t2", "r"), ("public", "t3", "r")
+            )
+            return _restrict(relations, table_names)
+
+        @_catalog_cache
+        def _get_schema_column_info(
+            self, connection, schema=None, table_names=None, **kw
+        ):
+            calls.append(("columns", schema, table_names))
+            columns = _columns(
+                ("public", "t1", "id", "integer"),
+                ("public", "t2", "id", "integer"),
+                ("public", "t3", "id", "integer"),
+            )
+            return _restrict(columns, table_names)
+
+    dialect = PrefetchDialect()
+    dialect.default_schema_name = "public"
+    dialect.calls = calls
+    return dialect
+
+
+def test_per_table_reflection_without_prefetch(prefetch_dialect):
+    info_cache = {}
+    for name in ("t1", "t2", "t3"):
+        prefetch_dialect.get_columns(None, name, "public", info_cache=info_cache)
+    assert prefetch_dialect.calls == [
+        ("columns", "public", ("t1",)),
+        ("columns", "public", ("t2",)),
+        ("columns", "public", ("t3",)),
+    ]
+
+
+def test_prefetch_after_threshold(prefetch_dialect):
+    prefetch_dialect.reflection_prefetch_threshold = 2
+    info_cache = {}
+    for name in ("t1", "t2", "t3"):
+        cols = prefetch_dialect.get_columns(None, name, "public", info_cache=info_cache)
+        assert [c["name"] for c in cols] == ["id"]
+    assert prefetch_dialect.calls == [
+        ("columns", "public", ("t1",)),
+        ("columns", "public", None),
+    ]
+
+
+def test_default_schema_lookup_without_inspecting(prefetch_dialect, monkeypatch):
+    def fail(connection):
+        raise AssertionError("the connection should not be inspected")
+
+    monkeypatch.setattr("sqlalchemy_redshift.dialect.inspect", fail)
+    cols = prefetch_dialect.get_columns(None, "t2", info_cache={})
+    assert [c["name"] for c in cols] == ["id"]
+
+
+def test_relation_index_resolves_quoted_keys():
+    index = RelationIndex(
+        {
+            RelationKey("select", "public"): "unquoted",
+            RelationKey('"both"', "public"): "quoted",
+            RelationKey("both", "public"): "plain",
+        }
+    )
+    assert index.lookup(RelationKey('"select"', "public")) == "unquoted"
+    assert index.lookup(RelationKey("select", '"public"')) == "unquoted"
+    assert index.lookup(RelationKey('"select"', '"public"')) == "unquoted"
+    assert index.lookup(RelationKey('"both"', "public")) == "quoted"
+    assert index.lookup(RelationKey("both", "public")) == "plain"
+    assert index.lookup(RelationKey("missing", "public"), []) == []
+    assert len(index) == 3
+
+    index[RelationKey("added", "public")] = "added"
+    assert index.lookup(RelationKey('"added"', "public")) == "added"
+
+
+def test_prefetch_is_per_info_cache(prefetch_dialect):
+    prefetch_dialect.reflection_prefetch_threshold = 0
+    prefetch_dialect.get_columns(None, "t1", "public", info_cache={})
+    prefetch_dialect.get_columns(None, "t2", "public", info_cache={})
+    assert prefetch_dialect.calls == [
+        ("columns", "public", None),
+        ("columns", "public", None),
+    ]
+
+
+def test_schema_wide_relations_reused(prefetch_dialect):
+    info_cache = {}
+    names = prefetch_dialect.get_table_names(None, "public", info_cache=info_cache)
+    assert sorted(names) == ["t1", "t2", "t3"]
+    assert prefetch_dialect.has_table(None, "t2", "public", info_cache=info_cache)
+    assert not prefetch_dialect.has_table(
+        None, "missing", "public", info_cache=info_cache
+    )
+    assert prefetch_dialect.calls == [("relations", "public", None)]
+
+
+def test_prefetch_threshold_engine_option():
+    engine = sa.create_engine(
+        "redshift+psycopg2://example", reflection_prefetch_threshold=5
+    )
+    assert engine.dialect.reflection_prefetch_threshold == 5
+    engine = sa.create_engine("redshift+psycopg2://example")
+    assert engine.dialect.reflection_prefetch_threshold is None
+
+
+def test_has_tables_single_query(fake_connection):
+    dialect = RedshiftDialect_psycopg2()
+    dialect.default_schema_name = "public"
+    connection = fake_connection(
+        [Relation("r", "public", "t1"), Relation("r", "public", "group")]
+    )
+    existing = dialect.has_tables(connection, ["t1", "t2", '"group"'])
+    assert existing == {"t1", '"group"'}
+    ((sql, params),) = connection.statements
+    assert "pg_get_viewdef" not in sql
+    assert "relacl" not in sql
+    assert params == {
+        "schema": "public",
+        "table_names": ['"group"', "group", "t1", "t2"],
+    }
+
+
+def test_has_table_uses_existence_query(fake_connection):
+    dialect = RedshiftDialect_psycopg2()
+    dialect.default_schema_name = "public"
+    connection = fake_connection([Relation("r", "public", "t1")])
+    assert dialect.has_table(connection, "t1", "public")
+    connection.rows = []
+    assert not dialect.has_table(connection, "t2")
+    assert [params["table_names"] for _, params in connection.statements] == [
+        ["t1"],
+        ["t2"],
+    ]
+    assert dialect.has_tables(connection, []) == set()
+
+
+def test_reflection_sql_sources():
+    assert REFLECTION_SQL.count("UNION ALL") == 2
+    assert "UNION\n" not in REFLECTION_SQL
+    local = _get_reflection_sql(("local",))
+    assert "UNION" not in local
+    assert "pg_get_late_binding_view_cols" not in local
+    assert "svv_external_columns" not in local
+
+
+@pytest.mark.parametrize(
+    "external_schemas, has_views, sources",
+    [
+        (["public"], False, ("external",)),
+        ([], True, ("local", "late_binding_views")),
+        ([], False, ("local",)),
+    ],
+)
+def test_column_sources(fake_connection, external_schemas, has_views, sources):
+    dialect = RedshiftDialect_psycopg2()
+    connection = fake_connection(
+        [(1,)] if has_views else [],
+        routes={
+            "svv_external_schemas": [ExternalSchema(name) for name in external_schemas]
+        },
+    )
+    info_cache = {}
+    assert dialect._get_column_sources(connection, "public", info_cache=info_cache) == (
+        sources
+    )
+    dialect._get_column_sources(connection, "public", info_cache=info_cache)
+    dialect._get_column_sources(connection, "other", info_cache=info_cache)
+    assert sum("svv_external_schemas" in sql for sql, _ in connection.statements) == 1
+
+
+def test_column_sources_from_cached_relations(fake_connection):
+    dialect = RedshiftDialect_psycopg2()
+    key = _catalog_cache_key("_get_all_relation_info", "public", None)
+    info_cache = {key: _relations(("public", "t1", "r"), ("public", "v1", "v"))}
+    connection = fake_connection()
+    assert dialect._get_column_sources(connection, "public", info_cache=info_cache) == (
+        "local",
+        "late_binding_views",
+    )
+    assert len(connection.statements) == 1
+
+
+def test_compact_catalog_rows_intern_names():
+    engine = sa.create_engine("sqlite://")
+    with engine.connect() as connection:
+        result = connection.execute(sa.text("""
+            SELECT 'pub' || 'lic' AS "schema", 't' || n AS "table_name",
+                   'no' || 'te' AS "comment", n AS "attnum"
+            FROM (SELECT 1 AS n UNION ALL SELECT 1 UNION ALL SELECT 2)
+            """))
+        rows = list(RedshiftDialect_psycopg2()._compact_catalog_rows(result))
+
+    assert [tuple(row) for row in rows] == [
+        ("public", "t1", "note", 1),
+        ("public", "t1", "note", 1),
+        ("public", "t2", "note", 2),
+    ]
+    assert not isinstance(rows[0], sa.engine.Row)
+    assert rows[0]._fields == ("schema", "table_name", "comment", "attnum")
+    assert rows[0].schema is rows[2].schema
+    assert rows[0].table_name is rows[1].table_name
+    assert rows[0].comment is not rows[1].comment
+
+
+def test_stream_multi_columns_yields_tables_as_they_complete(fake_connection):
+    dialect = RedshiftDialect_psycopg2()
+    dialect.default_schema_name = "public"
+    rows = [
+        col
+        for cols in _columns(
+            ("public", "t1", "id", "integer"),
+            ("public", "t1", "name", "character varying(30)"),
+            ("public", "t2", "id", "bigint"),
+            ("sales", "t1", "id", "integer"),
+        ).values()
+        for col in cols
+    ]
+    connection = fake_connection(routes={"pg_attribute": rows})
+
+    streamed = []
+    for table_key, columns in dialect.stream_multi_columns(connection, chunk_size=2):
+        streamed.append((table_key, [c["name"] for c in columns], connection.consumed))
+
+    assert connection.statement_options[-1] == {"yield_per": 2}
+    assert connection.get_execution_options() == {}
+    assert "pg_get_late_binding_view_cols" in connection.statements[-1][0]
+    # Each table is yielded once the first row of the next one has been read.
+    assert streamed == [
+        (("public", "t1"), ["id", "name"], 3),
+        (("public", "t2"), ["id"], 4),
+        (("sales", "t1"), ["id"], 4),
+    ]
+
+
+def test_stream_multi_columns_for_schema(fake_connection):
+    dialect = RedshiftDialect_psycopg2()
+    dialect.default_schema_name = "public"
+    rows = _columns(("public", "t1", "id", "integer"))[RelationKey("t1", "public")]
+    connection = fake_connection(routes={"pg_attribute": rows})
+
+    streamed = list(dialect.stream_multi_columns(connection, "public", ["t1"]))
+
+    assert [(key, [c["name"] for c in cols]) for key, cols in streamed] == [
+        (("public", "t1"), ["id"])
+    ]
+    sql, _ = connection.statements[-1]
+    assert "AND schema = :schema" in sql
+    assert "AND table_name IN" in sql
+
+
+Stats = namedtuple(
+    "Stats",
+    (
+        "schema",
+        "table_name",
+        "size",
+        "tbl_rows",
+        "estimated_visible_rows",
+        "skew_rows",
+        "unsorted",
+        "stats_off",
+        "encoded",
+        "sortkey1",
+    ),
+)
+
+
+def test_redshift_inspector():
+    assert RedshiftDialect_psycopg2.inspector is RedshiftInspector
+
+
+def test_table_stats_one_query_per_schema(fake_connection):
+    dialect = RedshiftDialect_psycopg2()
+    dialect.default_schema_name = "public"
+    dialect.reflection_prefetch_threshold = 1
+    connection = fake_connection(
+        [
+            Stats("public", "t1", 12, 1000, 990, 1.5, 30.0, 12.0, "Y", "id"),
+            Stats("public", "t2", 4, 10, 10, None, None, 0.0, "N", None),
+        ]
+    )
+    info_cache = {}
+
+    t1 = dialect.get_table_stats(connection, "t1", info_cache=info_cache)
+    multi = dict(dialect.get_multi_table_stats(connection, info_cache=info_cache))
+    missing = dialect.get_table_stats(connection, "t3", info_cache=info_cache)
+
+    assert t1 == {
+        "size": 12,
+        "tbl_rows": 1000,
+        "estimated_visible_rows": 990,
+        "skew_rows": 1.5,
+        "unsorted": 30.0,
+        "stats_off": 12.0,
+        "encoded": True,
+        "sortkey1": "id",
+    }
+    assert multi[(None, "t1")] == t1
+    assert multi[(None, "t2")]["encoded"] is False
+    assert missing is None
+    assert len(connection.statements) == 1
+    sql, params = connection.statements[0]
+    assert "svv_table_info" in sql
+    assert params == {"schema": "public"}
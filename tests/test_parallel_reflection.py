@@ -0,0 +1,70 @@
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_redshift import reflection
+from sqlalchemy_redshift.reflection import reflect_schemas
+
+
+@pytest.fixture
+def engine(tmp_path):
+    main = tmp_path / "main.db"
+    other = tmp_path / "other.db"
+    engine = sa.create_engine(f"sqlite:///{main}")
+
+    @sa.event.listens_for(engine, "connect")
+    def attach(dbapi_connection, connection_record):
+        dbapi_connection.execute(f"ATTACH DATABASE '{other}' AS other")
+
+    with engine.begin() as conn:
+        conn.execute(sa.text("CREATE TABLE other.parent (id INTEGER PRIMARY KEY)"))
+        conn.execute(
+            sa.text(
+                "CREATE TABLE other.child ("
+                "id INTEGER PRIMARY KEY, "
+                "parent_id INTEGER REFERENCES parent (id))"
+            )
+        )
+        conn.execute(sa.text("CREATE TABLE extra (id INTEGER)"))
+    return engine
+
+
+def test_reflect_schemas_merges_into_one_metadata(engine):
+    metadata = reflect_schemas(engine, [None, "other"], max_workers=2)
+    assert sorted(metadata.tables) == ["extra", "other.child", "other.parent"]
+    child = metadata.tables["other.child"]
+    (fk,) = child.foreign_keys
+    assert fk.column is metadata.tables["other.parent"].c.id
+
+
+def test_reflect_schemas_keeps_existing_tables(engine):
+    metadata = sa.MetaData()
+    existing = sa.Table("parent", metadata, sa.Column("x", sa.Integer), schema="other")
+    reflect_schemas(engine, ["other"], metadata=metadata)
+    assert metadata.tables["other.parent"] is existing
+    assert "other.child" in metadata.tables
+
+
+@pytest.mark.parametrize(
+    "pool_size, max_overflow, expected",
+    [(1, 2, 3), (2, 0, 2), (1, -1, 5)],
+)
+def test_reflect_schemas_workers_capped_by_pool(
+    monkeypatch, pool_size, max_overflow, expected
+):
+    engine = sa.create_engine(
+        "sqlite://",
+        poolclass=sa.pool.QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+    )
+    workers = []
+
+    class Executor(reflection.ThreadPoolExecutor):
+        def __init__(self, max_workers):
+            workers.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(reflection, "ThreadPoolExecutor", Executor)
+    monkeypatch.setattr(sa.MetaData, "reflect", lambda *args, **kw: None)
+    reflect_schemas(engine, ["a", "b", "c", "d", "e"])
+    assert workers == [expected]
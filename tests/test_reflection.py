@@ -5,6 +5,8 @@ from sqlalchemy import MetaData, Table, inspect
 from sqlalchemy.exc import NoSuchTableError
 from sqlalchemy.schema import CreateTable
 
+from sqlalchemy_redshift.cache import ReflectionCache
+
 
 def table_to_ddl(table, _dialect):
     return str(CreateTable(table).compile(dialect=_dialect))
@@ -311,3 +313,63 @@ def test_external_table_reflection(redshift_engine, iam_role_arn):
         conn.execute(sa.text("DROP SCHEMA IF EXISTS bananas DROP EXTERNAL DATABASE"))
         if isinstance(redshift_engine.dialect, RedshiftDialect_psycopg2cffi):
             conn.execute(sa.text("COMMIT"))
+
+
+def test_get_multi_columns_matches_get_columns(redshift_session):
+    insp = inspect(redshift_session.bind)
+    multi = insp.get_multi_columns()
+    assert multi
+    for (schema, table_name), columns in multi.items():
+        single = insp.get_columns(table_name, schema=schema)
+        assert [(c["name"], str(c["type"])) for c in columns] == [
+            (c["name"], str(c["type"])) for c in single
+        ]
+
+
+def test_stream_multi_columns_matches_get_multi_columns(redshift_session):
+    insp = inspect(redshift_session.bind)
+    multi = insp.get_multi_columns()
+    with redshift_session.bind.connect() as conn:
+        streamed = dict(
+            redshift_session.bind.dialect.stream_multi_columns(
+                conn, schema=insp.default_schema_name, chunk_size=7
+            )
+        )
+    assert multi
+    for (_, name), columns in multi.items():
+        assert [(c["name"], str(c["type"])) for c in columns] == [
+            (c["name"], str(c["type"]))
+            for c in streamed[(insp.default_schema_name, name)]
+        ]
+
+
+def test_refresh_reflection_cache_detects_changes(redshift_engine):
+    redshift_engine.dialect.reflection_cache = ReflectionCache(ttl=60)
+    with redshift_engine.connect() as conn:
+        dialect = redshift_engine.dialect
+        assert dialect.refresh_reflection_cache(conn) is None
+        assert dialect.refresh_reflection_cache(conn) == set()
+        conn.execute(sa.text("CREATE TABLE refresh_probe (id INTEGER)"))
+        assert dialect.refresh_reflection_cache(conn) == {"refresh_probe"}
+        conn.execute(sa.text("ALTER TABLE refresh_probe ADD COLUMN name VARCHAR"))
+        assert dialect.refresh_reflection_cache(conn) == {"refresh_probe"}
+
+
+def test_refresh_reflection_cache_detects_same_length_changes(redshift_engine):
+    redshift_engine.dialect.reflection_cache = ReflectionCache(ttl=60)
+    with redshift_engine.connect() as conn:
+        dialect = redshift_engine.dialect
+        conn.execute(
+            sa.text(
+                "CREATE TABLE refresh_probe (created_at TIMESTAMP, name VARCHAR(10))"
+            )
+        )
+        conn.execute(sa.text("COMMENT ON TABLE refresh_probe IS 'first'"))
+        assert dialect.refresh_reflection_cache(conn) is None
+        for ddl in (
+            "ALTER TABLE refresh_probe RENAME COLUMN created_at TO updated_at",
+            "COMMENT ON TABLE refresh_probe IS 'other'",
+            "ALTER TABLE refresh_probe ALTER COLUMN name TYPE VARCHAR(20)",
+        ):
+            conn.execute(sa.text(ddl))
+            assert dialect.refresh_reflection_cache(conn) == {"refresh_probe"}
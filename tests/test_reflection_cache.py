@@ -0,0 +1,273 @@
+from collections import namedtuple
+from types import SimpleNamespace
+
+import pytest
+import sqlalchemy as sa
+
+from sqlalchemy_redshift.cache import ReflectionCache
+from sqlalchemy_redshift.dialect import (
+    RedshiftDialect_psycopg2,
+    RelationKey,
+    _catalog_cache,
+    _shared_catalog_cache,
+)
+
+Relation = namedtuple("Relation", ("relkind",))
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = Clock()
+    cache = ReflectionCache(ttl=10, clock=clock)
+    cache.set(("dev", "kind", "public", "t"), 1)
+    clock.now = 9
+    assert cache.get(("dev", "kind", "public", "t")) == 1
+    clock.now = 10
+    assert cache.get(("dev", "kind", "public", "t")) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ReflectionCache(ttl=10, max_entries=2)
+    cache.set(("dev", "kind", "public", "a"), 1)
+    cache.set(("dev", "kind", "public", "b"), 2)
+    cache.get(("dev", "kind", "public", "a"))
+    cache.set(("dev", "kind", "public", "c"), 3)
+    assert cache.get(("dev", "kind", "public", "a")) == 1
+    assert cache.get(("dev", "kind", "public", "b")) is None
+
+
+def test_invalidate():
+    cache = ReflectionCache(ttl=10)
+    prefix = ("dev", "kind", "public")
+    cache.set_relations(
+        prefix, None, {RelationKey("a", "public"): 1, RelationKey("b", "public"): 2}
+    )
+    cache.set(("dev", "kind", "other", "a"), 3)
+
+    cache.invalidate(schema="public", table="a")
+    assert cache.get_relations(prefix, None) == ({}, None)
+    assert cache.get_relations(prefix, ("b",)) == (
+        {RelationKey("b", "public"): 2},
+        (),
+    )
+
+    cache.invalidate(schema="public")
+    assert cache.get_relations(prefix, ("b",)) == ({}, ("b",))
+    assert cache.get(("dev", "kind", "other", "a")) == 3
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_invalidate_drops_fingerprints():
+    cache = ReflectionCache(ttl=10)
+    prefix = ("dev", "kind", "public")
+    relations = {RelationKey(name, "public"): name for name in ("a", "b")}
+    cache.refresh("dev", "public", {"a": 1, "b": 1})
+    cache.refresh("dev", "other", {"a": 1})
+
+    cache.set_relations(prefix, None, relations)
+    cache.invalidate(schema="public", table="a")
+    cache.set_relations(prefix, None, relations)
+    assert cache.refresh("dev", "public", {"a": 1, "b": 1}) == {"a"}
+    assert cache.get_relations(prefix, None) == (
+        {RelationKey("b", "public"): "b"},
+        ("a",),
+    )
+
+    cache.invalidate(schema="public")
+    cache.set_relations(prefix, None, relations)
+    assert cache.refresh("dev", "public", {"a": 1, "b": 1}) is None
+    assert cache.get_relations(prefix, None) == ({}, None)
+    assert cache.fingerprinted_schemas("dev") == ["other", "public"]
+
+
+def test_relations_served_from_schema_wide_entry():
+    cache = ReflectionCache(ttl=10)
+    prefix = ("dev", "kind", "public")
+    assert cache.get_relations(prefix, ("a",)) == ({}, ("a",))
+    cache.set_relations(prefix, None, {RelationKey("a", "public"): 1})
+    assert cache.get_relations(prefix, ("a", "missing")) == (
+        {RelationKey("a", "public"): 1},
+        (),
+    )
+    assert cache.get_relations(prefix, None) == ({RelationKey("a", "public"): 1}, ())
+
+
+def test_missing_relations_cached_as_absent():
+    cache = ReflectionCache(ttl=10)
+    prefix = ("dev", "kind", "public")
+    cache.set_relations(prefix, ("a", "missing"), {RelationKey("a", "public"): 1})
+    assert cache.get_relations(prefix, ("missing",)) == ({}, ())
+    assert cache.get_relations(prefix, None) == ({}, None)
+
+
+def test_refresh_drops_changed_relations_only():
+    clock = Clock()
+    cache = ReflectionCache(ttl=10, clock=clock)
+    prefix = ("dev", "kind", "public")
+    relations = {RelationKey(name, "public"): name for name in ("a", "b", "c")}
+
+    assert cache.refresh("dev", "public", {"a": 1, "b": 1, "c": 1}) is None
+    cache.set_relations(prefix, None, relations)
+
+    clock.now = 8
+    changed = cache.refresh("dev", "public", {"a": 1, "b": 2, "d": 1})
+    assert changed == {"b", "c", "d"}
+
+    clock.now = 15
+    cached, missing = cache.get_relations(prefix, None)
+    assert cached == {RelationKey("a", "public"): "a"}
+    assert missing == ("b", "d")
+
+
+def test_first_refresh_drops_unvalidated_entries():
+    cache = ReflectionCache(ttl=10)
+    prefix = ("dev", "kind", "public")
+    cache.set_relations(prefix, None, {RelationKey("a", "public"): 1})
+    cache.set_relations(("dev", "kind", "other"), None, {RelationKey("a", "other"): 1})
+    assert cache.refresh("dev", "public", {"a": 1}) is None
+    assert cache.get_relations(prefix, None) == ({}, None)
+    assert cache.get_relations(("dev", "kind", "other"), None)[1] == ()
+
+
+def _exists(dialect, connection, name, info_cache):
+    relations = dialect._get_all_relation_info(
+        connection, schema="public", table_names=(name,), info_cache=info_cache
+    )
+    return RelationKey(name, "public") in relations
+
+
+@pytest.fixture
+def connection():
+    return SimpleNamespace(engine=SimpleNamespace(url=sa.engine.make_url("r://h/dev")))
+
+
+@pytest.fixture
+def cached_dialect():
+    calls = []
+
+    class CachedDialect(RedshiftDialect_psycopg2):
+        @_catalog_cache
+        @_shared_catalog_cache
+        def _get_all_relation_info(
+            self, connection, schema=None, table_names=None, **kw
+        ):
+            calls.append((schema, table_names))
+            relations = {
+                RelationKey("t1", "public"): Relation("r"),
+                RelationKey("t2", "public"): Relation("r"),
+            }
+            if table_names is not None:
+                relations = {
+                    key: rel
+                    for key, rel in relations.items()
+                    if key.name in table_names
+                }
+            return relations
+
+    dialect = CachedDialect(reflection_cache_ttl=60)
+    dialect.default_schema_name = "public"
+    dialect.calls = calls
+    return dialect
+
+
+def test_cache_shared_across_inspectors(cached_dialect, connection):
+    for _ in range(3):
+        info_cache = {}
+        assert _exists(cached_dialect, connection, "t1", info_cache)
+        assert not _exists(cached_dialect, connection, "t3", info_cache)
+        assert sorted(
+            cached_dialect.get_table_names(connection, info_cache=info_cache)
+        ) == ["t1", "t2"]
+    assert cached_dialect.calls == [
+        ("public", ("t1",)),
+        ("public", ("t3",)),
+        ("public", None),
+    ]
+
+    cached_dialect.reflection_cache.invalidate(schema="public", table="t1")
+    _exists(cached_dialect, connection, "t1", {})
+    assert cached_dialect.calls[-1] == ("public", ("t1",))
+
+
+def test_refresh_refetches_changed_relations(cached_dialect, connection):
+    fingerprints = iter([{"t1": 1, "t2": 1}, {"t1": 1, "t2": 2}])
+    cached_dialect._get_catalog_fingerprint = lambda connection, schema: next(
+        fingerprints
+    )
+    assert cached_dialect.refresh_reflection_cache(connection) is None
+    cached_dialect.get_table_names(connection, info_cache={})
+    assert cached_dialect.refresh_reflection_cache(connection) == {"t2"}
+    names = cached_dialect.get_table_names(connection, info_cache={})
+    assert sorted(names) == ["t1", "t2"]
+    assert cached_dialect.calls == [("public", None), ("public", ("t2",))]
+
+
+def test_refresh_requires_cache():
+    dialect = RedshiftDialect_psycopg2()
+    with pytest.raises(sa.exc.InvalidRequestError):
+        dialect.refresh_reflection_cache(None, "public")
+
+
+def test_cache_disabled_by_default():
+    engine = sa.create_engine("redshift+psycopg2://example")
+    assert engine.dialect.reflection_cache is None
+    engine = sa.create_engine(
+        "redshift+psycopg2://example",
+        reflection_cache_ttl=30,
+        reflection_cache_size=100,
+    )
+    assert engine.dialect.reflection_cache.ttl == 30
+    assert engine.dialect.reflection_cache.max_entries == 100
+
+
+def test_snapshot_round_trip(cached_dialect, connection, tmp_path):
+    path = tmp_path / "snapshot.json.gz"
+    cached_dialect._get_catalog_fingerprint = lambda connection, schema: {
+        "t1": (1, "a"),
+        "t2": (1, "b"),
+    }
+    cached_dialect.get_table_names(connection, info_cache={})
+    _exists(cached_dialect, connection, "missing", {})
+    cached_dialect.save_reflection_snapshot(connection, path, ["public"])
+
+    warm = type(cached_dialect)(reflection_cache_ttl=60)
+    warm.default_schema_name = "public"
+    warm.calls = cached_dialect.calls
+    del warm.calls[:]
+    warm._get_catalog_fingerprint = lambda connection, schema: {
+        "t1": (1, "a"),
+        "t2": (2, "b"),
+    }
+    assert warm.load_reflection_snapshot(connection, path) == {"public": {"t2"}}
+
+    assert _exists(warm, connection, "t1", {})
+    assert not _exists(warm, connection, "missing", {})
+    assert sorted(warm.get_table_names(connection, info_cache={})) == ["t1", "t2"]
+    assert warm.calls == [("public", ("t2",))]
+
+
+def test_snapshot_for_other_database_is_rejected(connection, tmp_path):
+    path = tmp_path / "snapshot.json.gz"
+    cache = ReflectionCache(ttl=60)
+    cache.refresh("other", "public", {"t1": (1,)})
+    cache.set_relations(
+        ("other", "kind", "public"), None, {RelationKey("t1", "public"): Relation("r")}
+    )
+    cache.dump(path, "other")
+
+    assert ReflectionCache(ttl=60).load(path, "dev") == {}
+    loaded = ReflectionCache(ttl=60)
+    assert loaded.load(path, "other") == {"public": {"t1": (1,)}}
+    relations, missing = loaded.get_relations(("other", "kind", "public"), None)
+    assert missing == ()
+    assert relations[RelationKey("t1", "public")].relkind == "r"
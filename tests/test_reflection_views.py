@@ -1,8 +1,21 @@
+from collections import namedtuple
+
+import pytest
 from rs_sqla_test_utils.utils import clean, compile_query
 import sqlalchemy as sa
 from sqlalchemy import MetaData, Table, inspect
+from sqlalchemy.exc import NoSuchTableError
 from sqlalchemy.schema import CreateTable
 
+from sqlalchemy_redshift.dialect import (
+    RedshiftDialect_psycopg2,
+    RelationKey,
+    _catalog_cache_key,
+)
+
+Relation = namedtuple("Relation", ("relkind", "schema", "relname", "diststyle"))
+ViewDefinition = namedtuple("ViewDefinition", ("relname", "view_definition"))
+
 
 def table_to_ddl(engine, table):
     return str(CreateTable(table).compile(engine))
@@ -54,3 +67,74 @@ def test_late_binding_view_reflection(redshift_engine):
             conn.execute(sa.text("DROP TABLE IF EXISTS my_table CASCADE"))
             conn.execute(sa.text("DROP VIEW IF EXISTS my_late_view CASCADE"))
             conn.execute(sa.text("COMMIT"))
+
+
+@pytest.fixture
+def view_dialect(monkeypatch):
+    dialect = RedshiftDialect_psycopg2()
+    dialect.default_schema_name = "public"
+    relations = {
+        RelationKey(name, "public"): Relation(relkind, "public", name, "EVEN")
+        for name, relkind in (("t1", "r"), ("v1", "v"), ("v2", "v"))
+    }
+
+    def _get_all_relation_info(connection, table_names=None, **kw):
+        return {
+            key: relation
+            for key, relation in relations.items()
+            if table_names is None or key.name in table_names
+        }
+
+    monkeypatch.setattr(dialect, "_get_all_relation_info", _get_all_relation_info)
+    dialect.relations = relations
+    return dialect
+
+
+@pytest.fixture
+def view_connection(fake_connection):
+    return fake_connection(
+        routes={
+            "pg_get_viewdef": [
+                ViewDefinition("v1", "SELECT 1"),
+                ViewDefinition("v2", "SELECT 2"),
+            ]
+        }
+    )
+
+
+def test_view_definitions_fetched_in_one_batch(view_dialect, view_connection):
+    info_cache = {
+        _catalog_cache_key("_get_all_relation_info", "public", None): (
+            view_dialect.relations
+        )
+    }
+    for name, definition in (("v2", "SELECT 2"), ("v1", "SELECT 1")):
+        assert (
+            view_dialect.get_view_definition(
+                view_connection, name, "public", info_cache=info_cache
+            )
+            == definition
+        )
+    ((sql, params),) = view_connection.statements
+    assert params == {"schema": "public", "table_names": ["v1", "v2"]}
+
+
+def test_view_definitions_fetched_for_schema_without_listing(
+    view_dialect, view_connection
+):
+    info_cache = {}
+    for name, definition in (("v2", "SELECT 2"), ("v1", "SELECT 1")):
+        assert (
+            view_dialect.get_view_definition(
+                view_connection, name, info_cache=info_cache
+            )
+            == definition
+        )
+    ((sql, params),) = view_connection.statements
+    assert params == {"schema": "public"}
+
+
+def test_view_definition_missing_view(view_dialect, view_connection):
+    with pytest.raises(NoSuchTableError) as excinfo:
+        view_dialect.get_view_definition(view_connection, '"missing"', info_cache={})
+    assert excinfo.value.args == (RelationKey("missing", "public"),)
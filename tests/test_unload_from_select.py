@@ -341,3 +341,131 @@ def test_parquet_format__bad_options_crash(kwargs, stub_redshift_dialect):
 
     with pytest.raises(ValueError):
         compile_query(unload, stub_redshift_dialect)
+
+
+def test_template_matches_unload(stub_redshift_dialect):
+    """An UnloadTemplate renders the same UNLOAD as UnloadFromSelect."""
+    options = dict(
+        access_key_id=access_key_id,
+        secret_access_key=secret_access_key,
+        manifest=True,
+        delimiter=",",
+        max_file_size=10 * 1024**2,
+    )
+    template = dialect.UnloadTemplate(
+        sa.select(table.c.id).where(
+            table.c.name == sa.bindparam("name", type_=sa.Unicode),
+            table.c.id.in_(sa.bindparam("ids", expanding=True, type_=sa.Integer)),
+            table.c.id > 10,
+        ),
+        stub_redshift_dialect,
+        **options,
+    )
+    assert template.parameters == ("name", "ids")
+
+    for location, name, ids in [
+        ("s3://bucket/a", "O'Brien", [1, 2, 3]),
+        ("s3://bucket/b'", "b", (4,)),
+    ]:
+        unload = dialect.UnloadFromSelect(
+            sa.select(table.c.id).where(
+                table.c.name == name, table.c.id.in_(ids), table.c.id > 10
+            ),
+            location,
+            **options,
+        )
+        assert clean(template.render(location, name=name, ids=ids)) == clean(
+            compile_query(unload, stub_redshift_dialect)
+        )
+
+
+def test_template_renders_null(stub_redshift_dialect):
+    template = dialect.UnloadTemplate(
+        sa.select(table.c.id).where(table.c.name.is_not(sa.bindparam("name"))),
+        stub_redshift_dialect,
+        access_key_id=access_key_id,
+        secret_access_key=secret_access_key,
+    )
+    assert "IS NOT NULL" in template.render_select(name=None)
+
+
+@pytest.mark.parametrize(
+    "params, error",
+    [
+        ({}, sa.exc.ArgumentError),
+        ({"ids": []}, ValueError),
+        ({"ids": "1,2"}, TypeError),
+    ],
+)
+def test_template_bad_parameters(stub_redshift_dialect, params, error):
+    template = dialect.UnloadTemplate(
+        sa.select(table.c.id).where(
+            table.c.id.in_(sa.bindparam("ids", expanding=True))
+        ),
+        stub_redshift_dialect,
+        access_key_id=access_key_id,
+        secret_access_key=secret_access_key,
+    )
+    with pytest.raises(error):
+        template.render("s3://bucket/key", **params)
+
+
+def test_template_does_not_double_percents(stub_redshift_dialect):
+    """The rendered UNLOAD is sent without parameters, so ``%`` stays single."""
+    template = dialect.UnloadTemplate(
+        sa.select(table.c.id).where(
+            table.c.name.like("100%"),
+            table.c.name.like(sa.bindparam("pattern", type_=sa.Unicode)),
+            table.c.id % 2 == 0,
+        ),
+        stub_redshift_dialect,
+        access_key_id=access_key_id,
+        secret_access_key=secret_access_key,
+    )
+    expected_result = """
+        UNLOAD ('SELECT t1.id
+        FROM t1
+        WHERE t1.name LIKE ''100%'' AND t1.name LIKE ''a%b''
+        AND t1.id % 2 = 0')
+        TO 's3://bucket/x%y/'
+        CREDENTIALS '{creds}'
+    """.format(creds=creds)
+
+    rendered = template.render("s3://bucket/x%y/", pattern="a%b")
+    assert clean(rendered) == clean(expected_result)
+    assert "%%" not in rendered
+
+
+def test_template_escapes_backslashes(stub_redshift_dialect):
+    """The select is nested in a string literal, where a backslash escapes."""
+    template = dialect.UnloadTemplate(
+        sa.select(table.c.id).where(table.c.name.like(sa.literal_column(r"'x\_y'"))),
+        stub_redshift_dialect,
+        access_key_id=access_key_id,
+        secret_access_key=secret_access_key,
+    )
+    expected_result = r"""
+        UNLOAD ('SELECT t1.id
+        FROM t1
+        WHERE t1.name LIKE ''x\\_y''')
+        TO 's3://bucket/key'
+        CREDENTIALS '{creds}'
+    """.format(creds=creds)
+
+    assert clean(template.render("s3://bucket/key")) == clean(expected_result)
+
+
+def test_template_execute_leaves_connection_options(stub_redshift_dialect):
+    """execute() sends the statement without parameters, for that statement only."""
+    template = dialect.UnloadTemplate(
+        sa.select(sa.literal_column("'100%'").label("x")),
+        stub_redshift_dialect,
+        access_key_id=access_key_id,
+        secret_access_key=secret_access_key,
+    )
+    with sa.create_engine("sqlite://").connect() as connection:
+        options = connection.get_execution_options()
+        with pytest.raises(sa.exc.OperationalError) as excinfo:
+            template.execute(connection, "s3://bucket/key")
+        assert excinfo.value.statement.lstrip().startswith("UNLOAD")
+        assert connection.get_execution_options() == options